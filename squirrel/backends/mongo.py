@@ -6,16 +6,26 @@ except ImportError:
     from datetime import timezone
     UTC = timezone.utc
 
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Iterable
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from squirrel.backends import SearchTermType, _Backend
 from squirrel.errors import BackendError
 from squirrel.model import PV, EpicsData, Severity, Snapshot, Status
 from squirrel.type_hints import TagDef, TagSet
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 ENDPOINTS = {
@@ -26,15 +36,59 @@ ENDPOINTS = {
     "SNAPSHOTS": "/v1/snapshots",
 }
 
+# name -> member mappings, for decoding alarm states received from the backend
+_STATUSES = Status.__members__
+_SEVERITIES = Severity.__members__
+
+# Maximum number of tag group details fetched at once
+TAG_FETCH_WORKERS = 8
+
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp(timestamp: str) -> datetime:
+    """
+    Parse a UTC timestamp received from the backend.  Many entries of a
+    response share timestamps, so parsed values are cached.
+    """
+    return datetime.fromisoformat(timestamp).replace(tzinfo=UTC)
+
 
 class MongoBackend(_Backend):
     """An integration layer between the Client and a MongoDB instance"""
-
     def __init__(self, address: str):
         super().__init__()
         self.address = address
-        self._tag_cache = {}
-        self._last_tag_fetch = datetime.now() - timedelta(minutes=1)
+        # one session shared by all requests, so connections to the backend are
+        # reused.  The pool holds a connection for each concurrent tag fetch
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=TAG_FETCH_WORKERS)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        # (fetch time, tag definition, tag id -> tag group id)
+        self._tag_cache: Optional[tuple[datetime, TagDef, Dict[int, int]]] = None
+
+    def _request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        """
+        Send a request to an endpoint of the backend and log the exchange. All
+        HTTP traffic of this backend goes through here.
+
+        Parameters
+        ----------
+        method : str
+            HTTP method, e.g. "GET"
+        endpoint : str
+            Path of the endpoint, relative to the backend address
+        **kwargs
+            Passed through to the underlying request, e.g. params or json
+
+        Returns
+        -------
+        requests.Response
+        """
+        r = self._session.request(method, self.address + endpoint, **kwargs)
+        # formatting is left to logging, so it is skipped when debug logging is off
+        logger.debug("%s %s with response %s (%s)", r.request.method, r.url, r.status_code, r.reason)
+        return r
 
     def search(self, *search_terms: SearchTermType, meta_pvs=None):
         """
@@ -49,32 +103,71 @@ class MongoBackend(_Backend):
         entries = []
         for attr, op, target in search_terms:
             if attr == "entry_type":
+                # let the backend narrow the results where it can, every term
+                # is still checked below.  Entries are unpacked as they are
+                # filtered, so only the matches are kept
                 if target is Snapshot:
-                    entries = self.get_snapshots(meta_pvs=meta_pvs)
-                else:
-                    entries = self.get_all_pvs()
-        matching = []
-        for entry in entries:
-            conditions = []
-            for attr, op, target in search_terms:
-                if attr == "entry_type":
-                    conditions.append(isinstance(entry, target))
-                elif attr == "ancestor":
-                    pass
+                    title = self._server_filter(search_terms, ("title",))
+                    entries = self._iter_snapshots(title=title, meta_pvs=meta_pvs)
                 else:
-                    try:
-                        # check entry attribute by name
-                        value = getattr(entry, attr)
-                        conditions.append(self.compare(op, value, target))
-                    except AttributeError:
-                        conditions.append(False)
-            if all(conditions):
-                matching.append(entry)
-        return matching
+                    # the pvName filter may not match on readbacks, those
+                    # terms are only checked locally
+                    pv_name = self._server_filter(search_terms, ("setpoint",))
+                    params = {"pvName": pv_name} if pv_name else None
+                    entries = self._iter_pvs(params=params)
+        # ancestor terms do not apply to this backend
+        predicates = [
+            self._make_predicate(*term) for term in search_terms if term[0] != "ancestor"
+        ]
+        return [entry for entry in entries if all(pred(entry) for pred in predicates)]
+
+    def _make_predicate(self, attr: str, op: str, target) -> Callable[[Any], bool]:
+        """
+        Build a function returning whether an entry satisfies a single search
+        term, so the term is only interpreted once per search.
+        """
+        if attr == "entry_type":
+            return lambda entry: isinstance(entry, target)
+
+        compare = self.compare
+
+        def predicate(entry) -> bool:
+            try:
+                # check entry attribute by name
+                value = getattr(entry, attr)
+                return compare(op, value, target)
+            except AttributeError:
+                return False
+
+        return predicate
+
+    @staticmethod
+    def _server_filter(search_terms: Iterable[SearchTermType], attrs: Iterable[str]) -> str:
+        """
+        Return the target of the first "eq" term on one of ``attrs``, for use as
+        a server-side filter.  The backend matches these filters loosely, so its
+        results are a superset of the exact matches.
+
+        Parameters
+        ----------
+        search_terms : Iterable[SearchTermType]
+            Terms passed to search
+        attrs : Iterable[str]
+            Attributes the endpoint can filter on
+
+        Returns
+        -------
+        str
+            The filter string, or "" if no term can be pushed to the backend
+        """
+        for attr, op, target in search_terms:
+            if attr in attrs and op == "eq" and isinstance(target, str) and target:
+                return target
+        return ""
 
     def _invalidate_tag_cache(self) -> None:
         """Ensure that a call to get_tags will return the most recent data after a mutating action is performed"""
-        self._last_tag_fetch = datetime.min
+        self._tag_cache = None
 
     def get_tags(self) -> TagDef:
         """
@@ -89,24 +182,92 @@ class MongoBackend(_Backend):
         ------
         BackendError
         """
-        if datetime.now() - self._last_tag_fetch > timedelta(minutes=1):
+        return self._cached_tags()[1]
+
+    def _cached_tags(self) -> tuple[datetime, TagDef, Dict[int, int]]:
+        """
+        Return the cached tag data, refreshing it if it is missing or older than
+        one minute.
+
+        Returns
+        -------
+        tuple[datetime, TagDef, Dict[int, int]]
+            Fetch time, tag definition, and mapping of tag id to tag group id
+
+        Raises
+        ------
+        BackendError
+        """
+        cached = self._tag_cache
+        if cached is None or datetime.now() - cached[0] > timedelta(minutes=1):
             tag_def = {}
-            r = requests.get(self.address + ENDPOINTS["TAGS"])
-            logger.debug(f"{r.request.method} {r.url} with response {r.status_code} ({r.reason})")
+            r = self._request("GET", ENDPOINTS["TAGS"])
             if r.ok:
-                for dct in r.json()["payload"]:
-                    idx = dct['id']
-                    name = dct['name']
-                    r = requests.get(self.address + ENDPOINTS["TAGS"] + f"/{idx}")
-                    logger.debug(f"{r.request.method} {r.url} with response {r.status_code} ({r.reason})")
-                    if r.ok:
-                        dct = r.json()["payload"][0]
-                        description = dct.get("description", "")
-                        tags = {d["id"]: d["name"] for d in dct["tags"]}
-                        tag_def[idx] = [name, description, tags]
-            self._tag_cache = tag_def
-            self._last_tag_fetch = datetime.now()
-        return self._tag_cache
+                payload = self._payload(r)
+                # use tags embedded in the group listing when the backend sends
+                # them, only fetching the details of the remaining groups
+                group_defs = {
+                    dct['id']: self._unpack_tag_group(dct['name'], dct)
+                    for dct in payload if "tags" in dct
+                }
+                missing = [(dct['id'], dct['name']) for dct in payload if "tags" not in dct]
+                if missing:
+                    # group details are independent requests, fetch them concurrently
+                    with ThreadPoolExecutor(max_workers=TAG_FETCH_WORKERS) as executor:
+                        fetched = executor.map(lambda group: self._fetch_tag_group(*group), missing)
+                        group_defs.update(zip((idx for idx, _ in missing), fetched))
+                for dct in payload:
+                    group_def = group_defs.get(dct['id'])
+                    if group_def is not None:
+                        tag_def[dct['id']] = group_def
+            id_to_group = {
+                tag_id: group for group, group_def in tag_def.items() for tag_id in group_def[2]
+            }
+            cached = (datetime.now(), tag_def, id_to_group)
+            self._tag_cache = cached
+        return cached
+
+    def _fetch_tag_group(self, idx, name) -> Optional[list]:
+        """
+        Fetch the description and tags of a single tag group
+
+        Parameters
+        ----------
+        idx : str
+            ID of the tag group
+        name : str
+            Name of the tag group
+
+        Returns
+        -------
+        Optional[list]
+            [name, description, tags] for the group, or None if the request failed
+        """
+        r = self._request("GET", ENDPOINTS["TAGS"] + f"/{idx}")
+        if not r.ok:
+            return None
+        return self._unpack_tag_group(name, self._payload(r)[0])
+
+    @staticmethod
+    def _unpack_tag_group(name, group_dict) -> list:
+        """
+        Converts a tag group received from backend endpoints into a TagDef entry
+
+        Parameters
+        ----------
+        name : str
+            Name of the tag group
+        group_dict : dict
+            Encoded tag group, including its tags
+
+        Returns
+        -------
+        list
+            [name, description, tags] for the group
+        """
+        description = group_dict.get("description", "")
+        tags = {d["id"]: d["name"] for d in group_dict["tags"]}
+        return [name, description, tags]
 
     def add_tag_group(self, name, description) -> int:
         """
@@ -133,11 +294,10 @@ class MongoBackend(_Backend):
             "name": name,
             "description": description,
         }
-        r = requests.post(self.address + ENDPOINTS["TAGS"], json=body)
-        logger.debug(f"{r.request.method} {r.url} with response {r.status_code} ({r.reason})")
+        r = self._request("POST", ENDPOINTS["TAGS"], json=body)
         self._raise_for_status(r)
         self._invalidate_tag_cache()
-        return r.json()["payload"]["id"]
+        return self._payload(r)["id"]
 
     def update_tag_group(self, group_id, name="", description="") -> None:
         """
@@ -161,8 +321,7 @@ class MongoBackend(_Backend):
             body["name"] = name
         if description:
             body["description"] = description
-        r = requests.put(self.address + ENDPOINTS["TAGS"] + f"/{group_id}", json=body)
-        logger.debug(f"{r.request.method} {r.url} with response {r.status_code} ({r.reason})")
+        r = self._request("PUT", ENDPOINTS["TAGS"] + f"/{group_id}", json=body)
         self._raise_for_status(r)
         self._invalidate_tag_cache()
 
@@ -179,8 +338,7 @@ class MongoBackend(_Backend):
         ------
         BackendError
         """
-        r = requests.delete(self.address + ENDPOINTS["TAGS"] + f"/{group_id}", params={"force": True})
-        logger.debug(f"{r.request.method} {r.url} with response {r.status_code} ({r.reason})")
+        r = self._request("DELETE", ENDPOINTS["TAGS"] + f"/{group_id}", params={"force": True})
         self._raise_for_status(r)
         self._invalidate_tag_cache()
 
@@ -213,11 +371,10 @@ class MongoBackend(_Backend):
             "name": name,
             "description": description,
         }
-        r = requests.put(self.address + ENDPOINTS["TAGS"] + f"/{group_id}/tags", params=params, json=body)
-        logger.debug(f"{r.request.method} {r.url} with response {r.status_code} ({r.reason})")
+        r = self._request("PUT", ENDPOINTS["TAGS"] + f"/{group_id}/tags", params=params, json=body)
         self._raise_for_status(r)
         self._invalidate_tag_cache()
-        return next(tag["id"] for tag in r.json()["payload"]["tags"] if tag["name"] == name)
+        return next(tag["id"] for tag in self._payload(r)["tags"] if tag["name"] == name)
 
     def update_tag_in_group(self, group_id, tag_id, name="", description="") -> None:
         """
@@ -248,8 +405,7 @@ class MongoBackend(_Backend):
             body["name"] = name
         if description:
             body["description"] = description
-        r = requests.put(self.address + ENDPOINTS["TAGS"] + f"/{group_id}/tags/{tag_id}", params=params, json=body)
-        logger.debug(f"{r.request.method} {r.url} with response {r.status_code} ({r.reason})")
+        r = self._request("PUT", ENDPOINTS["TAGS"] + f"/{group_id}/tags/{tag_id}", params=params, json=body)
         self._raise_for_status(r)
         self._invalidate_tag_cache()
 
@@ -268,8 +424,7 @@ class MongoBackend(_Backend):
         ------
         BackendError
         """
-        r = requests.delete(self.address + ENDPOINTS["TAGS"] + f"/{group_id}/tags/{tag_id}")
-        logger.debug(f"{r.request.method} {r.url} with response {r.status_code} ({r.reason})")
+        r = self._request("DELETE", ENDPOINTS["TAGS"] + f"/{group_id}/tags/{tag_id}")
         self._raise_for_status(r)
         self._invalidate_tag_cache()
 
@@ -329,10 +484,9 @@ class MongoBackend(_Backend):
             "tags": self._pack_tags(tags) if tags else [],
             "readOnly": False,
         }
-        r = requests.post(self.address + ENDPOINTS["PVS"], json=body)
-        logger.debug(f"{r.request.method} {r.url} with response {r.status_code} ({r.reason})")
+        r = self._request("POST", ENDPOINTS["PVS"], json=body)
         self._raise_for_status(r)
-        pv_dict = r.json()["payload"]
+        pv_dict = self._payload(r)
         return self._unpack_pv(pv_dict)
 
     def add_multiple_pvs(self, pvs: Iterable[PV]) -> Iterable[PV]:
@@ -350,10 +504,9 @@ class MongoBackend(_Backend):
                     "tags": self._pack_tags(pv.tags),
                 }
             )
-        r = requests.post(self.address + ENDPOINTS["PVS_MULTI"], json=body)
-        logger.debug(f"{r.request.method} {r.url} with response {r.status_code} ({r.reason})")
+        r = self._request("POST", ENDPOINTS["PVS_MULTI"], json=body)
         self._raise_for_status(r)
-        pv_dicts = r.json()["payload"]
+        pv_dicts = self._payload(r)
         return [self._unpack_pv(pv_dict) for pv_dict in pv_dicts]
 
     def update_pv(self, pv_id, setpoint="", readback="", description="", device="", tags=None, abs_tolerance=None, rel_tolerance=None) -> None:
@@ -400,8 +553,7 @@ class MongoBackend(_Backend):
         if rel_tolerance is not None:
             body["relTolerance"] = rel_tolerance
         body["readOnly"] = False
-        r = requests.put(self.address + ENDPOINTS["PVS"] + f"/{pv_id}", json=body)
-        logger.debug(f"{r.request.method} {r.url} with response {r.status_code} ({r.reason})")
+        r = self._request("PUT", ENDPOINTS["PVS"] + f"/{pv_id}", json=body)
         self._raise_for_status(r)
 
     def archive_pv(self, pv_id) -> None:
@@ -419,8 +571,7 @@ class MongoBackend(_Backend):
         ------
         BackendError
         """
-        r = requests.delete(self.address + ENDPOINTS["PVS"] + f"/{pv_id}")
-        logger.debug(f"{r.request.method} {r.url} with response {r.status_code} ({r.reason})")
+        r = self._request("DELETE", ENDPOINTS["PVS"] + f"/{pv_id}")
         self._raise_for_status(r)
 
     def get_all_pvs(self) -> Iterable[PV]:
@@ -435,9 +586,25 @@ class MongoBackend(_Backend):
         ------
         BackendError
         """
-        r = requests.get(self.address + ENDPOINTS["PVS"])
+        return list(self._iter_pvs())
+
+    def _iter_pvs(self, params: Optional[dict] = None) -> Iterator[PV]:
+        """
+        Request PVs from the backend, returning an iterator that unpacks them
+        one at a time.  The request itself is made immediately.
+
+        Parameters
+        ----------
+        params : dict, optional
+            Query parameters for the PV endpoint
+
+        Raises
+        ------
+        BackendError
+        """
+        r = self._request("GET", ENDPOINTS["PVS"], params=params)
         self._raise_for_status(r)
-        return [self._unpack_pv(d) for d in r.json()["payload"]]
+        return map(self._unpack_pv, self._payload(r))
 
     def get_pvs(self, search_string="") -> Iterable[PV]:
         """
@@ -455,14 +622,7 @@ class MongoBackend(_Backend):
         ------
         BackendError
         """
-        r = requests.get(
-            self.address + ENDPOINTS["PVS"],
-            params={
-                "pvName": search_string,
-            }
-        )
-        self._raise_for_status(r)
-        return [self._unpack_pv(d) for d in r.json()["payload"]]
+        return list(self._iter_pvs(params={"pvName": search_string}))
 
     def get_paged_pvs(self, limit: int, token="", search_string="") -> tuple[Iterable[PV], str]:
         """
@@ -492,14 +652,16 @@ class MongoBackend(_Backend):
             params["continuationToken"] = token
         if search_string:
             params["pvName"] = search_string
-        r = requests.get(
-            self.address + ENDPOINTS["PVS_PAGED"],
+        r = self._request(
+            "GET",
+            ENDPOINTS["PVS_PAGED"],
             params=params,
         )
         self._raise_for_status(r)
+        payload = self._payload(r)
         return (
-            [self._unpack_pv(d) for d in r.json()["payload"]["results"]],
-            r.json()["payload"]["continuationToken"]
+            [self._unpack_pv(d) for d in payload["results"]],
+            payload["continuationToken"]
         )
 
     def add_snapshot(self, snapshot: Snapshot) -> None:
@@ -514,8 +676,9 @@ class MongoBackend(_Backend):
         ------
         BackendError
         """
-        r = requests.post(
-            self.address + ENDPOINTS["SNAPSHOTS"],
+        r = self._request(
+            "POST",
+            ENDPOINTS["SNAPSHOTS"],
             json=self._pack_snapshot(snapshot)
         )
         self._raise_for_status(r)
@@ -538,14 +701,27 @@ class MongoBackend(_Backend):
         Iterable[Snapshot]
             Snapshot instances that match the selected filters
 
+        Raises
+        ------
+        BackendError
+        """
+        return list(self._iter_snapshots(title=title, tags=tags, meta_pvs=meta_pvs))
+
+    def _iter_snapshots(self, title="", tags=None, meta_pvs=None) -> Iterator[Snapshot]:
+        """
+        Request snapshot metadata from the backend, returning an iterator that
+        unpacks the snapshots one at a time.  The request itself is made
+        immediately.  Parameters are the same as for ``get_snapshots``.
+
         Raises
         ------
         BackendError
         """
         tags = tags or {}
         meta_pvs = meta_pvs or []
-        r = requests.get(
-            self.address + ENDPOINTS["SNAPSHOTS"],
+        r = self._request(
+            "GET",
+            ENDPOINTS["SNAPSHOTS"],
             params={
                 "title": title,
                 "tags": tags,
@@ -553,7 +729,7 @@ class MongoBackend(_Backend):
             }
         )
         self._raise_for_status(r)
-        return [self._unpack_snapshot_metadata(snapshot_dict) for snapshot_dict in r.json()["payload"]]
+        return map(self._unpack_snapshot_metadata, self._payload(r))
 
     def get_snapshot(self, uuid) -> Snapshot:
         """
@@ -573,9 +749,9 @@ class MongoBackend(_Backend):
         ------
         BackendError
         """
-        r = requests.get(self.address + ENDPOINTS["SNAPSHOTS"] + f"/{uuid}")
+        r = self._request("GET", ENDPOINTS["SNAPSHOTS"] + f"/{uuid}")
         self._raise_for_status(r)
-        snapshot_dict = r.json()["payload"]
+        snapshot_dict = self._payload(r)
         return self._unpack_snapshot(snapshot_dict)
 
     def delete_snapshot(self, snapshot: Snapshot) -> None:
@@ -586,8 +762,9 @@ class MongoBackend(_Backend):
         ------
         BackendError
         """
-        r = requests.delete(
-            self.address + ENDPOINTS["SNAPSHOTS"] + f"/{snapshot.uuid}",
+        r = self._request(
+            "DELETE",
+            ENDPOINTS["SNAPSHOTS"] + f"/{snapshot.uuid}",
             params={
                 "deleteData": False,
             }
@@ -607,6 +784,16 @@ class MongoBackend(_Backend):
         backend at once."""
         raise NotImplementedError
 
+    @staticmethod
+    def _payload(response: requests.Response) -> Any:
+        """
+        Return the payload of a successful response from the backend, parsed
+        with orjson when it is installed
+        """
+        if orjson is not None:
+            return orjson.loads(response.content)["payload"]
+        return response.json()["payload"]
+
     @staticmethod
     def _raise_for_status(response):
         """Wraps response errors from the requests package in an app-specific
@@ -622,7 +809,8 @@ class MongoBackend(_Backend):
             response.raise_for_status()
         except requests.HTTPError as e:
             # server response can have "errorMessage" or "message" key depending on error
-            message = response.json().get("errorMessage", "") or response.json().get("message", e)
+            body = response.json()
+            message = body.get("errorMessage", "") or body.get("message", e)
             raise BackendError(message)
 
     def _unpack_tags(self, tag_list) -> TagSet:
@@ -641,17 +829,13 @@ class MongoBackend(_Backend):
         TagSet
             Tags for one PV formatted as a TagSet
         """
-        tag_def = self.get_tags()
-        id_to_group = {
-            tag_id: group for group, group_def in tag_def.items() for tag_id in group_def[2]
-        }
-        tag_set = {}
+        # refreshes the tag id lookup if the tag cache is stale
+        id_to_group = self._cached_tags()[2]
+        tag_set = defaultdict(set)
         for d in tag_list:
-            group = id_to_group[d["id"]]
-            if group not in tag_set:
-                tag_set[group] = set()
-            tag_set[group].add(d["id"])
-        return tag_set
+            tag_id = d["id"]
+            tag_set[id_to_group[tag_id]].add(tag_id)
+        return dict(tag_set)
 
     @staticmethod
     def _pack_tags(tags: TagSet) -> Iterable[int]:
@@ -668,7 +852,7 @@ class MongoBackend(_Backend):
         Iterable[int]
             All tags for one PV
         """
-        return [tag for group in tags.values() for tag in group]
+        return list(chain.from_iterable(tags.values()))
 
     def _unpack_pv(self, pv_dict) -> PV:
         """
@@ -694,7 +878,7 @@ class MongoBackend(_Backend):
             tags=self._unpack_tags(pv_dict["tags"]),
             abs_tolerance=pv_dict["absTolerance"],
             rel_tolerance=pv_dict["relTolerance"],
-            creation_time=datetime.fromisoformat(pv_dict["createdDate"]).replace(tzinfo=UTC),
+            creation_time=_parse_timestamp(pv_dict["createdDate"]),
         )
 
     @staticmethod
@@ -726,21 +910,21 @@ class MongoBackend(_Backend):
                     setpoint=pv.get("setpointAddress", ""),
                     setpoint_data=EpicsData(
                         data=pv.get("data", None),
-                        status=getattr(Status, pv["status"]),
-                        severity=getattr(Severity, pv["severity"]),
-                        timestamp=datetime.fromisoformat(pv["createdDate"]).replace(tzinfo=UTC),
+                        status=_STATUSES[pv["status"]],
+                        severity=_SEVERITIES[pv["severity"]],
+                        timestamp=_parse_timestamp(pv["createdDate"]),
                     ),
                     readback=pv.get("readbackAddress", ""),
                     readback_data=EpicsData(
                         data=pv.get("data", None),
-                        status=getattr(Status, pv["status"]),
-                        severity=getattr(Severity, pv["severity"]),
-                        timestamp=datetime.fromisoformat(pv["createdDate"]).replace(tzinfo=UTC),
+                        status=_STATUSES[pv["status"]],
+                        severity=_SEVERITIES[pv["severity"]],
+                        timestamp=_parse_timestamp(pv["createdDate"]),
                     ),
-                    creation_time=datetime.fromisoformat(pv["createdDate"]).replace(tzinfo=UTC),
+                    creation_time=_parse_timestamp(pv["createdDate"]),
                 ) for pv in metadata_dict["metadataPVs"]
             ],
-            creation_time=datetime.fromisoformat(metadata_dict["createdDate"]).replace(tzinfo=UTC),
+            creation_time=_parse_timestamp(metadata_dict["createdDate"]),
         )
 
     def _unpack_snapshot(self, snapshot_dict) -> Snapshot:
@@ -776,9 +960,9 @@ class MongoBackend(_Backend):
         for value_dict in snapshot_dict["data"]:
             data = EpicsData(
                 data=value_dict.get("data", None),
-                status=getattr(Status, value_dict["status"]),
-                severity=getattr(Severity, value_dict["severity"]),
-                timestamp=datetime.fromisoformat(value_dict["createdDate"]).replace(tzinfo=UTC),
+                status=_STATUSES[value_dict["status"]],
+                severity=_SEVERITIES[value_dict["severity"]],
+                timestamp=_parse_timestamp(value_dict["createdDate"]),
             )
             address = value_dict["pvName"]
             try:
@@ -798,7 +982,7 @@ class MongoBackend(_Backend):
             description=snapshot_dict["description"],
             # tags=snapshot_dict["tags"],
             pvs=pvs,
-            creation_time=datetime.fromisoformat(snapshot_dict["createdDate"]).replace(tzinfo=UTC),
+            creation_time=_parse_timestamp(snapshot_dict["createdDate"]),
         )
 
     @staticmethod
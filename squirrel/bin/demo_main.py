@@ -5,19 +5,19 @@ database pre-loaded
 Function components are separated from the arg parser to defer heavy imports
 """
 import configparser
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Iterable, Union
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Union
 
-import squirrel.tests.conftest_data
-from squirrel.backends import _Backend
 from squirrel.bin.demo_parser import DEMO_CONFIG
-from squirrel.bin.ui_parser import main as ui_main
-from squirrel.client import Client
-from squirrel.tests.ioc import IOCFactory
 from squirrel.utils import build_abs_path
 
+if TYPE_CHECKING:
+    from squirrel.backends import _Backend
 
-def populate_backend(backend: _Backend, sources: Iterable[Union[Callable, str]]) -> None:
+
+def populate_backend(backend: "_Backend", sources: Iterable[Union[Callable, str]]) -> None:
     """
     Utility for quickly filling test backends with data. Supports a mix of many
     types of sources:
@@ -27,19 +27,41 @@ def populate_backend(backend: _Backend, sources: Iterable[Union[Callable, str]])
     * strings that search for test data callables, but critically not fixtures
     """
     for source in sources:
-        if isinstance(source, Callable):
-            data = source()
-        elif isinstance(source, str):
-            func = getattr(squirrel.tests.conftest_data, source, False)
-            data = func()
-        else:
-            raise ValueError(f"Unsupported source type: {type(source)}")
-        backend.save_entry(data)
+        backend.save_entry(_resolve_source(source))
+
+
+def _resolve_source(source: Union[Callable, str]) -> Any:
+    """Build the data for one ``populate_backend`` source"""
+    import squirrel.tests.conftest_data
+
+    if callable(source):
+        return source()
+    elif isinstance(source, str):
+        func = getattr(squirrel.tests.conftest_data, source, False)
+        return func()
+    else:
+        raise ValueError(f"Unsupported source type: {type(source)}")
+
+
+@lru_cache(maxsize=8)
+def _load_config(path: Path, mtime: float) -> dict[str, dict[str, str]]:
+    """
+    Read and parse the config file at ``path`` into raw section data.  Cached
+    by modification time, so an edited file is read again.
+    """
+    parser = configparser.ConfigParser()
+    parser.read(path)
+    return {section: dict(parser.items(section, raw=True)) for section in parser.sections()}
 
 
 def main(*args, db_path=None, **kwargs):
+    from squirrel.bin.ui_parser import main as ui_main
+    from squirrel.client import Client
+    from squirrel.tests.ioc import IOCFactory
+
+    # a fresh parser each time, callers may modify it
     parser = configparser.ConfigParser()
-    parser.read(DEMO_CONFIG)
+    parser.read_dict(_load_config(DEMO_CONFIG, os.path.getmtime(DEMO_CONFIG)))
     if db_path is not None:
         db_path = Path(db_path)
         parser.set('backend', 'path', build_abs_path(Path.cwd(), db_path))
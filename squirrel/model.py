@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import logging
+import sys
+import uuid
+from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
@@ -13,6 +16,38 @@ from squirrel.utils import utcnow
 
 logger = logging.getLogger(__name__)
 
+# dataclass(slots=...) is only available from Python 3.10
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+# Attribute values that can be shared between an instance and its copy
+_IMMUTABLE_TYPES = (str, int, float, bool, type(None), datetime, uuid.UUID, Enum)
+
+
+def _deepcopy_instance(obj, memo: dict):
+    """
+    Copy ``obj`` attribute by attribute, sharing immutable values with the copy
+    and deep-copying everything else.  Skips the generic ``__reduce_ex__``
+    round trip that ``deepcopy`` otherwise makes for each dataclass.
+    """
+    cls = type(obj)
+    new = object.__new__(cls)
+    memo[id(obj)] = new
+    slots = cls.__dict__.get("__slots__")
+    if slots is None:
+        new.__dict__.update(
+            (key, value if isinstance(value, _IMMUTABLE_TYPES) else deepcopy(value, memo))
+            for key, value in obj.__dict__.items()
+        )
+    else:
+        for key in slots:
+            value = getattr(obj, key)
+            object.__setattr__(
+                new, key,
+                value if isinstance(value, _IMMUTABLE_TYPES) else deepcopy(value, memo),
+            )
+    return new
+
 
 class Severity(Enum):
     NO_ALARM = 0
@@ -46,7 +81,7 @@ class Status(Enum):
     WRITE_ACCESS = auto()
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class EpicsData:
     """Unified EPICS data type for holding data and relevant metadata"""
     data: Optional[AnyEpicsType] = None
@@ -65,6 +100,9 @@ class EpicsData:
     upper_warning_limit: Optional[float] = None  # HIGH
     enums: Optional[list[str]] = None
 
+    def __deepcopy__(self, memo: dict) -> EpicsData:
+        return _deepcopy_instance(self, memo)
+
 
 @dataclass
 class PV:
@@ -87,10 +125,21 @@ class PV:
     def __post_init__(self) -> None:
         if not isinstance(self.uuid, UUID):
             self.uuid = UUID(self.uuid)
+        # PV names are used as lookup keys throughout, intern them so that
+        # names loaded separately share a single string object
+        if type(self.setpoint) is str:
+            self.setpoint = sys.intern(self.setpoint)
+        if type(self.readback) is str:
+            self.readback = sys.intern(self.readback)
+        if type(self.config) is str:
+            self.config = sys.intern(self.config)
         return
 
+    def __deepcopy__(self, memo: dict) -> PV:
+        return _deepcopy_instance(self, memo)
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Snapshot:
     """"""
     uuid: UUID = ""
@@ -100,3 +149,6 @@ class Snapshot:
     # tags: TagSet = field(default_factory=dict)
     creation_time: datetime = field(default_factory=utcnow)
     meta_pvs: List[PV] = field(default_factory=list)
+
+    def __deepcopy__(self, memo: dict) -> Snapshot:
+        return _deepcopy_instance(self, memo)
@@ -15,6 +15,13 @@ class Page(QtWidgets.QWidget):
         self.pv_table_models: dict[UUID: PVTableModel] = {}
 
     def closeEvent(self, a0: QCloseEvent) -> None:
+        # stop every model's threads first, so the waits in close() overlap
+        # rather than adding up
+        for model in self.pv_table_models.values():
+            try:
+                model.stop_threads()
+            except AttributeError:
+                pass
         for model in self.pv_table_models.values():
             try:
                 model.close()
@@ -1,13 +1,15 @@
 import logging
-from typing import Any, Dict, List
+import os
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
-import qtawesome as qta
 from qtpy import QtCore, QtGui, QtWidgets
 
 from squirrel.client import Client
 from squirrel.model import PV
 from squirrel.pages import Page
 from squirrel.permission_manager import PermissionManager
+from squirrel.qt_helpers import BackgroundCall, cached_icon
 from squirrel.tables import (PV_BROWSER_HEADER, CSVTableModel,
                              PVBrowserFilterProxyModel, PVBrowserTableModel)
 from squirrel.utils import parse_csv_to_dict
@@ -17,6 +19,24 @@ from squirrel.widgets.tag import TagDelegate, TagsWidget
 logger = logging.getLogger(__file__)
 
 
+@lru_cache(maxsize=8)
+def _parse_csv_cached(path: str, mtime: float, size: int) -> tuple[Dict[str, Any], ...]:
+    """
+    Parse the CSV file at path.  mtime and size are only part of the cache key,
+    so that re-opening an unchanged file skips the parse.  The cached rows are
+    shared, hand out copies with ``_copy_csv_rows``.
+    """
+    return tuple(parse_csv_to_dict(path))
+
+
+def _copy_csv_rows(rows: tuple[Dict[str, Any], ...]) -> List[Dict[str, Any]]:
+    """Copy parsed CSV rows, so edits to them leave the cached parse intact"""
+    return [
+        {**row, 'groups': {name: list(values) for name, values in row['groups'].items()}}
+        for row in rows
+    ]
+
+
 class PVBrowserPage(Page):
 
     sigOpenPVDetails = QtCore.Signal(QtCore.QModelIndex, QtWidgets.QAbstractItemView)
@@ -38,12 +58,12 @@ class PVBrowserPage(Page):
         self.search_bar = QtWidgets.QLineEdit(self)
         self.search_bar.setClearButtonEnabled(True)
         self.search_bar.addAction(
-            qta.icon("fa5s.search"),
+            cached_icon("fa5s.search"),
             QtWidgets.QLineEdit.LeadingPosition,
         )
 
         self.add_pv_button = QtWidgets.QPushButton()
-        self.add_pv_button.setIcon(qta.icon("ph.plus"))
+        self.add_pv_button.setIcon(cached_icon("ph.plus"))
         self.add_pv_button.setIconSize(QtCore.QSize(16, 16))
         self.add_pv_button.setText("Add PV")
         self.add_pv_button.setObjectName("add-pv-btn")
@@ -64,7 +84,8 @@ class PVBrowserPage(Page):
 
         pv_browser_layout.addLayout(search_bar_lyt)
 
-        filter_tags = TagsWidget(tag_groups=self.client.backend.get_tags(), enabled=True)
+        tag_groups = self.client.backend.get_tags()
+        filter_tags = TagsWidget(tag_groups=tag_groups, enabled=True)
         pv_browser_layout.addWidget(filter_tags)
 
         pv_browser_model = PVBrowserTableModel(self.client)
@@ -75,15 +96,29 @@ class PVBrowserPage(Page):
         self.pv_browser_table.setModel(self.pv_browser_filter)
         self.pv_browser_table.setItemDelegateForColumn(
             PV_BROWSER_HEADER.TAGS.value,
-            TagDelegate(self.client.backend.get_tags())
+            TagDelegate(tag_groups)
         )
         header_view = self.pv_browser_table.horizontalHeader()
         header_view.setSectionResizeMode(header_view.ResizeMode.Fixed)
         header_view.setSectionResizeMode(PV_BROWSER_HEADER.TAGS.value, header_view.ResizeMode.Stretch)
-        header_view.sectionResized.connect(self.pv_browser_table.resizeRowsToContents)
+        # size columns from a sample of rows rather than measuring every PV.
+        # Column width sampling is bounded by the vertical header's precision
+        self.pv_browser_table.verticalHeader().setResizeContentsPrecision(100)
+        # resizing a column emits sectionResized for every pixel dragged, so
+        # recompute row heights at most every 33 ms
+        self._row_resize_timer = QtCore.QTimer(self)
+        self._row_resize_timer.setSingleShot(True)
+        self._row_resize_timer.setInterval(33)
+        self._row_resize_timer.timeout.connect(self.pv_browser_table.resizeRowsToContents)
+        header_view.sectionResized.connect(self.schedule_row_resize)
         pv_browser_layout.addWidget(self.pv_browser_table)
 
-        self.search_bar.textEdited.connect(self.search_bar_middle_man)
+        # coalesce bursts of typing into a single filter pass
+        self._search_timer = QtCore.QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self.search_bar_middle_man)
+        self.search_bar.textEdited.connect(lambda _: self._search_timer.start())
         filter_tags.tagSetChanged.connect(self.pv_browser_filter.set_tag_set)
         self.pv_browser_table.doubleClicked.connect(self.open_details_middle_man)
 
@@ -127,6 +162,11 @@ class PVBrowserPage(Page):
             """
         )
 
+    @QtCore.Slot()
+    def schedule_row_resize(self):
+        if not self._row_resize_timer.isActive():
+            self._row_resize_timer.start()
+
     @QtCore.Slot(QtCore.QModelIndex)
     def maybe_delete_row(self, index):
         if index.column() == PV_BROWSER_HEADER.DELETE.value:
@@ -141,10 +181,41 @@ class PVBrowserPage(Page):
             "CSV Files (*.csv);;All Files (*)"
         )
 
-        if file_path:
-            self.csv_file_path = file_path
-            self.csv_data = parse_csv_to_dict(self.csv_file_path)
-            self.show_table()
+        if not file_path:
+            return
+
+        self.csv_file_path = file_path
+        try:
+            stat = os.stat(file_path)
+        except OSError as e:
+            # removed or made unreadable after it was picked
+            logger.exception(e)
+            self._on_csv_parse_failed(str(e))
+            return
+        # large files take a while to parse, keep the GUI responsive meanwhile
+        self.import_pvs.setEnabled(False)
+        self.setCursor(QtCore.Qt.BusyCursor)
+        self._parse_thread = BackgroundCall(
+            _parse_csv_cached, file_path, stat.st_mtime, stat.st_size, parent=self
+        )
+        self._parse_thread.succeeded.connect(self._on_csv_parsed)
+        self._parse_thread.failed.connect(self._on_csv_parse_failed)
+        self._parse_thread.finished.connect(self._on_csv_parse_finished)
+        self._parse_thread.start()
+
+    @QtCore.Slot(object)
+    def _on_csv_parsed(self, rows: tuple[Dict[str, Any], ...]) -> None:
+        self.csv_data = _copy_csv_rows(rows)
+        self.show_table()
+
+    @QtCore.Slot(str)
+    def _on_csv_parse_failed(self, message: str) -> None:
+        QtWidgets.QMessageBox.critical(self, "Import Error", f"Failed to read CSV file: {message}")
+
+    @QtCore.Slot()
+    def _on_csv_parse_finished(self) -> None:
+        self.import_pvs.setEnabled(True)
+        self.unsetCursor()
 
     def show_table(self) -> None:
         """Show the parsed cvs data in a table dialog"""
@@ -176,6 +247,7 @@ class CSVTableDialog(QtWidgets.QDialog):
         super().__init__(parent)
         self.csv_data = csv_data
         self.parent_page = parent
+        self._tag_lookup = (None, [])
         self.init_ui()
 
     def init_ui(self):
@@ -206,15 +278,17 @@ class CSVTableDialog(QtWidgets.QDialog):
 
         self.table_view.setAlternatingRowColors(True)
         self.table_view.horizontalHeader().setStretchLastSection(True)
+        # size columns from a sample of rows rather than measuring the whole file
+        self.table_view.verticalHeader().setResizeContentsPrecision(100)
         self.table_view.resizeColumnsToContents()
 
         layout.addWidget(self.table_view)
 
         button_layout = QtWidgets.QHBoxLayout()
 
-        import_all_btn = QtWidgets.QPushButton("Import Data")
-        import_all_btn.clicked.connect(self.import_data)
-        button_layout.addWidget(import_all_btn)
+        self.import_all_btn = QtWidgets.QPushButton("Import Data")
+        self.import_all_btn.clicked.connect(self.import_data)
+        button_layout.addWidget(self.import_all_btn)
 
         cancel_btn = QtWidgets.QPushButton("Cancel")
         cancel_btn.clicked.connect(self.reject)
@@ -223,64 +297,100 @@ class CSVTableDialog(QtWidgets.QDialog):
         layout.addLayout(button_layout)
 
     def import_data(self) -> None:
-        """Import all data into backend"""
+        """
+        Import all data into backend.  The bulk backend request runs in a
+        background thread, and the results are shown once it completes.
+        """
         if not self.csv_data:
             QtWidgets.QMessageBox.warning(self, "Warning", "No data to import.")
             return
 
-        try:
-            success_count, error_count, errors = self._import_rows(self.csv_data)
-            self._show_import_results(success_count, error_count, errors, len(self.csv_data))
-
-            if success_count > 0:
-                self.accept()
-        except Exception as e:
-            QtWidgets.QMessageBox.critical(self, "Import Error", f"Failed to import all data: {str(e)}")
-            print(f"Import failed: {e}")
-
-    def _import_rows(self, rows_to_import: List[Dict[str, Any]]) -> tuple:
-        """
-        Import rows into the backend.
-        Returns: (success_count, error_count, error_list)
-        """
-        parameters = []
-
-        for row_data in rows_to_import:
-            parameter = self._create_parameter_from_row(row_data)
-            parameters.append(parameter)
+        parameters, errors = self._create_parameters(self.csv_data)
 
         parent = getattr(self, "parent_page", None)
         client = getattr(parent, "client", None)
         backend = getattr(client, "backend", None)
         if backend is None:
-            return 0, len(rows_to_import), ["No client connection available"]
+            self._show_import_results(
+                0, len(self.csv_data), ["No client connection available"], len(self.csv_data)
+            )
+            return
+        if not parameters:
+            self._show_import_results(0, len(errors), errors, len(self.csv_data))
+            return
 
-        pvs_from_backend = []
-        try:
-            pvs_from_backend = backend.add_multiple_pvs(parameters)
-        except Exception as e:
-            print(f"Failed to import rows: {str(e)}")
-            return 0, len(rows_to_import), [str(e)]
+        self._import_errors = errors
+        self.import_all_btn.setEnabled(False)
+        self.setCursor(QtCore.Qt.BusyCursor)
+        self._import_thread = BackgroundCall(backend.add_multiple_pvs, parameters, parent=self)
+        self._import_thread.succeeded.connect(self._on_rows_imported)
+        self._import_thread.failed.connect(self._on_import_failed)
+        self._import_thread.finished.connect(self._on_import_finished)
+        self._import_thread.start()
+
+    def _create_parameters(self, rows_to_import: List[Dict[str, Any]]) -> tuple[List[PV], List[str]]:
+        """
+        Convert rows to PVs.  Rows that can't be converted are reported without
+        blocking the rest of the import, which goes to the backend in a single
+        bulk call.
+        Returns: (pv_list, error_list)
+        """
+        # fetch the tag definitions once for the whole import, not per row
+        tag_def = {}
+        if self.parent_page and hasattr(self.parent_page, 'client'):
+            tag_def = self.parent_page.client.backend.get_tags()
 
+        parameters = []
+        errors = []
+        for row_num, row_data in enumerate(rows_to_import, start=1):
+            try:
+                parameters.append(self._create_parameter_from_row(row_data, tag_def))
+            except (KeyError, TypeError, ValueError) as e:
+                errors.append(f"Row {row_num}: {e!r}")
+        return parameters, errors
+
+    @QtCore.Slot(object)
+    def _on_rows_imported(self, pvs_from_backend: List[PV]) -> None:
         try:
-            parent.pv_browser_table.model().sourceModel().add_pvs(pvs_from_backend)
+            self.parent_page.pv_browser_table.model().sourceModel().add_pvs(pvs_from_backend)
         except TypeError as e:
             logger.exception(e)
             logger.exception("Can't add imported PVs to PV browser table")
 
-        return len(rows_to_import), 0, []
+        errors = self._import_errors
+        logger.info("Imported %d PVs from CSV, %d rows rejected", len(pvs_from_backend), len(errors))
+        if errors:
+            logger.debug("Rejected CSV rows: %s", errors)
+        self._show_import_results(len(self.csv_data) - len(errors), len(errors), errors, len(self.csv_data))
+        self.accept()
+
+    @QtCore.Slot(str)
+    def _on_import_failed(self, message: str) -> None:
+        logger.error("Failed to import rows: %s", message)
+        self._show_import_results(
+            0, len(self.csv_data), [message] + self._import_errors, len(self.csv_data)
+        )
+
+    @QtCore.Slot()
+    def _on_import_finished(self) -> None:
+        self.import_all_btn.setEnabled(True)
+        self.unsetCursor()
 
-    def _create_parameter_from_row(self, row_data: Dict[str, Any]):
-        """Create a PV object from CSV row data with proper tag handling"""
+    def _create_parameter_from_row(self, row_data: Dict[str, Any], tag_def: Optional[Dict] = None):
+        """
+        Create a PV object from CSV row data with proper tag handling.  If
+        tag_def is not provided it is fetched from the backend.
+        """
         setpoint = row_data['Setpoint']
         readback = row_data['Readback']
         device = row_data['Device']
         description = row_data['Description']
         csv_groups = row_data['groups']
 
-        tag_def = {}
-        if self.parent_page and hasattr(self.parent_page, 'client'):
-            tag_def = self.parent_page.client.backend.get_tags()
+        if tag_def is None:
+            tag_def = {}
+            if self.parent_page and hasattr(self.parent_page, 'client'):
+                tag_def = self.parent_page.client.backend.get_tags()
 
         tagset = self._create_tag_mapping_from_csv(csv_groups, tag_def)
 
@@ -300,18 +410,31 @@ class CSVTableDialog(QtWidgets.QDialog):
         """
         tagset = {}
 
-        for tag_group_id, (group_name, desc, choices) in tag_def.items():
-            csv_values = csv_groups.get(group_name, [])
+        for tag_group_id, group_name, tag_ids_by_name in self._get_tag_lookup(tag_def):
             tag_ids = set()
-
-            for tag_id, tag_name in choices.items():
-                if tag_name in csv_values:
-                    tag_ids.add(tag_id)
-
+            for tag_name in csv_groups.get(group_name, ()):
+                tag_ids.update(tag_ids_by_name.get(tag_name, ()))
             tagset[tag_group_id] = tag_ids
 
         return tagset
 
+    def _get_tag_lookup(self, tag_def: Dict) -> List[tuple[int, str, Dict[str, List[int]]]]:
+        """
+        Return (tag_group_id, group_name, {tag_name: [tag_id, ...]}) for each
+        group in tag_def.  Built once per tag_def and reused for every row of
+        an import, so rows don't scan each group's choices.
+        """
+        cached_def, lookup = self._tag_lookup
+        if cached_def is not tag_def:
+            lookup = []
+            for tag_group_id, (group_name, desc, choices) in tag_def.items():
+                tag_ids_by_name = {}
+                for tag_id, tag_name in choices.items():
+                    tag_ids_by_name.setdefault(tag_name, []).append(tag_id)
+                lookup.append((tag_group_id, group_name, tag_ids_by_name))
+            self._tag_lookup = (tag_def, lookup)
+        return lookup
+
     def _show_import_results(self, success_count: int, error_count: int, errors: List[str], total_attempted: int):
         """Show import results to user"""
         if error_count == 0:
@@ -10,6 +10,9 @@ from squirrel.tables import (PV_HEADER, PVTableFilterProxyModel, PVTableModel,
                              SnapshotTableModel)
 from squirrel.widgets import SquirrelTableView
 
+# snapshot details columns sized to their contents, the rest stretch
+_FIXED_DETAIL_COLUMNS = frozenset((PV_HEADER.CHECKBOX, PV_HEADER.DEVICE, PV_HEADER.PV))
+
 
 class SnapshotDetailsPage(Page):
     """Snapshot details page for displaying the details of a snapshot."""
@@ -107,11 +110,17 @@ class SnapshotDetailsPage(Page):
         self.snapshot_filter.setSourceModel(self.snapshot_details_model)
         self.snapshot_details_table.setModel(self.snapshot_filter)
         header_view = self.snapshot_details_table.horizontalHeader()
-        header_view.setSectionResizeMode(header_view.ResizeMode.Stretch)
-        header_view.setSectionResizeMode(PV_HEADER.CHECKBOX.value, header_view.ResizeMode.Fixed)
-        # header_view.setSectionResizeMode(PV_HEADER.SEVERITY.value, header_view.ResizeMode.Fixed)
-        header_view.setSectionResizeMode(PV_HEADER.DEVICE.value, header_view.ResizeMode.Fixed)
-        header_view.setSectionResizeMode(PV_HEADER.PV.value, header_view.ResizeMode.Fixed)
+        # set each section's mode once, rather than stretching every section
+        # and then overriding the fixed ones
+        for column in PV_HEADER:
+            if column in _FIXED_DETAIL_COLUMNS:
+                header_view.setSectionResizeMode(column.value, header_view.ResizeMode.Fixed)
+            else:
+                header_view.setSectionResizeMode(column.value, header_view.ResizeMode.Stretch)
+        # every row has the same height, so rows are never measured
+        self.snapshot_details_table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        # size columns from a sample of rows rather than measuring every PV
+        self.snapshot_details_table.verticalHeader().setResizeContentsPrecision(100)
         self.snapshot_details_table.resizeColumnsToContents()
         snapshot_details_layout.addWidget(self.snapshot_details_table)
         self.search_bar.textEdited.connect(self.search_bar_middle_man)
@@ -2,17 +2,20 @@
 Helper QObject classes for managing dataclass instances.
 
 Contains utilities for synchronizing dataclass instances between
-widgets.
+widgets, and small shared Qt helpers.
 """
 from __future__ import annotations
 
 import logging
 from collections.abc import Sequence
-from typing import (Any, ClassVar, Dict, List, Optional, Set, Type, Union,
-                    get_args, get_origin, get_type_hints)
+from functools import lru_cache
+from typing import (Any, Callable, ClassVar, Dict, List, Optional, Set, Type,
+                    Union, get_args, get_origin, get_type_hints)
 
-from qtpy.QtCore import QObject
+import qtawesome as qta
+from qtpy.QtCore import QObject, QThread
 from qtpy.QtCore import Signal as QSignal
+from qtpy.QtGui import QIcon
 
 logger = logging.getLogger(__name__)
 
@@ -390,3 +393,48 @@ class QDataclassSet(QDataclassElem):
         self.get().discard(removal)
         self.removed_value.emit(removal)
         self.updated.emit()
+
+
+@lru_cache(maxsize=64)
+def cached_icon(name: str, **kwargs: Any) -> QIcon:
+    """
+    Return ``qta.icon(name, **kwargs)``, building each distinct icon only once.
+    QIcons are implicitly shared, so one instance can be used by any number of
+    widgets.
+    """
+    return qta.icon(name, **kwargs)
+
+
+class BackgroundCall(QThread):
+    """
+    Thread running a single blocking call, such as parsing a file or a bulk
+    backend request, off the GUI thread
+
+    Emits ``succeeded(result)`` with the call's return value, or
+    ``failed(message)`` if it raised.
+
+    Parameters
+    ----------
+    func : Callable
+        The function to call in the thread
+    args : Any
+        Positional arguments for func
+    parent : QObject, optional, keyword-only
+        The parent object.
+    """
+    succeeded: ClassVar[QSignal] = QSignal(object)
+    failed: ClassVar[QSignal] = QSignal(str)
+
+    def __init__(self, func: Callable, *args: Any, parent: Optional[QObject] = None):
+        super().__init__(parent=parent)
+        self._func = func
+        self._args = args
+
+    def run(self):
+        try:
+            result = self._func(*self._args)
+        except Exception as e:
+            logger.exception(e)
+            self.failed.emit(str(e))
+        else:
+            self.succeeded.emit(result)
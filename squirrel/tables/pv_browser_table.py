@@ -1,16 +1,18 @@
 import logging
+import re
 from enum import Enum, auto
 from typing import Any, Dict, Iterable, List
 
-import qtawesome as qta
 from qtpy import QtCore
 
 from squirrel.model import PV
+from squirrel.qt_helpers import cached_icon
 from squirrel.type_hints import TagSet
 
 logger = logging.getLogger(__name__)
 
 NO_DATA = "--"
+_EMPTY_TAGS = frozenset()
 PAGE_SIZE = 100
 
 
@@ -22,10 +24,12 @@ class PV_BROWSER_HEADER(Enum):
     DELETE = auto()
 
     def display_string(self) -> str:
-        return self._strings[self]
+        return self._display
 
 
-# Must be added outside class def to avoid processing as an enum member
+# Must be added outside class def to avoid processing as enum members.
+# A plain tuple indexed by column number skips the Enum value lookup on each call.
+PV_BROWSER_HEADER._members = tuple(PV_BROWSER_HEADER)
 PV_BROWSER_HEADER._strings = {
     PV_BROWSER_HEADER.DEVICE: "Device",
     PV_BROWSER_HEADER.PV: "Setpoint Addr",
@@ -33,6 +37,9 @@ PV_BROWSER_HEADER._strings = {
     PV_BROWSER_HEADER.TAGS: "Tags",
     PV_BROWSER_HEADER.DELETE: "",
 }
+# Header strings are fixed, store each on its member for display_string
+for member, string in PV_BROWSER_HEADER._strings.items():
+    member._display = string
 
 
 class PVBrowserTableModel(QtCore.QAbstractTableModel):
@@ -40,6 +47,8 @@ class PVBrowserTableModel(QtCore.QAbstractTableModel):
         super().__init__(parent=parent)
         self.client = client
         self._data = []
+        # frozen copy of each entry's tags, parallel to _data, for filtering
+        self._entry_tags: list[dict[int, frozenset]] = []
         self._canFetchMore = True
         self._token = ""
 
@@ -55,8 +64,11 @@ class PVBrowserTableModel(QtCore.QAbstractTableModel):
     def fetchMore(self, parent=QtCore.QModelIndex()) -> None:
         fetched, self._token = self.client.backend.get_paged_pvs(PAGE_SIZE, token=self._token)
         self._canFetchMore = len(fetched) == PAGE_SIZE
+        if not fetched:
+            return
         self.beginInsertRows(QtCore.QModelIndex(), len(self._data), len(self._data) + len(fetched) - 1)
         self._data.extend(fetched)
+        self._entry_tags.extend(map(self._freeze_tags, fetched))
         self.endInsertRows()
 
     def headerData(
@@ -67,7 +79,7 @@ class PVBrowserTableModel(QtCore.QAbstractTableModel):
     ) -> Any:
         if orientation == QtCore.Qt.Horizontal:
             if role == QtCore.Qt.DisplayRole:
-                return PV_BROWSER_HEADER(section).display_string()
+                return PV_BROWSER_HEADER._members[section].display_string()
         return None
 
     def data(
@@ -75,7 +87,7 @@ class PVBrowserTableModel(QtCore.QAbstractTableModel):
         index: QtCore.QModelIndex,
         role: QtCore.Qt.ItemDataRole = QtCore.Qt.DisplayRole
     ) -> Any:
-        column = PV_BROWSER_HEADER(index.column())
+        column = PV_BROWSER_HEADER._members[index.column()]
         if not index.isValid():
             return None
         elif role == QtCore.Qt.TextAlignmentRole and index.data() == NO_DATA:
@@ -98,23 +110,35 @@ class PVBrowserTableModel(QtCore.QAbstractTableModel):
                 return entry.tags if entry.tags else {}
         elif role == QtCore.Qt.DecorationRole:
             if column == PV_BROWSER_HEADER.DELETE:
-                return qta.icon("msc.trash")
+                return cached_icon("msc.trash")
         elif role == QtCore.Qt.UserRole:
             # Return the full entry object for further processing
             entry = self._data[index.row()]
             return entry
         return None
 
+    def entry(self, row: int) -> PV:
+        """Return the PV at ``row``"""
+        return self._data[row]
+
+    def entry_tags(self, row: int) -> dict[int, frozenset]:
+        """Return the tags of the PV at ``row``, frozen for filtering"""
+        return self._entry_tags[row]
+
     def add_pv(self, pv: PV):
         i = len(self._data)
         self.beginInsertRows(QtCore.QModelIndex(), i, i)
         self._data.append(pv)
+        self._entry_tags.append(self._freeze_tags(pv))
         self.endInsertRows()
 
     def add_pvs(self, pvs: Iterable[PV]):
+        if not pvs:
+            return
         start = len(self._data)
         self.beginInsertRows(QtCore.QModelIndex(), start, start + len(pvs) - 1)
         self._data.extend(pvs)
+        self._entry_tags.extend(map(self._freeze_tags, pvs))
         self.endInsertRows()
 
     def removeRow(self, row, parent=None):
@@ -128,6 +152,7 @@ class PVBrowserTableModel(QtCore.QAbstractTableModel):
             parent = parent or QtCore.QModelIndex()
             self.beginRemoveRows(parent, row, row)
             del self._data[row]
+            del self._entry_tags[row]
             self.endRemoveRows()
 
     def refetch_row(self, row):
@@ -139,15 +164,51 @@ class PVBrowserTableModel(QtCore.QAbstractTableModel):
             if match.uuid == pv.uuid:
                 refetched = match
         self._data[row] = refetched
+        self._entry_tags[row] = self._freeze_tags(refetched)
         self.dataChanged.emit(index, index)
 
+    @staticmethod
+    def _freeze_tags(entry: PV) -> dict[int, frozenset]:
+        """Snapshot entry's tags as a dict of frozensets"""
+        return {group: frozenset(tags) for group, tags in (entry.tags or {}).items()}
+
 
 class PVBrowserFilterProxyModel(QtCore.QSortFilterProxyModel):
     def __init__(self, parent=None, tag_set: TagSet = None):
         super().__init__(parent=parent)
         self._search_string = ""
+        self._search_pattern = None
 
         self.tag_set = tag_set or {}  # Initialize with an empty tag dict
+        # no tags selected in any group, so every entry passes the tag check
+        self._tag_set_empty = not any(self.tag_set.values())
+        self._tag_pairs = self._build_tag_pairs(self.tag_set)
+        # id(entry) -> (entry, tags accepted) for the current tag
+        # set, so re-filtering for a new search string skips the tag check
+        self._tag_accept_cache: Dict[int, tuple[PV, bool]] = {}
+        # rapid tag toggles are coalesced into a single re-filter
+        self._filter_timer = QtCore.QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self.invalidateFilter)
+
+    def setSourceModel(self, source_model: QtCore.QAbstractItemModel) -> None:
+        old_model = self.sourceModel()
+        if old_model is not None:
+            old_model.dataChanged.disconnect(self._clear_tag_accept_cache)
+            old_model.modelReset.disconnect(self._clear_tag_accept_cache)
+            old_model.rowsRemoved.disconnect(self._clear_tag_accept_cache)
+        self._clear_tag_accept_cache()
+        # connected before the base class's own handlers, so the cache is
+        # cleared before changed rows are re-filtered
+        if source_model is not None:
+            source_model.dataChanged.connect(self._clear_tag_accept_cache)
+            source_model.modelReset.connect(self._clear_tag_accept_cache)
+            source_model.rowsRemoved.connect(self._clear_tag_accept_cache)
+        super().setSourceModel(source_model)
+
+    def _clear_tag_accept_cache(self, *args) -> None:
+        self._tag_accept_cache.clear()
 
     @property
     def search_string(self) -> str:
@@ -166,10 +227,14 @@ class PVBrowserFilterProxyModel(QtCore.QSortFilterProxyModel):
             The string to filter entries by.
         """
         self._search_string = value.lower()
+        # compiled once per search, so rows are matched without lowercasing
+        # each of their fields
+        self._search_pattern = re.compile(re.escape(value), re.IGNORECASE) if value else None
         self.invalidateFilter()
 
     def set_tag_set(self, tag_set: TagSet) -> None:
-        """Set the tag set for filtering. Apply filter to model immediately.
+        """Set the tag set for filtering. The model is re-filtered shortly
+        after the last of several rapid changes.
 
         Parameters
         ----------
@@ -177,8 +242,19 @@ class PVBrowserFilterProxyModel(QtCore.QSortFilterProxyModel):
             The set of tags to filter entries by.
         """
         self.tag_set = tag_set
+        self._tag_set_empty = not any(self.tag_set.values())
+        self._tag_pairs = self._build_tag_pairs(self.tag_set)
         logger.debug(f"Tag set updated: {self.tag_set}")
-        self.invalidateFilter()
+        self._clear_tag_accept_cache()
+        self._filter_timer.start()
+
+    @staticmethod
+    def _build_tag_pairs(tag_set: TagSet) -> tuple[tuple[int, frozenset], ...]:
+        """
+        Snapshot the groups of tag_set that have tags selected, as
+        (group, frozenset) pairs for is_tag_subset to loop over
+        """
+        return tuple((group, frozenset(tags)) for group, tags in tag_set.items() if tags)
 
     def is_tag_subset(self, entry_tags: TagSet) -> bool:
         """Check if the entry's tags are a subset of the filter's tag set.
@@ -193,8 +269,13 @@ class PVBrowserFilterProxyModel(QtCore.QSortFilterProxyModel):
         bool
             True if the entry's tags are a subset of the filter's tag set, False otherwise.
         """
-        is_subset = all(self.tag_set[group].issubset(entry_tags.get(group, set())) for group in self.tag_set)
-        logger.debug(f"Tag values subset: {is_subset}")
+        is_subset = True
+        for group, tags in self._tag_pairs:
+            if not tags.issubset(entry_tags.get(group, _EMPTY_TAGS)):
+                is_subset = False
+                break
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Tag values subset: {is_subset}")
 
         return is_subset
 
@@ -212,24 +293,38 @@ class PVBrowserFilterProxyModel(QtCore.QSortFilterProxyModel):
         bool
             True if the entry matches the search string, False otherwise
         """
-        if not self.search_string:
+        if self._search_pattern is None:
             return True
 
-        search_device = self.search_string in (entry.device or NO_DATA).lower()
-        search_setpoint = self.search_string in (entry.setpoint or "").lower()
-        search_readback = self.search_string in (entry.readback or NO_DATA).lower()
-
-        return search_device or search_setpoint or search_readback
+        search = self._search_pattern.search
+        return bool(
+            search(entry.device or NO_DATA)
+            or search(entry.setpoint or "")
+            or search(entry.readback or NO_DATA)
+        )
 
     def filterAcceptsRow(self, source_row: int, source_parent: QtCore.QModelIndex) -> bool:
-        row_index = self.sourceModel().index(source_row, 0, source_parent)
-        entry = self.sourceModel().data(row_index, QtCore.Qt.UserRole)
+        # read the source entries directly rather than going through index()
+        # and data(UserRole) for every row
+        source_model = self.sourceModel()
+        entry = source_model.entry(source_row)
         if not entry:
             return False
 
-        logger.debug(f"Filtering row {source_row} with entry: {entry}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Filtering row {source_row} with entry: {entry}")
+
+        if self._tag_set_empty:
+            return self.search_accepts_entry(entry)
 
-        return self.is_tag_subset(entry.tags) and self.search_accepts_entry(entry)
+        cached = self._tag_accept_cache.get(id(entry))
+        if cached is not None and cached[0] is entry:
+            tags_accepted = cached[1]
+        else:
+            tags_accepted = self.is_tag_subset(source_model.entry_tags(source_row))
+            self._tag_accept_cache[id(entry)] = (entry, tags_accepted)
+
+        return tags_accepted and self.search_accepts_entry(entry)
 
 
 class CSVTableModel(QtCore.QAbstractTableModel):
@@ -238,10 +333,21 @@ class CSVTableModel(QtCore.QAbstractTableModel):
         self._data = csv_data
         self.backend_tag_def = backend_tag_def or {}
         self.tag_def = self._filter_to_existing_backend_groups()
+        # tag name -> tag id for each accepted group, the first id wins if a
+        # name repeats within a group
+        self._name_to_id = {
+            tag_group_id: {name: tag_id for tag_id, name in reversed(choices.items())}
+            for tag_group_id, (_, _, choices) in self.tag_def.items()
+        }
         self._headers = self._build_headers()
 
         self.rejected_groups = []
         self.rejected_values = {}
+        # converted once here, which also records every rejected value before
+        # the validation summary is built
+        self._row_tagsets = [
+            self._convert_groups_to_tagset(row.get('groups', {})) for row in self._data
+        ]
         self.validation_summary = self._create_validation_summary()
 
     def _build_headers(self) -> List[str]:
@@ -280,7 +386,7 @@ class CSVTableModel(QtCore.QAbstractTableModel):
             elif column_name == 'Description':
                 return row_data.get('Description', '')
             elif column_name == 'Tags':
-                return self._convert_groups_to_tagset(row_data.get('groups', {}))
+                return self._row_tagsets[index.row()]
         elif role == QtCore.Qt.ToolTipRole:
             if column_name == 'Setpoint':
                 return f"Setpoint: {row_data.get('Setpoint', '')}"
@@ -307,19 +413,17 @@ class CSVTableModel(QtCore.QAbstractTableModel):
         if not self._data or not self.backend_tag_def:
             return {}
 
-        csv_groups = {}
-        for row in self._data:
-            for group_name, values in row.get('groups', {}).items():
-                if group_name not in csv_groups:
-                    csv_groups[group_name] = set()
-                csv_groups[group_name].update(values)
+        # only the group names are needed, in order of first appearance
+        csv_group_names = dict.fromkeys(
+            group_name for row in self._data for group_name in row.get('groups', {})
+        )
 
         backend_group_names = {details[0]: tag_group_id for tag_group_id, details in self.backend_tag_def.items()}
 
         filtered_tag_def = {}
         self.rejected_groups = []
 
-        for csv_group_name in csv_groups.keys():
+        for csv_group_name in csv_group_names:
             if csv_group_name in backend_group_names:
                 backend_id = backend_group_names[csv_group_name]
                 filtered_tag_def[backend_id] = self.backend_tag_def[backend_id]
@@ -334,22 +438,23 @@ class CSVTableModel(QtCore.QAbstractTableModel):
         """Convert CSV groups to TagSet format with value-level validation"""
         tagset = {}
         row_rejected_values = {}
+        # checked once per row rather than per value
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
-        for tag_group_id, (group_name, desc, choices) in self.tag_def.items():
+        for tag_group_id, (group_name, _, _) in self.tag_def.items():
             csv_group_values = csv_groups.get(group_name, [])
             tag_ids = set()
             rejected_values_for_group = []
 
-            backend_values = set(choices.values())
+            name_to_id = self._name_to_id[tag_group_id]
 
             # Validate each CSV value against backend choices
             for csv_value in csv_group_values:
-                if csv_value in backend_values:
-                    for tag_id, tag_name in choices.items():
-                        if tag_name == csv_value:
-                            tag_ids.add(tag_id)
-                            logger.debug(f"Accepted value '{csv_value}' -> tag_id {tag_id}")
-                            break
+                tag_id = name_to_id.get(csv_value)
+                if tag_id is not None:
+                    tag_ids.add(tag_id)
+                    if debug_enabled:
+                        logger.debug(f"Accepted value '{csv_value}' -> tag_id {tag_id}")
                 else:
                     rejected_values_for_group.append(csv_value)
                     logger.warn(f"Rejected value '{csv_value}' (not in backend choices)")
@@ -362,7 +467,7 @@ class CSVTableModel(QtCore.QAbstractTableModel):
 
             tagset[tag_group_id] = tag_ids
 
-        if row_rejected_values:
+        if row_rejected_values and debug_enabled:
             logger.debug(f"Row rejected values: {row_rejected_values}")
 
         return tagset
@@ -1,3 +1,4 @@
+import re
 from enum import Enum, auto
 from typing import Iterable, Optional, Union
 from uuid import UUID
@@ -24,10 +25,12 @@ class PV_HEADER(Enum):
     CONFIG = auto()
 
     def display_string(self) -> str:
-        return self._strings[self]
+        return self._display
 
 
-# Must be added outside class def to avoid processing as an enum member
+# Must be added outside class def to avoid processing as enum members.
+# A plain tuple indexed by column number skips the Enum value lookup on each call.
+PV_HEADER._members = tuple(PV_HEADER)
 PV_HEADER._strings = {
     PV_HEADER.CHECKBOX: "",
     PV_HEADER.DEVICE: "Device",
@@ -39,6 +42,9 @@ PV_HEADER._strings = {
     PV_HEADER.LIVE_READBACK: "Live RB",
     PV_HEADER.CONFIG: "CON",
 }
+# Header strings are fixed, store each on its member for display_string
+for member, string in PV_HEADER._strings.items():
+    member._display = string
 
 
 class PVTableModel(LivePVTableModel):
@@ -54,6 +60,42 @@ class PVTableModel(LivePVTableModel):
         parent=None,
     ):
         super().__init__(client=client, entries=[], parent=parent)
+        # data() handlers, keyed by role and then by PV_HEADER column
+        self._role_dispatch = {
+            QtCore.Qt.DisplayRole: self._display_data,
+            QtCore.Qt.ToolTipRole: self._tooltip_data,
+            QtCore.Qt.CheckStateRole: self._check_state_data,
+            QtCore.Qt.DecorationRole: self._decoration_data,
+            QtCore.Qt.ForegroundRole: self._foreground_data,
+            QtCore.Qt.BackgroundRole: self._live_setpoint_background_data,
+            QtCore.Qt.FontRole: self._live_setpoint_font_data,
+            QtCore.Qt.TextAlignmentRole: self._alignment_data,
+            QtCore.Qt.UserRole: self._user_data,
+        }
+        self._display_dispatch = {
+            PV_HEADER.DEVICE: lambda entry: entry.device or NO_DATA,
+            PV_HEADER.PV: lambda entry: entry.setpoint,
+            PV_HEADER.READBACK_ADDR: lambda entry: self.format_readback_addr(
+                entry.setpoint, entry.readback
+            ),
+            PV_HEADER.SETPOINT: lambda entry: getattr(entry.setpoint_data, "data", ""),
+            PV_HEADER.LIVE_SETPOINT: lambda entry: NO_DATA,
+            PV_HEADER.READBACK: lambda entry: getattr(entry.readback_data, "data", ""),
+            PV_HEADER.LIVE_READBACK: lambda entry: NO_DATA,
+        }
+        # shared return values for data(), built once rather than per call
+        self._blue = QtGui.QColor(squirrel.color.BLUE)
+        self._highlight = QtGui.QColor(squirrel.color.LIVE_SETPOINT_HIGHLIGHT)
+        self._bold_font = QtGui.QFont()
+        self._bold_font.setBold(True)
+        # entry attributes holding the data behind each column's severity icon
+        self._decoration_attrs = {
+            PV_HEADER.SETPOINT: "setpoint_data",
+            PV_HEADER.LIVE_SETPOINT: "live_setpoint_data",
+            PV_HEADER.READBACK: "readback_data",
+            PV_HEADER.LIVE_READBACK: "live_readback_data",
+            PV_HEADER.CONFIG: "config_data",
+        }
         if snapshot:
             self.set_snapshot(snapshot)
         else:
@@ -66,6 +108,10 @@ class PVTableModel(LivePVTableModel):
     def columnCount(self, parent=None):
         return len(PV_HEADER)
 
+    def entry(self, row: int) -> PV:
+        """Return the PV at ``row``"""
+        return self._data[row]
+
     def headerData(
         self,
         section: int,
@@ -74,13 +120,13 @@ class PVTableModel(LivePVTableModel):
     ):
         if orientation == QtCore.Qt.Horizontal:
             if role == QtCore.Qt.DisplayRole:
-                return PV_HEADER(section).display_string()
+                return PV_HEADER._members[section].display_string()
 
     def flags(self, index) -> QtCore.Qt.ItemFlags:
         if not index.isValid():
             return
 
-        column = PV_HEADER(index.column())
+        column = PV_HEADER._members[index.column()]
         if column == PV_HEADER.CHECKBOX:
             return (
                 QtCore.Qt.ItemIsUserCheckable
@@ -95,82 +141,78 @@ class PVTableModel(LivePVTableModel):
         index: QtCore.QModelIndex,
         role: QtCore.Qt.ItemDataRole = QtCore.Qt.DisplayRole
     ):
-        entry = self._data[index.row()]
-        column = PV_HEADER(index.column())
-        if role == QtCore.Qt.DisplayRole:
-            if column == PV_HEADER.CHECKBOX:
-                pass
-            elif column == PV_HEADER.DEVICE:
-                return entry.device or NO_DATA
-            elif column == PV_HEADER.PV:
-                return entry.setpoint
-            elif column == PV_HEADER.READBACK_ADDR:
-                sp = entry.setpoint
-                rb = entry.readback
-                return self.format_readback_addr(sp, rb)
-            elif column == PV_HEADER.SETPOINT:
-                return getattr(entry.setpoint_data, "data", "")
-            elif column == PV_HEADER.LIVE_SETPOINT:
-                # return self._get_live_data_field(entry, 'data')
-                return NO_DATA
-            elif column == PV_HEADER.READBACK:
-                return getattr(entry.readback_data, "data", "")
-            elif column == PV_HEADER.LIVE_READBACK:
-                # return self._get_live_data_field(entry.readback, 'data') if entry.readback else None
-                return NO_DATA
-            elif column == PV_HEADER.CONFIG:
-                return None
-            else:
-                return None
-        elif role == QtCore.Qt.ToolTipRole:
-            if column in (PV_HEADER.PV, PV_HEADER.SETPOINT, PV_HEADER.LIVE_SETPOINT):
-                return entry.setpoint
-            elif column in (PV_HEADER.READBACK, PV_HEADER.LIVE_READBACK) and entry.readback:
-                return entry.readback
-            elif column == PV_HEADER.CONFIG:
-                return None
-        elif role == QtCore.Qt.CheckStateRole and column == PV_HEADER.CHECKBOX:
-            return index.row() in self._checked
-        elif role == QtCore.Qt.DecorationRole:
-            col_map = {
-                PV_HEADER.SETPOINT: entry.setpoint_data,
-                PV_HEADER.LIVE_SETPOINT: getattr(entry, "live_setpoint_data", None),
-                PV_HEADER.READBACK: entry.readback_data,
-                PV_HEADER.LIVE_READBACK: getattr(entry, "live_readback_data", None),
-                PV_HEADER.CONFIG: entry.config_data,
-            }
-            data = col_map.get(column)
-            if not data:
-                return None
-            severity = getattr(data, "severity", Severity.INVALID)
-            icon = SEVERITY_ICONS[severity]
-            if icon is None:
-                status = getattr(data, "status", None)
-                if status is not None:
-                    icon = SEVERITY_ICONS[status]
-            return icon
-        elif role == QtCore.Qt.ForegroundRole and column in [PV_HEADER.LIVE_SETPOINT, PV_HEADER.LIVE_READBACK]:
-            return QtGui.QColor(squirrel.color.BLUE)
-        elif role in [QtCore.Qt.BackgroundRole, QtCore.Qt.FontRole] and column == PV_HEADER.LIVE_SETPOINT:
-            stored_data = getattr(entry, 'data', None)
-            is_close = self.is_close(entry, stored_data)
-            if stored_data is not None and not is_close:
-                if role == QtCore.Qt.BackgroundRole:
-                    return QtGui.QColor(squirrel.color.LIVE_SETPOINT_HIGHLIGHT)
-                elif role == QtCore.Qt.FontRole:
-                    font = QtGui.QFont()
-                    font.setBold(True)
-                    return font
+        # dispatch on role first, most roles only apply to a few columns
+        handler = self._role_dispatch.get(role)
+        if handler is None:
+            return None
+        return handler(
+            self._data[index.row()], PV_HEADER._members[index.column()], index.row()
+        )
+
+    def _display_data(self, entry: PV, column: PV_HEADER, row: int):
+        getter = self._display_dispatch.get(column)
+        if getter is None:
+            return None
+        return getter(entry)
+
+    def _tooltip_data(self, entry: PV, column: PV_HEADER, row: int):
+        if column in (PV_HEADER.PV, PV_HEADER.SETPOINT, PV_HEADER.LIVE_SETPOINT):
+            return entry.setpoint
+        elif column in (PV_HEADER.READBACK, PV_HEADER.LIVE_READBACK) and entry.readback:
+            return entry.readback
+        return None
+
+    def _check_state_data(self, entry: PV, column: PV_HEADER, row: int):
+        if column == PV_HEADER.CHECKBOX:
+            return row in self._checked
+        return None
+
+    def _decoration_data(self, entry: PV, column: PV_HEADER, row: int):
+        attr = self._decoration_attrs.get(column)
+        if attr is None:
+            return None
+        data = getattr(entry, attr, None)
+        if not data:
+            return None
+        severity = getattr(data, "severity", Severity.INVALID)
+        icon = SEVERITY_ICONS[severity]
+        if icon is None:
+            status = getattr(data, "status", None)
+            if status is not None:
+                icon = SEVERITY_ICONS[status]
+        return icon
+
+    def _foreground_data(self, entry: PV, column: PV_HEADER, row: int):
+        if column in (PV_HEADER.LIVE_SETPOINT, PV_HEADER.LIVE_READBACK):
+            return self._blue
+        return None
+
+    def _live_setpoint_background_data(self, entry: PV, column: PV_HEADER, row: int):
+        if column != PV_HEADER.LIVE_SETPOINT:
+            return None
+        stored_data = getattr(entry, 'data', None)
+        if stored_data is not None and not self.is_close(entry, stored_data):
+            return self._highlight
+        return None
+
+    def _live_setpoint_font_data(self, entry: PV, column: PV_HEADER, row: int):
+        if column != PV_HEADER.LIVE_SETPOINT:
             return None
-        elif role == QtCore.Qt.TextAlignmentRole:
-            if column not in [PV_HEADER.PV]:
-                return QtCore.Qt.AlignCenter
-        elif role == QtCore.Qt.UserRole:
-            return entry
+        stored_data = getattr(entry, 'data', None)
+        if stored_data is not None and not self.is_close(entry, stored_data):
+            return self._bold_font
+        return None
+
+    def _alignment_data(self, entry: PV, column: PV_HEADER, row: int):
+        if column != PV_HEADER.PV:
+            return QtCore.Qt.AlignCenter
         return None
 
+    def _user_data(self, entry: PV, column: PV_HEADER, row: int):
+        return entry
+
     def setData(self, index, value, role) -> bool:
-        if role == QtCore.Qt.CheckStateRole and PV_HEADER(index.column()) == PV_HEADER.CHECKBOX:
+        if role == QtCore.Qt.CheckStateRole and PV_HEADER._members[index.column()] == PV_HEADER.CHECKBOX:
             try:
                 self._checked.remove(index.row())
             except KeyError:
@@ -208,11 +250,23 @@ class PVTableModel(LivePVTableModel):
             a snapshot
         """
         try:
-            self._data = snapshot.pvs
+            pvs = snapshot.pvs
         except AttributeError:
-            self._data = self.client.backend.get_snapshot(snapshot).pvs
+            pvs = self.client.backend.get_snapshot(snapshot).pvs
+        self.set_entries(pvs)
+
+    def set_entries(self, entries: list[PV]) -> None:
+        """
+        Set the entries for this table.  Row storage, checked rows and the live
+        data caches are all swapped within a single model reset, so attached
+        proxies remap their rows once.
+        """
+        self.beginResetModel()
+        self._data = entries
         self._checked = set()
-        self.set_entries(self._data)
+        self.entries = entries
+        self._reset_address_caches()
+        self.endResetModel()
 
     def get_selected_pvs(self) -> Iterable[PV]:
         """Return the Setpoints corresponding to checked rows in the table"""
@@ -229,6 +283,7 @@ class PVTableFilterProxyModel(QtCore.QSortFilterProxyModel):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._search_string = ""
+        self._search_pattern = None
 
     @property
     def search_string(self) -> str:
@@ -247,6 +302,9 @@ class PVTableFilterProxyModel(QtCore.QSortFilterProxyModel):
             The string to filter entries by.
         """
         self._search_string = value.lower()
+        # compiled once per search, so rows are matched without lowercasing
+        # each of their fields
+        self._search_pattern = re.compile(re.escape(value), re.IGNORECASE) if value else None
         self.invalidateFilter()
 
     def search_accepts_entry(self, entry: PV) -> bool:
@@ -263,17 +321,16 @@ class PVTableFilterProxyModel(QtCore.QSortFilterProxyModel):
         bool
             True if the entry matches the search string, False otherwise
         """
-        if not self.search_string:
+        if self._search_pattern is None:
             return True
 
-        search_device = self.search_string in (entry.device or NO_DATA).lower()
-        search_setpoint = self.search_string in (entry.setpoint or "").lower()
-
-        return search_device or search_setpoint
+        search = self._search_pattern.search
+        return bool(search(entry.device or NO_DATA) or search(entry.setpoint or ""))
 
     def filterAcceptsRow(self, source_row: int, source_parent: QtCore.QModelIndex) -> bool:
-        row_index = self.sourceModel().index(source_row, 0, source_parent)
-        entry = self.sourceModel().data(row_index, QtCore.Qt.UserRole)
+        # read the source entries directly rather than going through index()
+        # and data(UserRole) for every row
+        entry = self.sourceModel().entry(source_row)
         if not entry:
             return False
 
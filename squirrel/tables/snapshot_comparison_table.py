@@ -1,4 +1,5 @@
-from enum import Enum, auto
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum, auto
 from typing import Any
 from uuid import UUID
 
@@ -9,9 +10,13 @@ import squirrel.color
 from squirrel.widgets import SEVERITY_ICONS
 
 NO_DATA = "--"
+# Shared across all paints rather than allocated per mismatched cell
+_RED_BRUSH = QtGui.QBrush(QtGui.QColor(squirrel.color.RED))
+_SENTINEL = object()
+_NUMERIC_TYPES = (int, float)
 
 
-class COMPARE_HEADER(Enum):
+class COMPARE_HEADER(IntEnum):
     CHECKBOX = 0
     SEVERITY = auto()
     COMPARE_SEVERITY = auto()
@@ -26,21 +31,28 @@ class COMPARE_HEADER(Enum):
         return self._strings[self]
 
     def is_compare_column(self) -> bool:
-        return self in (self.COMPARE_SEVERITY, self.COMPARE_SETPOINT,
-                        self.COMPARE_READBACK)
+        return self._compare_mask[self]
 
 
-COMPARE_HEADER._strings = {
-    COMPARE_HEADER.CHECKBOX: "",
-    COMPARE_HEADER.SEVERITY: "Severity",
-    COMPARE_HEADER.COMPARE_SEVERITY: "Comparison Severity",
-    COMPARE_HEADER.DEVICE: "Device",
-    COMPARE_HEADER.PV: "PV Name",
-    COMPARE_HEADER.SETPOINT: "Saved Value",
-    COMPARE_HEADER.COMPARE_SETPOINT: "Comparison Value",
-    COMPARE_HEADER.READBACK: "Saved Readback",
-    COMPARE_HEADER.COMPARE_READBACK: "Comparison Readback",
-}
+# Must be added outside class def to avoid processing as enum members.
+# Plain tuples indexed by column number skip the Enum value lookup on each call.
+COMPARE_HEADER._members = tuple(COMPARE_HEADER)
+COMPARE_HEADER._strings = (
+    "",
+    "Severity",
+    "Comparison Severity",
+    "Device",
+    "PV Name",
+    "Saved Value",
+    "Comparison Value",
+    "Saved Readback",
+    "Comparison Readback",
+)
+COMPARE_HEADER._compare_mask = tuple(
+    column in (COMPARE_HEADER.COMPARE_SEVERITY, COMPARE_HEADER.COMPARE_SETPOINT,
+               COMPARE_HEADER.COMPARE_READBACK)
+    for column in COMPARE_HEADER._members
+)
 
 
 class SnapshotComparisonTableModel(QtCore.QAbstractTableModel):
@@ -51,14 +63,21 @@ class SnapshotComparisonTableModel(QtCore.QAbstractTableModel):
     def __init__(self, client, parent=None):
         super().__init__(parent)
         self.client = client
-        self._data = []
-        self._checked = set()
+        # Parallel per-row lists; either side is None when the PV is absent
+        # from that snapshot
+        self._primary = []
+        self._secondary = []
+        self._checked_mask = np.zeros(0, dtype=bool)
+        # (row, data field) -> mismatch, filled in as cells are painted
+        self._mismatch_cache = {}
+        # (first, last) rows with check changes not yet announced via dataChanged
+        self._pending_check_rows = None
 
         self.main_snapshot = None
         self.comparison_snapshot = None
 
     def rowCount(self, parent=None):
-        return len(self._data)
+        return len(self._primary)
 
     def columnCount(self, parent=None):
         return len(COMPARE_HEADER)
@@ -71,11 +90,11 @@ class SnapshotComparisonTableModel(QtCore.QAbstractTableModel):
     ) -> str:
         if orientation == QtCore.Qt.Horizontal:
             if role == QtCore.Qt.DisplayRole:
-                return COMPARE_HEADER(section).display_string()
+                return COMPARE_HEADER._members[section].display_string()
         return None
 
     def flags(self, index) -> QtCore.Qt.ItemFlags:
-        column = COMPARE_HEADER(index.column())
+        column = COMPARE_HEADER._members[index.column()]
         if column == COMPARE_HEADER.CHECKBOX:
             return QtCore.Qt.ItemIsUserCheckable | QtCore.Qt.ItemIsEnabled
         else:
@@ -86,13 +105,15 @@ class SnapshotComparisonTableModel(QtCore.QAbstractTableModel):
         index: QtCore.QModelIndex,
         role: QtCore.Qt.ItemDataRole = QtCore.Qt.DisplayRole
     ):
-        column = COMPARE_HEADER(index.column())
+        column = COMPARE_HEADER._members[index.column()]
         is_compare_column = column.is_compare_column()
 
         # Get the entry and compare objects, swapping them if necessary
-        entry, compare = self._data[index.row()]
+        row = index.row()
         if is_compare_column:
-            entry, compare = compare, entry
+            entry, compare = self._secondary[row], self._primary[row]
+        else:
+            entry, compare = self._primary[row], self._secondary[row]
 
         # Handle different roles
         if role == QtCore.Qt.TextAlignmentRole:
@@ -100,26 +121,14 @@ class SnapshotComparisonTableModel(QtCore.QAbstractTableModel):
                 return QtCore.Qt.AlignCenter
         elif role == QtCore.Qt.CheckStateRole:
             if column == COMPARE_HEADER.CHECKBOX:
-                return QtCore.Qt.Checked if index.row() in self._checked else QtCore.Qt.Unchecked
+                return QtCore.Qt.Checked if self._checked_mask[row] else QtCore.Qt.Unchecked
         elif role == QtCore.Qt.BackgroundRole:
             if column == COMPARE_HEADER.COMPARE_SETPOINT:
-                try:
-                    is_close = np.isclose(entry.setpoint_data.data, compare.setpoint_data.data)
-                except AttributeError:
-                    return None
-                except TypeError:
-                    is_close = entry.setpoint_data.data == compare.setpoint_data.data
-                if compare.setpoint_data.data is not None and not is_close:
-                    return QtGui.QColor(squirrel.color.RED)
+                if self._is_mismatch(row, "setpoint_data"):
+                    return _RED_BRUSH
             elif column == COMPARE_HEADER.COMPARE_READBACK:
-                try:
-                    is_close = np.isclose(entry.readback_data.data, compare.readback_data.data)
-                except TypeError:
-                    is_close = entry.readback_data.data == compare.readback_data.data
-                except AttributeError:
-                    return None
-                if compare.readback_data.data is not None and not is_close:
-                    return QtGui.QColor(squirrel.color.RED)
+                if self._is_mismatch(row, "readback_data"):
+                    return _RED_BRUSH
         elif role == QtCore.Qt.ToolTipRole:
             if column in [COMPARE_HEADER.PV, COMPARE_HEADER.SETPOINT, COMPARE_HEADER.COMPARE_SETPOINT]:
                 try:
@@ -160,15 +169,89 @@ class SnapshotComparisonTableModel(QtCore.QAbstractTableModel):
 
     def setData(self, index: QtCore.QModelIndex, value: Any, role: QtCore.Qt.ItemDataRole) -> bool:
         """Set the data for a given index. Only checkboxes are editable."""
-        column = COMPARE_HEADER(index.column())
-        if role == QtCore.Qt.CheckStateRole and column == COMPARE_HEADER.CHECKBOX:
-            if value == QtCore.Qt.Checked:
-                self._checked.add(index.row())
-            elif value == QtCore.Qt.Unchecked:
-                self._checked.remove(index.row())
-            self.dataChanged.emit(index, index)
+        column = COMPARE_HEADER._members[index.column()]
+        if role != QtCore.Qt.CheckStateRole or column != COMPARE_HEADER.CHECKBOX:
+            return False
+        row = index.row()
+        # Views deliver the check state as a plain int
+        checked = QtCore.Qt.CheckState(value) == QtCore.Qt.Checked
+        if self._checked_mask[row] != checked:
+            self._checked_mask[row] = checked
+            self._queue_check_changed(row)
         return True
 
+    def _queue_check_changed(self, row: int) -> None:
+        """
+        Add ``row`` to the span of pending check changes. The span is emitted as a
+        single dataChanged once control returns to the event loop, so bulk
+        (un)checking repaints once instead of once per row.
+        """
+        if self._pending_check_rows is None:
+            self._pending_check_rows = (row, row)
+            QtCore.QTimer.singleShot(0, self._flush_check_changed)
+        else:
+            first, last = self._pending_check_rows
+            self._pending_check_rows = (min(first, row), max(last, row))
+
+    def _flush_check_changed(self) -> None:
+        """Emit dataChanged for the pending span of check changes."""
+        if self._pending_check_rows is None:
+            return
+        first, last = self._pending_check_rows
+        self._pending_check_rows = None
+        self.dataChanged.emit(
+            self.index(first, COMPARE_HEADER.CHECKBOX),
+            self.index(last, COMPARE_HEADER.CHECKBOX),
+            [QtCore.Qt.CheckStateRole],
+        )
+
+    def _is_mismatch(self, row: int, field: str) -> bool:
+        """
+        Return True if the comparison PV's ``field`` data differs from the main
+        PV's in ``row``. Numeric rows are filled in by collate_pvs; others are
+        computed on first paint of the row. Cached until the model is reset.
+        """
+        mismatch = self._mismatch_cache.get((row, field), _SENTINEL)
+        if mismatch is _SENTINEL:
+            primary, secondary = self._primary[row], self._secondary[row]
+            try:
+                saved = getattr(primary, field).data
+                compared = getattr(secondary, field).data
+            except AttributeError:
+                mismatch = False
+            else:
+                try:
+                    is_close = np.isclose(compared, saved)
+                except TypeError:
+                    is_close = compared == saved
+                mismatch = saved is not None and not is_close
+            self._mismatch_cache[(row, field)] = mismatch
+        return mismatch
+
+    def _prefill_numeric_mismatches(self, field: str) -> None:
+        """
+        Seed the mismatch cache for rows where both sides of ``field`` hold plain
+        int or float data, comparing them all in a single np.isclose call.
+        Other rows are left to _is_mismatch.
+        """
+        rows, saved, compared = [], [], []
+        for row, (primary, secondary) in enumerate(zip(self._primary, self._secondary)):
+            try:
+                saved_data = getattr(primary, field).data
+                compared_data = getattr(secondary, field).data
+            except AttributeError:
+                continue
+            if type(saved_data) in _NUMERIC_TYPES and type(compared_data) in _NUMERIC_TYPES:
+                rows.append(row)
+                saved.append(saved_data)
+                compared.append(compared_data)
+        if not rows:
+            return
+        mismatches = ~np.isclose(np.array(compared, dtype=float), np.array(saved, dtype=float))
+        self._mismatch_cache.update(
+            ((row, field), bool(mismatch)) for row, mismatch in zip(rows, mismatches)
+        )
+
     def ready_for_comparison(self) -> bool:
         """Check if the model is ready for comparison."""
         has_main = self.main_snapshot is not None
@@ -181,20 +264,48 @@ class SnapshotComparisonTableModel(QtCore.QAbstractTableModel):
         if not self.ready_for_comparison():
             return
 
+        # Overlap the two backend round-trips; only the model reset needs the GUI thread
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            comparison_future = executor.submit(
+                self.client.backend.get_snapshot, self.comparison_snapshot.uuid
+            )
+            main_future = executor.submit(self.client.backend.get_snapshot, self.main_snapshot.uuid)
+            comparison_pvs = comparison_future.result().pvs
+            main_pvs = main_future.result().pvs
+
         self.beginResetModel()
-        self._data = []
-        pvs = self.client.backend.get_snapshots(uuid=self.comparison_snapshot.uuid)[0].pvs
-        secondary_pvs = {(pv.setpoint, pv.readback): pv for pv in tuple(pvs)}
+        # Remember checked rows by PV identity, as row indices change on reset
+        checked_keys = {self._row_key(i) for i in np.flatnonzero(self._checked_mask)}
+        self._primary = []
+        self._secondary = []
+        self._mismatch_cache.clear()
+        # The reset repaints everything, and the pending rows may no longer exist
+        self._pending_check_rows = None
+        secondary_pvs = {(pv.setpoint, pv.readback): pv for pv in comparison_pvs}
         # for each PV in primary snapshot, find partner in secondary snapshot
-        pvs = self.client.backend.get_snapshots(uuid=self.main_snapshot.uuid)[0].pvs
-        for primary in tuple(pvs):
+        for primary in main_pvs:
             secondary = secondary_pvs.pop((primary.setpoint, primary.readback), None)
-            self._data.append((primary, secondary))
+            self._primary.append(primary)
+            self._secondary.append(secondary)
         # for each PV in secondary with no partner in primary, add row with 'None' partner
-        for secondary in secondary_pvs.values():
-            self._data.append((None, secondary))
+        self._primary.extend([None] * len(secondary_pvs))
+        self._secondary.extend(secondary_pvs.values())
+        self._prefill_numeric_mismatches("setpoint_data")
+        self._prefill_numeric_mismatches("readback_data")
+        self._checked_mask = np.fromiter(
+            (self._row_key(i) in checked_keys for i in range(len(self._primary))),
+            dtype=bool,
+            count=len(self._primary),
+        )
         self.endResetModel()
 
+    def _row_key(self, row: int) -> tuple[str, str]:
+        """Return the (setpoint, readback) pair identifying a row across resets."""
+        pv = self._primary[row]
+        if pv is None:
+            pv = self._secondary[row]
+        return (pv.setpoint, pv.readback)
+
     def set_main_snapshot(self, main_snapshot: UUID) -> None:
         """Set the main snapshot and update the model."""
         self.main_snapshot = main_snapshot
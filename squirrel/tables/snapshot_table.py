@@ -110,6 +110,7 @@ class SnapshotFilterModel(QtCore.QSortFilterProxyModel):
         self.since = QtCore.QDate.currentDate().addYears(-1)
         self.until = QtCore.QDate.currentDate()
         self.filters = []  # List that contains: [{column, operator, value}]
+        self._compiled_filters = []
 
     def filterAcceptsRow(self, row: int, parent: QtCore.QModelIndex) -> bool:
         datetime = self.sourceModel()._data[row].creation_time
@@ -120,24 +121,26 @@ class SnapshotFilterModel(QtCore.QSortFilterProxyModel):
             return False
 
         # Meta PV filtering
-        snapshot = self.sourceModel()._data[row]
-        for meta_pv_filter in self.filters:
-            column_name = meta_pv_filter["column"]
-            input_operator = meta_pv_filter["operator"]
-            input_value = meta_pv_filter["value"]
-
-            comparison_function = self.SUPPORTED_OPERATORS.get(input_operator)
+        if not self._compiled_filters:
+            return self._search_accepts_row(row, parent)
 
+        snapshot = self.sourceModel()._data[row]
+        meta_pvs = {pv.description: pv for pv in reversed(snapshot.meta_pvs)}
+        for column_name, comparison_function, input_float, input_str in self._compiled_filters:
             # Retrieve the data for the corresponding meta_pv
-            matching_pv = [pv for pv in snapshot.meta_pvs if pv.description == column_name][0]
+            matching_pv = meta_pvs[column_name]
             epics_data = matching_pv.readback_data or matching_pv.setpoint_data
 
-            try:
-                pv_value = float(epics_data.data)
-                input_value = float(input_value)
-            except (ValueError, TypeError):
+            pv_value = input_value = None
+            if input_float is not None:
+                try:
+                    pv_value = float(epics_data.data)
+                    input_value = input_float
+                except (ValueError, TypeError):
+                    pass
+            if input_value is None:
                 pv_value = str(epics_data.data)
-                input_value = str(input_value)
+                input_value = input_str
 
             try:
                 if not comparison_function(pv_value, input_value):
@@ -146,6 +149,13 @@ class SnapshotFilterModel(QtCore.QSortFilterProxyModel):
                 print(f'Exception applying filter: {e}')
                 return False
 
+        return self._search_accepts_row(row, parent)
+
+    def _search_accepts_row(self, row: int, parent: QtCore.QModelIndex) -> bool:
+        """Match the search text, skipping the base class when there is none"""
+        # read back from the filter itself, however it was set
+        if not self.filterRegularExpression().pattern():
+            return True
         return super().filterAcceptsRow(row, parent)
 
     def setDateRange(self, since: QtCore.QDate, until: QtCore.QDate):
@@ -156,4 +166,18 @@ class SnapshotFilterModel(QtCore.QSortFilterProxyModel):
     def setMetaPVFilters(self, filters: list[dict]) -> None:
         """Set the filters that will be applied to the meta pv columns"""
         self.filters = filters
+        self._compiled_filters = [self._compile_filter(f) for f in filters]
         self.invalidateFilter()
+
+    def _compile_filter(self, meta_pv_filter: dict) -> tuple:
+        """
+        Resolve a filter's operator and parse its value once, so that
+        filterAcceptsRow does not repeat this work for every row
+        """
+        comparison_function = self.SUPPORTED_OPERATORS.get(meta_pv_filter["operator"])
+        input_value = meta_pv_filter["value"]
+        try:
+            input_float = float(input_value)
+        except (ValueError, TypeError):
+            input_float = None
+        return meta_pv_filter["column"], comparison_function, input_float, str(input_value)
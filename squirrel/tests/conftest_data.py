@@ -22,6 +22,22 @@ from squirrel.model import PV, EpicsData, Severity, Snapshot, Status
 from squirrel.type_hints import TagDef
 
 
+# uuid.UUID instances used by linac_with_comparison_snapshot, parsed once
+_COMPARISON_SNAPSHOT_UUID = UUID("8e0b1916-912a-457e-8ff9-4478b8018cec")
+_COMPARISON_LASR_IN20_VALUE_UUID = UUID("ef321662-f98e-4511-b9b0-6f2d8037c302")
+_COMPARISON_VAC_LI21_SETPOINT_UUID = UUID("e977f215-a7c9-4caf-8f91-d2783f3e4a88")
+_COMPARISON_VAC_LI21_READBACK_UUID = UUID("949a9837-95bd-4ca0-8dad-f478f57143dd")
+_COMPARISON_VAC_BSY_VALUE_UUID = UUID("b976bac4-d68b-45b0-a519-e0307a60b052")
+_COMPARISON_LASR_IN10_VALUE_UUID = UUID("21bf36a2-002c-49fe-a7c3-eade33d62dfd")
+_COMPARISON_VAC_LI10_VALUE_UUID = UUID("732cb745-482f-40a7-b83c-d7f2d4ed2305")
+_COMPARISON_VAC_GUNB_VALUE1_UUID = UUID("0e6c4d09-2a77-4ac2-b57a-fc9c049e9063")
+_COMPARISON_VAC_GUNB_VALUE2_UUID = UUID("d2a45d2b-bb7c-4ccb-a2e3-5e5a44c7dd30")
+_COMPARISON_MGNT_GUNB_VALUE_UUID = UUID("61c7ac48-77eb-430c-a86b-52c1267f8ef0")
+_COMPARISON_LASR_GUNB_VALUE1_UUID = UUID("4719d31c-62fc-490b-9729-7889f0b79df8")
+_COMPARISON_LASR_GUNB_VALUE2_UUID = UUID("bced6e63-f4f8-4ab5-9256-66a7da66b160")
+_COMPARISON_VAC_L0B_VALUE_UUID = UUID("de169754-cafd-4f38-9f26-cf92039e75d8")
+
+
 @dataclass
 class Root:
     """Convenience class for setting up test backends
@@ -447,7 +463,7 @@ def linac_with_comparison_snapshot() -> Root:
     snapshot.title = 'AD Comparison'
     snapshot.description = ('A snapshot with different values and statuses to compare '
                             'to the "standard" snapshot')
-    snapshot.uuid = UUID("8e0b1916-912a-457e-8ff9-4478b8018cec")
+    snapshot.uuid = _COMPARISON_SNAPSHOT_UUID
 
     (
         lasr_gunb_value1,
@@ -464,36 +480,36 @@ def linac_with_comparison_snapshot() -> Root:
         vac_li21_setpoint
     ) = snapshot.pvs
 
-    lasr_in20_value.uuid = UUID('ef321662-f98e-4511-b9b0-6f2d8037c302')
+    lasr_in20_value.uuid = _COMPARISON_LASR_IN20_VALUE_UUID
     lasr_in20_value.data = -1
     lasr_in20_value.severity = Severity.MAJOR
 
-    vac_li21_setpoint.uuid = UUID('e977f215-a7c9-4caf-8f91-d2783f3e4a88')
+    vac_li21_setpoint.uuid = _COMPARISON_VAC_LI21_SETPOINT_UUID
     vac_li21_setpoint.data = 0.0
     vac_li21_setpoint.severity = Severity.MINOR
-    vac_li21_readback.uuid = UUID('949a9837-95bd-4ca0-8dad-f478f57143dd')
+    vac_li21_readback.uuid = _COMPARISON_VAC_LI21_READBACK_UUID
 
-    vac_bsy_value.uuid = UUID('b976bac4-d68b-45b0-a519-e0307a60b052')
+    vac_bsy_value.uuid = _COMPARISON_VAC_BSY_VALUE_UUID
     vac_bsy_value.data = "lasdjfjasldfj"
 
-    lasr_in10_value.uuid = UUID('21bf36a2-002c-49fe-a7c3-eade33d62dfd')
+    lasr_in10_value.uuid = _COMPARISON_LASR_IN10_VALUE_UUID
     lasr_in10_value.data = 640.68
     lasr_in10_value.status = Status.CALC
 
-    vac_li10_value.uuid = UUID('732cb745-482f-40a7-b83c-d7f2d4ed2305')
+    vac_li10_value.uuid = _COMPARISON_VAC_LI10_VALUE_UUID
     vac_li10_value.data = .27
 
-    vac_gunb_value1.uuid = UUID('0e6c4d09-2a77-4ac2-b57a-fc9c049e9063')
-    vac_gunb_value2.uuid = UUID('d2a45d2b-bb7c-4ccb-a2e3-5e5a44c7dd30')
+    vac_gunb_value1.uuid = _COMPARISON_VAC_GUNB_VALUE1_UUID
+    vac_gunb_value2.uuid = _COMPARISON_VAC_GUNB_VALUE2_UUID
     vac_gunb_value2.data = True
 
-    mgnt_gunb_value.uuid = UUID('61c7ac48-77eb-430c-a86b-52c1267f8ef0')
+    mgnt_gunb_value.uuid = _COMPARISON_MGNT_GUNB_VALUE_UUID
 
-    lasr_gunb_value1.uuid = UUID('4719d31c-62fc-490b-9729-7889f0b79df8')
+    lasr_gunb_value1.uuid = _COMPARISON_LASR_GUNB_VALUE1_UUID
     lasr_gunb_value1.severity = Severity.INVALID
-    lasr_gunb_value2.uuid = UUID('bced6e63-f4f8-4ab5-9256-66a7da66b160')
+    lasr_gunb_value2.uuid = _COMPARISON_LASR_GUNB_VALUE2_UUID
 
-    vac_l0b_value.uuid = UUID('de169754-cafd-4f38-9f26-cf92039e75d8')
+    vac_l0b_value.uuid = _COMPARISON_VAC_L0B_VALUE_UUID
     vac_l0b_value.data = -15
     vac_l0b_value.severity = Severity.MINOR
 
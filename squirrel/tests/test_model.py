@@ -0,0 +1,34 @@
+import copy
+
+from squirrel.model import PV, EpicsData, Snapshot
+
+
+def test_deepcopy_copies_mutable_values():
+    """Verify that copies share no mutable state with the original"""
+    epics_data = EpicsData(data=[1, 2, 3], enums=["OUT", "IN"])
+    pv = PV(setpoint="MY:ARRAY", setpoint_data=epics_data, tags={0: {1}})
+    snapshot = Snapshot(title="copy test", pvs=[pv, pv])
+
+    copied = copy.deepcopy(snapshot)
+    assert copied == snapshot
+    copied_pv = copied.pvs[0]
+    assert copied_pv is not pv
+    # shared references are preserved within the copy
+    assert copied.pvs[1] is copied_pv
+
+    copied_pv.setpoint_data.data.append(4)
+    copied_pv.setpoint_data.enums.append("UNKNOWN")
+    copied_pv.tags[0].add(2)
+    assert epics_data.data == [1, 2, 3]
+    assert epics_data.enums == ["OUT", "IN"]
+    assert pv.tags == {0: {1}}
+
+
+def test_deepcopy_copies_extra_attributes():
+    """Verify that attributes set outside the dataclass fields are copied too"""
+    pv = PV(setpoint="MY:ARRAY")
+    pv.data = [1, 2, 3]
+
+    copied = copy.deepcopy(pv)
+    assert copied.data == pv.data
+    assert copied.data is not pv.data
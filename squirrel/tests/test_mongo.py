@@ -0,0 +1,193 @@
+import json
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import pytest
+import requests
+
+from squirrel.backends import MongoBackend, SearchTerm
+from squirrel.backends.mongo import TAG_FETCH_WORKERS
+from squirrel.errors import BackendError
+from squirrel.model import PV
+
+ADDRESS = "http://mongo.test"
+
+TAG_GROUPS = [
+    {
+        "id": 0, "name": "Dest", "description": "Which endpoint the beam is directed to",
+        "tags": [{"id": 0, "name": "SXR"}, {"id": 1, "name": "HXR"}],
+    },
+    {"id": 1, "name": "Area", "description": "The area the PV lives in"},
+    {"id": 2, "name": "Subsystem", "description": "The subsystem the PV belongs to"},
+]
+PVS = [
+    {
+        "id": "5ec33c7b-79a1-4bd9-9b5e-6e1e1a0e2c1f", "setpointAddress": "MY:SETPOINT",
+        "readbackAddress": "MY:READBACK", "description": "", "tags": [{"id": 2}],
+        "absTolerance": None, "relTolerance": None,
+        "createdDate": "2024-05-10T16:49:34.574849",
+    },
+    {
+        "id": "0b0e3a8e-58a5-4a2e-bb5e-1b7cbb9f6d6a", "setpointAddress": "MY:OTHER",
+        "description": "", "tags": [], "absTolerance": None, "relTolerance": None,
+        "createdDate": "2024-05-10T16:49:34.574911",
+    },
+]
+TAG_GROUP_DETAILS = {
+    1: {"description": "The area the PV lives in", "tags": [{"id": 2, "name": "GUNB"}]},
+    2: {"description": "The subsystem the PV belongs to", "tags": [{"id": 3, "name": "Laser"}]},
+}
+
+
+def make_response(
+    method: str,
+    url: str,
+    status: int = 200,
+    payload: Any = None,
+    message: str = "",
+) -> requests.Response:
+    """Build a response as the backend would send it"""
+    response = requests.Response()
+    response.status_code = status
+    response.reason = "OK" if status < 400 else "Error"
+    response.url = url
+    response.request = requests.Request(method, url).prepare()
+    body = {"errorMessage": message} if message else {"payload": payload}
+    response._content = json.dumps(body).encode()
+    return response
+
+
+class FakeServer:
+    """
+    Stands in for Session.request, answering from ``routes`` and recording
+    every request made along with the thread and session that made it
+    """
+    def __init__(self, routes: Dict[Tuple[str, str], Tuple[int, Any, str]]):
+        self.routes = routes
+        self.calls: List[Tuple[str, str, Optional[dict]]] = []
+        self.sessions: Dict[int, set] = {}
+        self._lock = threading.Lock()
+
+    def request(self, session: requests.Session, method: str, url: str, **kwargs):
+        path = urlsplit(url).path
+        with self._lock:
+            self.calls.append((method, path, kwargs.get("params")))
+            self.sessions.setdefault(id(session), set()).add(threading.get_ident())
+        status, payload, message = self.routes.get((method, path), (404, None, "not found"))
+        return make_response(method, url, status=status, payload=payload, message=message)
+
+    def paths(self, method: str = "GET") -> List[str]:
+        return [path for meth, path, _ in self.calls if meth == method]
+
+
+@pytest.fixture
+def fake_server(monkeypatch: pytest.MonkeyPatch) -> FakeServer:
+    server = FakeServer({
+        ("GET", "/v1/tags"): (200, TAG_GROUPS, ""),
+        ("GET", "/v1/tags/1"): (200, [TAG_GROUP_DETAILS[1]], ""),
+        ("GET", "/v1/tags/2"): (200, [TAG_GROUP_DETAILS[2]], ""),
+        ("GET", "/v1/pvs"): (200, PVS, ""),
+    })
+    monkeypatch.setattr(requests.Session, "request", server.request)
+    return server
+
+
+def test_request_error(fake_server: FakeServer):
+    fake_server.routes[("POST", "/v1/tags")] = (400, None, "tag group already exists")
+    backend = MongoBackend(ADDRESS)
+    with pytest.raises(BackendError, match="tag group already exists"):
+        backend.add_tag_group("Dest", "")
+    assert fake_server.calls == [("POST", "/v1/tags", None)]
+
+
+def test_cached_tags(fake_server: FakeServer):
+    backend = MongoBackend(ADDRESS)
+    tag_def = backend.get_tags()
+    assert tag_def == {
+        0: ["Dest", "Which endpoint the beam is directed to", {0: "SXR", 1: "HXR"}],
+        1: ["Area", "The area the PV lives in", {2: "GUNB"}],
+        2: ["Subsystem", "The subsystem the PV belongs to", {3: "Laser"}],
+    }
+    assert backend._cached_tags()[2] == {0: 0, 1: 0, 2: 1, 3: 2}
+    # only groups listed without their tags are fetched separately
+    assert sorted(fake_server.paths()) == ["/v1/tags", "/v1/tags/1", "/v1/tags/2"]
+
+    # served from the cache until it expires
+    assert backend.get_tags() == tag_def
+    assert len(fake_server.calls) == 3
+
+
+def test_tag_cache_invalidated(fake_server: FakeServer):
+    fake_server.routes[("POST", "/v1/tags")] = (200, {"id": 3}, "")
+    fake_server.routes[("DELETE", "/v1/tags/3")] = (200, None, "")
+    backend = MongoBackend(ADDRESS)
+    backend.get_tags()
+    assert fake_server.paths().count("/v1/tags") == 1
+
+    assert backend.add_tag_group("Beamline", "") == 3
+    backend.get_tags()
+    assert fake_server.paths().count("/v1/tags") == 2
+
+    backend.delete_tag_group(3)
+    backend.get_tags()
+    assert fake_server.paths().count("/v1/tags") == 3
+
+    # each backend keeps its own cache
+    MongoBackend(ADDRESS).get_tags()
+    assert fake_server.paths().count("/v1/tags") == 4
+
+
+def test_cached_tags_failed_group(fake_server: FakeServer):
+    fake_server.routes[("GET", "/v1/tags/2")] = (500, None, "internal error")
+    backend = MongoBackend(ADDRESS)
+    assert list(backend.get_tags()) == [0, 1]
+
+
+def test_session_shared_by_tag_fetches(fake_server: FakeServer):
+    backend = MongoBackend(ADDRESS)
+    backend.get_tags()
+    backend.search(SearchTerm("entry_type", "eq", PV))
+    # concurrent tag group fetches reuse the backend's connection pool
+    assert list(fake_server.sessions) == [id(backend._session)]
+    adapter = backend._session.get_adapter(ADDRESS)
+    assert adapter._pool_maxsize == TAG_FETCH_WORKERS
+
+
+def test_server_filter():
+    terms = [
+        SearchTerm("entry_type", "eq", PV),
+        SearchTerm("readback", "eq", "MY:READBACK"),
+        SearchTerm("setpoint", "like", "MY:"),
+        SearchTerm("setpoint", "eq", "MY:SETPOINT"),
+    ]
+    assert MongoBackend._server_filter(terms, ("setpoint",)) == "MY:SETPOINT"
+    assert MongoBackend._server_filter(terms[:3], ("setpoint",)) == ""
+    assert MongoBackend._server_filter(terms, ("title",)) == ""
+
+
+def test_search_pushes_setpoint(fake_server: FakeServer):
+    backend = MongoBackend(ADDRESS)
+    results = backend.search(
+        SearchTerm("entry_type", "eq", PV), SearchTerm("setpoint", "eq", "MY:SETPOINT")
+    )
+    assert [pv.setpoint for pv in results] == ["MY:SETPOINT"]
+    assert ("GET", "/v1/pvs", {"pvName": "MY:SETPOINT"}) in fake_server.calls
+
+
+def test_search_readback(fake_server: FakeServer):
+    backend = MongoBackend(ADDRESS)
+    results = backend.search(
+        SearchTerm("entry_type", "eq", PV), SearchTerm("readback", "eq", "MY:READBACK")
+    )
+    assert [pv.readback for pv in results] == ["MY:READBACK"]
+    assert results[0].tags == {1: {2}}
+    # readbacks are not sent as a server-side filter
+    assert ("GET", "/v1/pvs", None) in fake_server.calls
+
+
+def test_search_failed_comparison(fake_server: FakeServer):
+    backend = MongoBackend(ADDRESS)
+    # comparing tags against a non-dict target raises AttributeError for tagged PVs
+    results = backend.search(SearchTerm("entry_type", "eq", PV), SearchTerm("tags", "lt", 5))
+    assert [pv.setpoint for pv in results] == ["MY:OTHER"]
@@ -1,12 +1,17 @@
 """Largely smoke tests for various pages"""
 
+from unittest.mock import MagicMock
+from uuid import uuid4
+
 import pytest
-from qtpy import QtCore
+from qtpy import QtCore, QtWidgets
 
 from squirrel.backends import TestBackend
 from squirrel.client import Client
-from squirrel.model import Snapshot
-from squirrel.pages import SnapshotComparisonPage, SnapshotDetailsPage
+from squirrel.model import PV, EpicsData, Snapshot
+from squirrel.pages import (PVBrowserPage, SnapshotComparisonPage,
+                            SnapshotDetailsPage)
+from squirrel.pages.pv_browser import _copy_csv_rows, _parse_csv_cached
 from squirrel.tables import COMPARE_HEADER, PV_HEADER
 from squirrel.tests.conftest import setup_test_stack
 
@@ -128,3 +133,119 @@ def test_snapshot_comparison_page_set_both(
             actual_row.append(compare_model.data(index, QtCore.Qt.DisplayRole))
         actual_data.append(actual_row)
     assert actual_data == expected_data
+
+
+@setup_test_stack(sources=["sample_database"], backend_type=TestBackend)
+def test_snapshot_comparison_check_state_survives_collate(
+    qtbot,
+    test_client: Client,
+    simple_snapshot_fixture: Snapshot,
+    simple_comparison_snapshot_fixture: Snapshot
+):
+    simple_snapshot_fixture.uuid = uuid4()
+    simple_comparison_snapshot_fixture.uuid = uuid4()
+    test_client.backend.add_snapshot(simple_snapshot_fixture)
+    test_client.backend.add_snapshot(simple_comparison_snapshot_fixture)
+
+    page = SnapshotComparisonPage(client=test_client)
+    qtbot.add_widget(page)
+    page.set_main_snapshot(simple_snapshot_fixture)
+    page.set_comparison_snapshot(simple_comparison_snapshot_fixture)
+
+    compare_model = page.comparison_table_model
+    checkbox_index = compare_model.index(1, COMPARE_HEADER.CHECKBOX.value)
+    pv_index = compare_model.index(1, COMPARE_HEADER.PV.value)
+    checked_pv = compare_model.data(pv_index, QtCore.Qt.DisplayRole)
+    compare_model.setData(checkbox_index, QtCore.Qt.Checked, QtCore.Qt.CheckStateRole)
+
+    # Swapping the snapshots reorders the rows, but the same PV stays checked
+    page.set_main_snapshot(simple_comparison_snapshot_fixture)
+    page.set_comparison_snapshot(simple_snapshot_fixture)
+    for row in range(compare_model.rowCount()):
+        pv_name = compare_model.data(compare_model.index(row, COMPARE_HEADER.PV.value), QtCore.Qt.DisplayRole)
+        check_state = compare_model.data(
+            compare_model.index(row, COMPARE_HEADER.CHECKBOX.value),
+            QtCore.Qt.CheckStateRole,
+        )
+        assert (check_state == QtCore.Qt.Checked) == (pv_name == checked_pv)
+
+
+@setup_test_stack(sources=["sample_database"], backend_type=TestBackend)
+def test_snapshot_comparison_mismatch_background(qtbot, test_client: Client):
+    main_snapshot = Snapshot(uuid=uuid4(), title="main")
+    main_snapshot.pvs.append(PV(setpoint="MY:FLOAT", setpoint_data=EpicsData(data=1.0)))
+    main_snapshot.pvs.append(PV(setpoint="MY:INT", setpoint_data=EpicsData(data=1)))
+    comparison_snapshot = Snapshot(uuid=uuid4(), title="comparison")
+    comparison_snapshot.pvs.append(PV(setpoint="MY:FLOAT", setpoint_data=EpicsData(data=1.0 + 1e-12)))
+    comparison_snapshot.pvs.append(PV(setpoint="MY:INT", setpoint_data=EpicsData(data=2)))
+    test_client.backend.add_snapshot(main_snapshot)
+    test_client.backend.add_snapshot(comparison_snapshot)
+
+    page = SnapshotComparisonPage(client=test_client)
+    qtbot.add_widget(page)
+    page.set_main_snapshot(main_snapshot)
+    page.set_comparison_snapshot(comparison_snapshot)
+
+    compare_model = page.comparison_table_model
+    column = COMPARE_HEADER.COMPARE_SETPOINT.value
+    assert compare_model.data(compare_model.index(0, column), QtCore.Qt.BackgroundRole) is None
+    assert compare_model.data(compare_model.index(1, column), QtCore.Qt.BackgroundRole) is not None
+
+
+@setup_test_stack(sources=["sample_database"], backend_type=TestBackend)
+def test_snapshot_comparison_check_changes_coalesced(
+    qtbot,
+    test_client: Client,
+    simple_snapshot_fixture: Snapshot,
+    simple_comparison_snapshot_fixture: Snapshot
+):
+    simple_snapshot_fixture.uuid = uuid4()
+    simple_comparison_snapshot_fixture.uuid = uuid4()
+    test_client.backend.add_snapshot(simple_snapshot_fixture)
+    test_client.backend.add_snapshot(simple_comparison_snapshot_fixture)
+
+    page = SnapshotComparisonPage(client=test_client)
+    qtbot.add_widget(page)
+    page.set_main_snapshot(simple_snapshot_fixture)
+    page.set_comparison_snapshot(simple_comparison_snapshot_fixture)
+
+    compare_model = page.comparison_table_model
+    emitted = []
+    compare_model.dataChanged.connect(lambda top_left, bottom_right, roles: emitted.append(
+        (top_left.row(), bottom_right.row())
+    ))
+    for row in range(compare_model.rowCount()):
+        checkbox_index = compare_model.index(row, COMPARE_HEADER.CHECKBOX.value)
+        assert compare_model.setData(checkbox_index, QtCore.Qt.Checked, QtCore.Qt.CheckStateRole)
+    qtbot.waitUntil(lambda: len(emitted) > 0)
+    assert emitted == [(0, compare_model.rowCount() - 1)]
+
+
+def test_pv_browser_csv_rows_copied(tmp_path):
+    csv_path = tmp_path / "pvs.csv"
+    csv_path.write_text("Setpoint,Area\nMY:PV,\"GUNB, L0B\"\n", encoding="utf-8")
+    stat = csv_path.stat()
+
+    rows = _copy_csv_rows(_parse_csv_cached(str(csv_path), stat.st_mtime, stat.st_size))
+    rows[0]["Setpoint"] = "MY:EDITED"
+    rows[0]["groups"]["Area"].append("BSY")
+
+    # edits to the rows handed out leave the cached parse untouched
+    cached = _parse_csv_cached(str(csv_path), stat.st_mtime, stat.st_size)
+    assert cached[0]["Setpoint"] == "MY:PV"
+    assert cached[0]["groups"] == {"Area": ["GUNB", "L0B"]}
+
+
+def test_pv_browser_csv_missing(qtbot, test_client: Client, tmp_path, monkeypatch):
+    page = PVBrowserPage(test_client)
+    qtbot.addWidget(page)
+    missing = str(tmp_path / "missing.csv")
+    monkeypatch.setattr(
+        QtWidgets.QFileDialog, "getOpenFileName", MagicMock(return_value=(missing, ""))
+    )
+    critical = MagicMock()
+    monkeypatch.setattr(QtWidgets.QMessageBox, "critical", critical)
+
+    page.select_file()
+    critical.assert_called_once()
+    assert "missing.csv" in critical.call_args[0][2]
@@ -1,7 +1,8 @@
 from datetime import datetime
 from unittest.mock import Mock
 
-from qtpy import QtCore
+import pytest
+from qtpy import QtCore, QtGui
 
 from squirrel.model import PV, EpicsData
 from squirrel.tables import SnapshotFilterModel
@@ -65,3 +66,31 @@ def test_meta_pv_numeric_filter():
     ])
     assert filter_model.filterAcceptsRow(0, QtCore.QModelIndex())
     assert filter_model.filterAcceptsRow(1, QtCore.QModelIndex())
+
+
+@pytest.mark.parametrize("set_filter", [
+    lambda model: model.setFilterFixedString("alpha"),
+    lambda model: model.setFilterWildcard("*alpha*"),
+    lambda model: model.setFilterRegularExpression("alp.a"),
+])
+def test_title_search(set_filter):
+    """Verify that the title search applies however its pattern is set"""
+    source_model = QtGui.QStandardItemModel(0, 2)
+    source_model._data = []
+    for title in ("alpha", "beta"):
+        snapshot = Mock()
+        snapshot.creation_time = datetime(2025, 8, 4)
+        source_model._data.append(snapshot)
+        source_model.appendRow([QtGui.QStandardItem(""), QtGui.QStandardItem(title)])
+
+    filter_model = SnapshotFilterModel()
+    filter_model.setSourceModel(source_model)
+    filter_model.setDateRange(QtCore.QDate(2024, 1, 1), QtCore.QDate(2025, 12, 31))
+    assert filter_model.rowCount() == 2
+
+    set_filter(filter_model)
+    assert filter_model.rowCount() == 1
+    assert filter_model.index(0, 1).data() == "alpha"
+
+    filter_model.setFilterFixedString("")
+    assert filter_model.rowCount() == 2
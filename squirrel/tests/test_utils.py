@@ -2,7 +2,7 @@ import csv
 
 import pytest
 
-from squirrel.utils import parse_csv_to_dict
+from squirrel.utils import parse_csv_to_dict, parse_csv_to_dict_iter
 
 
 def write_csv(tmp_path, headers, rows, name="input.csv"):
@@ -72,3 +72,49 @@ def test_parse_csv_with_missing_or_bad_data(tmp_path):
     assert parsed_row["groups"]["Value1"] == []
     assert parsed_row["groups"]["Value2"] == []
     assert parsed_row["groups"]["Value3"] == []
+
+
+def test_parse_csv_iter_matches_list(tmp_path):
+    """The lazy parser yields the same rows as parse_csv_to_dict"""
+    headers = ["Setpoint", "Readback", "Area"]
+    rows = [
+        ["TEST:PV1", "", "IN20, GUNB"],
+        ["", "", "IN20"],
+        ["TEST:PV2", "TEST:PV2:RBV", "none"],
+    ]
+    path = write_csv(tmp_path, headers, rows)
+
+    rows_iter = parse_csv_to_dict_iter(str(path))
+    assert next(rows_iter)["Setpoint"] == "TEST:PV1"
+    assert list(rows_iter) == parse_csv_to_dict(str(path))[1:]
+
+
+def test_parse_csv_with_short_rows(tmp_path):
+    """Rows with fewer cells than the header leave the trailing columns empty"""
+    file_path = tmp_path / "short.csv"
+    file_path.write_text(" Setpoint ,Device,Area\nTEST:PV\n", encoding="utf-8")
+    output = parse_csv_to_dict(str(file_path))
+
+    assert output[0]["Setpoint"] == "TEST:PV"
+    assert output[0]["Device"] == ""
+    assert output[0]["groups"]["Area"] == []
+
+
+def test_parse_csv_trims_whitespace(tmp_path):
+    """Whitespace around cell values is removed"""
+    file_path = tmp_path / "spaces.csv"
+    file_path.write_text("Setpoint, Description\n  TEST:PV ,  Padded description  \n", encoding="utf-8")
+    output = parse_csv_to_dict(str(file_path))
+
+    assert output[0]["Setpoint"] == "TEST:PV"
+    assert output[0]["Description"] == "Padded description"
+
+
+def test_parse_csv_tabs_and_duplicate_columns(tmp_path):
+    """Tabs are trimmed like spaces, and the last of duplicate columns wins"""
+    file_path = tmp_path / "tabs.csv"
+    file_path.write_text("Setpoint,Description,Description\n\tTEST:PV\t,first,second\n", encoding="utf-8")
+    output = parse_csv_to_dict(str(file_path))
+
+    assert output[0]["Setpoint"] == "TEST:PV"
+    assert output[0]["Description"] == "second"
@@ -1,8 +1,11 @@
 import copy
+import time
 from typing import Any
 from unittest.mock import MagicMock
+from uuid import UUID, uuid4
 
 import apischema
+import numpy as np
 import pytest
 from pytestqt.qtbot import QtBot
 from qtpy import QtCore, QtWidgets
@@ -10,7 +13,9 @@ from qtpy import QtCore, QtWidgets
 from squirrel.client import Client
 from squirrel.model import PV, EpicsData, Severity, Snapshot, Status
 from squirrel.widgets import SquirrelTableView
-from squirrel.widgets.views import CustRoles, LivePVHeader, LivePVTableModel
+from squirrel.widgets.views import (CustRoles, LivePVHeader, LivePVTableModel,
+                                    ValueDelegate, _compute_mismatch,
+                                    _PVPollThread)
 
 
 @pytest.fixture(scope='function')
@@ -145,6 +150,50 @@ def test_pv_view_common_delegate_types(
     assert isinstance(edit_widget, widget_cls)
 
 
+def test_value_delegate_editor_pool(
+    pv_poll_model: LivePVTableModel,
+    qtbot: QtBot,
+):
+    window = QtWidgets.QWidget()
+    qtbot.addWidget(window)
+    parent = QtWidgets.QWidget(window)
+    pv_poll_model.entries[0].severity = Severity.MINOR
+    delegate = ValueDelegate()
+    option = QtWidgets.QStyleOptionViewItem()
+    name_index = pv_poll_model.index(0, LivePVHeader.PV_NAME)
+    sev_index = pv_poll_model.index(0, LivePVHeader.STORED_SEVERITY)
+
+    editor = delegate.createEditor(parent, option, name_index)
+    assert isinstance(editor, QtWidgets.QLineEdit)
+    sev_editor = delegate.createEditor(parent, option, sev_index)
+    assert sev_editor.count() == len(Severity)
+
+    # closed editors are reused, and refreshed for the new cell
+    delegate.destroyEditor(editor, name_index)
+    editor.setText("stale")
+    assert delegate.createEditor(parent, option, name_index) is editor
+    delegate.setEditorData(editor, name_index)
+    assert editor.text() == pv_poll_model.entries[0].setpoint
+
+    # the pool is per display type
+    assert delegate.createEditor(parent, option, sev_index) is not sev_editor
+    sev_editor.setCurrentIndex(Severity.MAJOR.value)
+    delegate.destroyEditor(sev_editor, sev_index)
+    assert delegate.createEditor(parent, option, sev_index) is sev_editor
+    # the previous cell's choice is not carried over
+    delegate.setEditorData(sev_editor, sev_index)
+    assert sev_editor.currentIndex() == Severity.MINOR.value
+    delegate.setModelData(sev_editor, pv_poll_model, sev_index)
+    assert pv_poll_model.entries[0].severity == Severity.MINOR
+
+    # editors deleted with their parent leave the pool
+    delegate.destroyEditor(editor, name_index)
+    parent.deleteLater()
+    QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+    assert not delegate._editor_types
+    assert not any(delegate._editor_pool.values())
+
+
 @pytest.mark.skip(reason="Rewrite to test table model")
 @pytest.mark.parametrize("row,input_data,", [
     (0, 0.1),
@@ -196,3 +245,330 @@ def test_stat_sev_enums(pv_table_view: SquirrelTableView):
     assert stat_delegate.count() == len(Status)
     for stat in Status:
         assert stat_delegate.itemText(stat.value).lower() == stat.name.lower()
+
+
+def test_pvmodel_data_changed_batch(
+    pv_poll_model: LivePVTableModel,
+    simple_snapshot_fixture: Snapshot,
+    qtbot: QtBot,
+):
+    pv_poll_model.set_entries(simple_snapshot_fixture.pvs)
+    emitted = []
+    pv_poll_model.dataChanged.connect(
+        lambda top_left, bottom_right, roles: emitted.append((top_left, bottom_right, roles))
+    )
+    # updates from several cycles are signaled together
+    pv_poll_model._data_changed(["MY:ENUM"])
+    pv_poll_model._data_changed(["MY:FLOAT", "MY:INT"])
+    pv_poll_model._data_changed(["MY:FLOAT"])
+    assert not emitted
+    qtbot.waitUntil(lambda: len(emitted) > 0)
+
+    assert len(emitted) == 1
+    top_left, bottom_right, roles = emitted[0]
+    assert (top_left.row(), bottom_right.row()) == (0, 2)
+    # only columns fed by live data are refreshed
+    assert top_left.column() == LivePVHeader.STORED_VALUE
+    assert bottom_right.column() == LivePVHeader.LIVE_SEVERITY
+    assert QtCore.Qt.BackgroundRole in roles
+
+
+def test_pvmodel_data_changed_runs(
+    pv_poll_model: LivePVTableModel,
+    simple_snapshot_fixture: Snapshot,
+    qtbot: QtBot,
+):
+    pv_poll_model.set_entries(simple_snapshot_fixture.pvs)
+    emitted = []
+    pv_poll_model.dataChanged.connect(
+        lambda top_left, bottom_right: emitted.append((top_left.row(), bottom_right.row()))
+    )
+    pv_poll_model._data_changed(["MY:ENUM", "MY:FLOAT"])
+    qtbot.waitUntil(lambda: len(emitted) > 0)
+
+    # one update per run of consecutive rows
+    assert emitted == [(0, 0), (2, 2)]
+
+
+def test_pvmodel_render_cache_invalidation(
+    pv_poll_model: LivePVTableModel,
+    simple_snapshot_fixture: Snapshot,
+):
+    pvs = simple_snapshot_fixture.pvs
+    pv_poll_model.set_entries(pvs)
+    index = pv_poll_model.index(1, LivePVHeader.PV_NAME)
+    assert pv_poll_model.data(index, QtCore.Qt.DisplayRole) == "MY:INT"
+
+    # only stored display text is cached, other cells are always current
+    pvs[1].setpoint = "MY:NEW:INT"
+    assert pv_poll_model.data(index, QtCore.Qt.DisplayRole) == "MY:NEW:INT"
+
+    status_index = pv_poll_model.index(1, LivePVHeader.STORED_STATUS)
+    assert pv_poll_model.data(status_index, QtCore.Qt.DisplayRole) == "--"
+    assert set(pv_poll_model._render_cache) == {1}
+
+    # cached text is dropped once the row is reported as changed
+    pvs[1].status = Status.HIHI
+    pv_poll_model.dataChanged.emit(status_index, status_index)
+    assert pv_poll_model.data(status_index, QtCore.Qt.DisplayRole) == "HIHI"
+
+    # or when a different entry is held at the row
+    replacement = copy.deepcopy(pvs[1])
+    replacement.status = Status.LOLO
+    pv_poll_model.entries[1] = replacement
+    assert pv_poll_model.data(status_index, QtCore.Qt.DisplayRole) == "LOLO"
+
+
+def test_pvmodel_hydrates_uuid_entries(
+    pv_poll_model: LivePVTableModel,
+    setpoint_with_readback_fixture: PV,
+    qtbot: QtBot,
+):
+    pv_poll_model.client.backend = MagicMock()
+    pv_poll_model.client.backend.get_entry.return_value = setpoint_with_readback_fixture
+    pv_poll_model.set_entries([UUID(setpoint_with_readback_fixture.uuid)])
+
+    index = pv_poll_model.index(0, LivePVHeader.PV_NAME)
+    assert pv_poll_model.data(index, QtCore.Qt.DisplayRole) == "loading..."
+    qtbot.wait_until(
+        lambda: pv_poll_model.data(index, QtCore.Qt.DisplayRole) == setpoint_with_readback_fixture.setpoint
+    )
+    assert pv_poll_model.entries == [setpoint_with_readback_fixture]
+    pv_poll_model.client.backend.get_entry.assert_called_once()
+
+    # replacing the entries drops the thread's cache, so the entry is fetched again
+    pv_poll_model.set_entries([UUID(setpoint_with_readback_fixture.uuid)])
+    pv_poll_model.data(index, QtCore.Qt.DisplayRole)
+    pv_poll_model.data(index, QtCore.Qt.EditRole)
+    qtbot.wait_until(lambda: pv_poll_model.entries == [setpoint_with_readback_fixture])
+    assert pv_poll_model.client.backend.get_entry.call_count == 2
+    pv_poll_model.close()
+
+
+def test_pvmodel_is_close_vectorized(
+    pv_poll_model: LivePVTableModel,
+    simple_snapshot_fixture: Snapshot,
+):
+    pvs = simple_snapshot_fixture.pvs
+    pvs[0].data = 0.5
+    pvs[1].data = 1
+    pvs[2].data = 1
+    pv_poll_model.set_entries(pvs)
+    pv_poll_model._data_cache.update({
+        "MY:FLOAT": EpicsData(data=0.5 + 1e-12),
+        "MY:INT": EpicsData(data=2),
+        "MY:ENUM": EpicsData(data=1, enums=["OUT", "IN"]),
+    })
+    pv_poll_model._data_changed(["MY:FLOAT", "MY:INT", "MY:ENUM"])
+
+    # numeric rows are compared up front, enums fall back to the scalar path
+    assert list(pv_poll_model._comparable) == [True, True, False]
+    np.testing.assert_array_equal(pv_poll_model._stored_data[:2], [0.5, 1.0])
+    np.testing.assert_array_equal(pv_poll_model._live_data[:2], [0.5 + 1e-12, 2.0])
+    assert pv_poll_model.is_close(pvs[0], pvs[0].data)
+    assert not pv_poll_model.is_close(pvs[1], pvs[1].data)
+    assert pv_poll_model.is_close(pvs[2], pvs[2].data)
+
+    # other values, or entries not in the model, are compared directly
+    assert pv_poll_model.is_close(pvs[1], 2)
+    assert not pv_poll_model.is_close(pvs[0], 1.5)
+    assert not pv_poll_model.is_close(copy.deepcopy(pvs[0]), 1.5)
+
+
+def test_pvmodel_set_data_updates_mismatch(
+    pv_poll_model: LivePVTableModel,
+    simple_snapshot_fixture: Snapshot,
+):
+    pvs = simple_snapshot_fixture.pvs
+    pvs[0].data = 0.5
+    pv_poll_model.set_entries(pvs)
+    pv_poll_model._data_cache["MY:FLOAT"] = EpicsData(data=1.5)
+    pv_poll_model._data_changed(["MY:FLOAT"])
+    assert not pv_poll_model.is_close(pvs[0], pvs[0].data)
+
+    index = pv_poll_model.index(0, LivePVHeader.STORED_VALUE)
+    assert pv_poll_model.setData(index, 1.5, QtCore.Qt.EditRole)
+    assert pv_poll_model._stored_data[0] == 1.5
+    assert pv_poll_model.is_close(pvs[0], pvs[0].data)
+
+    # a new setpoint is mapped and polled
+    index = pv_poll_model.index(0, LivePVHeader.PV_NAME)
+    assert pv_poll_model.setData(index, "MY:NEW:FLOAT", QtCore.Qt.EditRole)
+    assert pv_poll_model._addr_to_row["MY:NEW:FLOAT"] == [0]
+    assert "MY:NEW:FLOAT" in pv_poll_model._data_cache
+
+
+def test_set_data_signals_single_cell(pv_poll_model: LivePVTableModel):
+    layout_changes = []
+    changes = []
+    pv_poll_model.layoutChanged.connect(lambda *args: layout_changes.append(args))
+    pv_poll_model.dataChanged.connect(
+        lambda top_left, bottom_right, roles: changes.append((top_left, bottom_right, roles))
+    )
+
+    index = pv_poll_model.index(0, LivePVHeader.PV_NAME)
+    assert pv_poll_model.setData(index, "MY:NEW:PV", QtCore.Qt.EditRole)
+    assert pv_poll_model.entries[0].setpoint == "MY:NEW:PV"
+
+    assert not layout_changes
+    assert len(changes) == 1
+    top_left, bottom_right, roles = changes[0]
+    assert top_left == bottom_right == index
+    assert roles == [QtCore.Qt.EditRole]
+
+
+def test_pvmodel_data_constants(
+    pv_poll_model: LivePVTableModel,
+    simple_snapshot_fixture: Snapshot,
+):
+    pvs = simple_snapshot_fixture.pvs
+    pvs[0].data = 0.5
+    pv_poll_model.set_entries(pvs)
+    pv_poll_model._data_cache["MY:FLOAT"] = EpicsData(data=1.5)
+    pv_poll_model._data_changed(["MY:FLOAT"])
+
+    live_index = pv_poll_model.index(0, LivePVHeader.LIVE_VALUE)
+    assert pv_poll_model.data(live_index, QtCore.Qt.BackgroundRole) is LivePVTableModel._RED
+    assert pv_poll_model.data(live_index, QtCore.Qt.ToolTipRole) is None
+
+    ts_index = pv_poll_model.index(0, LivePVHeader.TIMESTAMP)
+    assert pv_poll_model.data(ts_index, QtCore.Qt.DisplayRole) == (
+        pvs[0].creation_time.strftime('%Y/%m/%d %H:%M')
+    )
+
+
+def test_pvmodel_get_cache_data(pv_poll_model: LivePVTableModel):
+    poll_thread = pv_poll_model._poll_thread
+    pv_poll_model._poll_thread = MagicMock(data_version=0)
+    assert pv_poll_model.get_cache_data("MY:NEW:PV") == "fetching..."
+    assert "MY:NEW:PV" in pv_poll_model._data_cache
+    assert pv_poll_model._poll_thread.data_version == 1
+
+    # known addresses don't disturb the polling thread
+    assert pv_poll_model.get_cache_data("MY:NEW:PV") == "fetching..."
+    assert pv_poll_model._poll_thread.data_version == 1
+
+    data = EpicsData(data=1)
+    pv_poll_model._data_cache["MY:NEW:PV"] = data
+    assert pv_poll_model.get_cache_data("MY:NEW:PV") is data
+    pv_poll_model._poll_thread = poll_thread
+
+
+def test_compute_mismatch_matches_isclose():
+    stored = np.array([0.5, 1.0, 1e10, np.inf, np.inf, np.nan, 0.0])
+    live = np.array([0.5 + 1e-12, 2.0, 1e10 + 1.0, np.inf, -np.inf, np.nan, 1e-9])
+    np.testing.assert_array_equal(
+        _compute_mismatch(stored, live),
+        ~np.isclose(live, stored),
+    )
+
+
+def test_pvmodel_add_remove_entry(
+    pv_poll_model: LivePVTableModel,
+    simple_snapshot_fixture: Snapshot,
+    qtbot: QtBot,
+):
+    pvs = simple_snapshot_fixture.pvs
+    pv_poll_model.set_entries(pvs[:2])
+
+    with qtbot.waitSignal(pv_poll_model.rowsInserted):
+        pv_poll_model.add_entry(pvs[2])
+    assert pv_poll_model.rowCount() == 3
+    assert pv_poll_model._addr_to_row["MY:ENUM"] == [2]
+
+    with qtbot.waitSignal(pv_poll_model.rowsRemoved):
+        pv_poll_model.remove_entry(pvs[0])
+    assert pv_poll_model.rowCount() == 2
+    assert "MY:FLOAT" not in pv_poll_model._data_cache
+    assert pv_poll_model._addr_to_row["MY:ENUM"] == [1]
+
+
+def test_pvmodel_shared_address(
+    pv_poll_model: LivePVTableModel,
+    simple_snapshot_fixture: Snapshot,
+    qtbot: QtBot,
+):
+    pvs = simple_snapshot_fixture.pvs
+    shared = copy.deepcopy(pvs[0])
+    shared.uuid = uuid4()
+    pv_poll_model.set_entries([pvs[0], pvs[1], shared])
+    assert pv_poll_model._addr_to_row["MY:FLOAT"] == [0, 2]
+
+    emitted = []
+    pv_poll_model.dataChanged.connect(
+        lambda top_left, bottom_right: emitted.append((top_left.row(), bottom_right.row()))
+    )
+    pv_poll_model._data_changed(["MY:FLOAT"])
+    qtbot.waitUntil(lambda: len(emitted) > 0)
+    # every row reading the address is refreshed
+    assert emitted == [(0, 0), (2, 2)]
+
+    # the address is still polled for the remaining entry
+    pv_poll_model.remove_entry(pvs[0])
+    assert pv_poll_model._addr_to_row["MY:FLOAT"] == [1]
+    assert "MY:FLOAT" in pv_poll_model._data_cache
+
+
+def test_poll_thread_batched_get(test_client: Client, qtbot: QtBot):
+    new_data, unchanged_data = EpicsData(1), EpicsData(2)
+    test_client.cl.get = MagicMock(return_value=[new_data, unchanged_data])
+    thread = _PVPollThread(
+        client=test_client,
+        data={"MY:PV:1": None, "MY:PV:2": unchanged_data},
+        poll_period=0.0,
+    )
+    changed = []
+    thread.data_changed.connect(changed.append)
+
+    # single-shot mode, run synchronously in this thread
+    thread.run()
+
+    test_client.cl.get.assert_called_once_with(("MY:PV:1", "MY:PV:2"))
+    assert changed == [["MY:PV:1"]]
+    assert thread.data["MY:PV:1"] is new_data
+
+
+def test_poll_thread_addresses_follow_data_version(test_client: Client):
+    thread = _PVPollThread(client=test_client, data={"MY:PV:1": None}, poll_period=0.0)
+    assert thread._addresses() == ("MY:PV:1",)
+
+    # in-place additions are only picked up once the version is bumped
+    thread.data["MY:PV:2"] = None
+    assert thread._addresses() == ("MY:PV:1",)
+    thread.data_version += 1
+    assert thread._addresses() == ("MY:PV:1", "MY:PV:2")
+
+    # replacing the dict always refreshes the addresses
+    thread.data = {"MY:PV:3": None}
+    assert thread._addresses() == ("MY:PV:3",)
+
+
+def test_poll_thread_stop_interrupts_wait(test_client: Client, qtbot: QtBot):
+    test_client.cl.get = MagicMock(return_value=[])
+    thread = _PVPollThread(client=test_client, data={}, poll_period=60.0)
+    with qtbot.waitSignal(thread.data_ready):
+        thread.start()
+
+    t0 = time.monotonic()
+    thread.stop()
+    assert thread.wait(5000)
+    assert time.monotonic() - t0 < 5
+
+
+def test_poll_thread_batches_stop(test_client: Client):
+    thread = _PVPollThread(
+        client=test_client,
+        data={f"MY:PV:{i}": None for i in range(5)},
+        poll_period=1.0,
+    )
+    thread.batch_size = 2
+    thread.running = True
+
+    def get(addresses):
+        # stop requested during the first batch
+        thread.running = False
+        return [EpicsData(data=1) for _ in addresses]
+
+    test_client.cl.get = MagicMock(side_effect=get)
+    thread.run()
+    test_client.cl.get.assert_called_once_with(("MY:PV:0", "MY:PV:1"))
@@ -8,7 +8,7 @@ from squirrel.backends import TestBackend
 from squirrel.client import Client
 from squirrel.color import LIVE_SETPOINT_HIGHLIGHT
 from squirrel.model import EpicsData, Snapshot
-from squirrel.tables import PVTableModel
+from squirrel.tables import PVTableFilterProxyModel, PVTableModel
 from squirrel.tests.conftest import setup_test_stack
 from squirrel.widgets import TagsWidget
 
@@ -87,6 +87,20 @@ def test_pv_table_model(qtmodeltester, pv_table_model: PVTableModel):
     qtmodeltester.check(pv_table_model, force_py=True)
 
 
+def test_pv_table_filter(pv_table_model: PVTableModel):
+    proxy = PVTableFilterProxyModel()
+    proxy.setSourceModel(pv_table_model)
+    assert proxy.rowCount() == 3
+    assert pv_table_model.entry(1).setpoint == "MY:INT"
+
+    proxy.search_string = "my:int"
+    assert proxy.rowCount() == 1
+    assert proxy.mapToSource(proxy.index(0, 0)).row() == 1
+
+    proxy.search_string = ""
+    assert proxy.rowCount() == 3
+
+
 @pytest.mark.skip(reason="QThreads aren't behaving with mocked control layer methods")
 @setup_test_stack(sources=["sample_database"], backend_type=TestBackend)
 def test_pv_table_model_data(test_client, pv_table_model: PVTableModel):
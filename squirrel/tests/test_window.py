@@ -1,7 +1,7 @@
 
 import pytest
 from pytestqt.qtbot import QtBot
-from qtpy import QtWidgets
+from qtpy import QtCore, QtWidgets
 
 from squirrel.backends import TestBackend
 from squirrel.client import Client
@@ -28,6 +28,17 @@ def test_main_window(qtbot: QtBot, test_client: Client):
     qtbot.addWidget(window)
 
 
+@setup_test_stack(sources=["sample_database"], backend_type=TestBackend)
+def test_main_window_loads_client(qtbot: QtBot, test_client: Client, monkeypatch):
+    """Pass if the window loads the configured client when none is given"""
+    monkeypatch.setattr(Client, "from_config", lambda: test_client)
+    window = Window()
+    qtbot.addWidget(window)
+    # the client is available to the pages as soon as the window exists
+    assert window.client is test_client
+    assert window.view_snapshot_page in window.pages
+
+
 @pytest.mark.skip(reason="Needs a working snapshot table to test, plus refactor")
 @setup_test_stack(sources=["sample_database"], backend_type=TestBackend)
 def test_take_snapshot(qtbot, test_client):
@@ -50,6 +61,13 @@ def test_pv_browser_model(test_client):
     assert pv_browser_model.rowCount() == 4
     assert pv_browser_model.columnCount() == 5
 
+    index = pv_browser_model.index(1, 0)
+    entry = pv_browser_model.entry(1)
+    assert entry is pv_browser_model.data(index, QtCore.Qt.UserRole)
+    assert pv_browser_model.entry_tags(1) == {
+        group: frozenset(tags) for group, tags in entry.tags.items()
+    }
+
 
 @setup_test_stack(sources=["sample_database"], backend_type=TestBackend)
 def test_pv_browser_search(qtbot, test_client):
@@ -65,10 +83,10 @@ def test_pv_browser_search(qtbot, test_client):
 
     search_bar.setText("PREFIX")
     search_bar.textEdited.emit(search_bar.text())  # Simulate the editingFinished signal
-    assert pv_browser_filter.rowCount() == 3
+    qtbot.waitUntil(lambda: pv_browser_filter.rowCount() == 3)
     search_bar.setText("test_str")
     search_bar.textEdited.emit(search_bar.text())
-    assert pv_browser_filter.rowCount() == 0
+    qtbot.waitUntil(lambda: pv_browser_filter.rowCount() == 0)
 
 
 @setup_test_stack(sources=["sample_database"], backend_type=TestBackend)
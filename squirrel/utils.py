@@ -1,14 +1,19 @@
 import csv
 import os
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional
 
 SQUIRREL_SOURCE_PATH = Path(__file__).parent
 
+_UTC = timezone.utc
+
+_NULL_SENTINELS = frozenset(('nan', 'none', ''))
+
 
 def utcnow():
-    return datetime.now(timezone.utc)
+    return datetime.now(_UTC)
 
 
 def build_abs_path(basedir: str, path: str) -> str:
@@ -24,8 +29,12 @@ def build_abs_path(basedir: str, path: str) -> str:
     path : str
         The path to convert to absolute.
     """
-    path = os.path.expanduser(path)
-    path = os.path.expandvars(path)
+    # Only pay for expansion when the path could contain something to expand
+    path = os.fspath(path)
+    if path.startswith('~'):
+        path = os.path.expanduser(path)
+    if '$' in path or '%' in path:
+        path = os.path.expandvars(path)
     if not os.path.isabs(path):
         return os.path.abspath(os.path.join(basedir, path))
     return path
@@ -36,22 +45,49 @@ def parse_csv_to_dict(csv_file_path: str) -> List[Dict[str, Any]]:
     Parse CSV file representing PV data into a form that can be bulk-imported by
     the backend. Each row represents a PV and its associated meta-data.
     """
-    result = []
+    return list(parse_csv_to_dict_iter(csv_file_path))
+
+
+def parse_csv_to_dict_iter(csv_file_path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily parse the CSV file at ``csv_file_path``, yielding one row dict at a
+    time in the same form as ``parse_csv_to_dict``.  The file is only opened
+    once iteration starts, and stays open until the generator is exhausted or
+    closed.
+    """
     with open(csv_file_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        cleaned_headers = [h.strip() for h in reader.fieldnames if h and h.strip()]
-        if "Setpoint" not in cleaned_headers and "Readback" not in cleaned_headers:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        column_indices = {}
+        for index, name in enumerate(header):
+            name = name.strip()
+            if name:
+                # like csv.DictReader, the last of any duplicate columns wins
+                column_indices[name] = index
+        if "Setpoint" not in column_indices and "Readback" not in column_indices:
             raise ValueError("Header missing required columns \"Setpoint\" or \"Readback\"")
 
-        group_columns = [col for col in cleaned_headers if col not in ['Setpoint', 'Readback', 'Device', 'Description']]
+        setpoint_index = column_indices.get('Setpoint')
+        readback_index = column_indices.get('Readback')
+        device_index = column_indices.get('Device')
+        desc_index = column_indices.get('Description')
+        group_index_pairs = [
+            (name, index) for name, index in column_indices.items()
+            if name not in ['Setpoint', 'Readback', 'Device', 'Description']
+        ]
 
-        for row_num, row in enumerate(reader, start=2):
-            setpoint = row.get('Setpoint', '').strip()
-            readback = row.get('Readback', '').strip()
+        def cell(row: List[str], index: Optional[int]) -> str:
+            if index is None or index >= len(row):
+                return ''
+            return row[index]
+
+        for row in reader:
+            setpoint = cell(row, setpoint_index).strip()
+            readback = cell(row, readback_index).strip()
             if not (setpoint or readback):
                 continue
-            device = row.get('Device', '').strip()
-            desc_value = row.get('Description', '').strip()
+            device = cell(row, device_index).strip()
+            desc_value = cell(row, desc_index).strip()
 
             row_dict = {
                 'Setpoint': setpoint,
@@ -61,13 +97,21 @@ def parse_csv_to_dict(csv_file_path: str) -> List[Dict[str, Any]]:
                 'groups': {}
             }
 
-            for group_name in group_columns:
-                cell_value = row.get(group_name, '').strip()
-                if cell_value and cell_value.lower() not in ['nan', 'none']:
-                    values = [val.strip() for val in cell_value.split(',') if val.strip()]
-                    row_dict['groups'][group_name] = values
-                else:
-                    row_dict['groups'][group_name] = []
+            for group_name, group_index in group_index_pairs:
+                row_dict['groups'][group_name] = list(_parse_group_cell(cell(row, group_index)))
+
+            yield row_dict
+
 
-            result.append(row_dict)
-    return result
+@lru_cache(maxsize=1024)
+def _parse_group_cell(cell_value: str) -> tuple[str, ...]:
+    """
+    Split a comma separated group cell into its stripped values.  Group columns
+    repeat a handful of values over many rows, so results are cached.
+    """
+    cell_value = cell_value.strip()
+    if cell_value.lower() not in _NULL_SENTINELS:
+        if ',' not in cell_value:
+            return (cell_value,)
+        return tuple(val for val in map(str.strip, cell_value.split(',')) if val)
+    return ()
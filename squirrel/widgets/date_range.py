@@ -13,6 +13,10 @@ class DateRangeWidget(QtWidgets.QWidget):
 
         self.setLayout(QtWidgets.QVBoxLayout())
 
+        self._active_button = None
+        self._since_date = QtCore.QDate()
+        self._until_date = QtCore.QDate()
+
         self.since = QtWidgets.QPushButton()
         self.until = QtWidgets.QPushButton()
 
@@ -35,30 +39,39 @@ class DateRangeWidget(QtWidgets.QWidget):
         layout.addWidget(self.until)
         self.layout().addLayout(layout)
 
-        self.calendar = QtWidgets.QCalendarWidget()
-        self.calendar.setWindowModality(QtCore.Qt.ApplicationModal)
+        self.calendar = None
 
     @QtCore.Slot()
     def open_calendar(self):
-        target = self.sender()
-        try:
-            self.calendar.selectionChanged.disconnect()
-        except TypeError:
-            pass
-        self.calendar.selectionChanged.connect(
-            lambda: target.setText(self.calendar.selectedDate().toString(self.FORMAT))
-        )
-        self.calendar.selectionChanged.connect(self.calendar.hide)
-        self.calendar.selectionChanged.connect(self.emitRangeChanged)
+        self._active_button = self.sender()
+        if self.calendar is None:
+            self.calendar = QtWidgets.QCalendarWidget()
+            self.calendar.setWindowModality(QtCore.Qt.ApplicationModal)
+            self.calendar.selectionChanged.connect(self._on_date_selected)
         self.calendar.show()
 
+    @QtCore.Slot()
+    def _on_date_selected(self):
+        date = self.calendar.selectedDate()
+        if self._active_button is self.since:
+            self._since_date = date
+        elif self._active_button is self.until:
+            self._until_date = date
+        if self._active_button is not None:
+            self._active_button.setText(date.toString(self.FORMAT))
+        self.calendar.hide()
+        self.emitRangeChanged()
+
     def emitRangeChanged(self):
-        self.rangeChanged.emit(
-            QtCore.QDate.fromString(self.since.text(), self.FORMAT),
-            QtCore.QDate.fromString(self.until.text(), self.FORMAT)
-        )
+        self.rangeChanged.emit(self._since_date, self._until_date)
 
     def setRange(self, since: QtCore.QDate, until: QtCore.QDate):
+        """Set both dates, emitting rangeChanged right away if the range changed.
+        Setting the current range again does not make listeners re-filter."""
+        changed = since != self._since_date or until != self._until_date
+        self._since_date = QtCore.QDate(since)
+        self._until_date = QtCore.QDate(until)
         self.since.setText(since.toString(self.FORMAT))
         self.until.setText(until.toString(self.FORMAT))
-        self.emitRangeChanged()
+        if changed:
+            self.emitRangeChanged()
@@ -11,21 +11,48 @@ class FilterRow(QtWidgets.QWidget):
         The columns to apply filters to. Names can be dynamic, multiple filters can be applied to each.
     parent : QtWidgets.QWidget | None
         The parent widget of this object.
+    column_model : QtCore.QAbstractItemModel | None
+        A model holding the column names, shared between rows instead of
+        filling each row's dropdown from column_names.
+    operator_model : QtCore.QAbstractItemModel | None
+        A model holding the OPERATORS, shared between rows in the same way.
     """
 
+    OPERATORS = ["=", "!=", "<", "<=", ">", ">="]
+
     filter_changed = QtCore.Signal()
     filter_removed = QtCore.Signal(QtWidgets.QWidget)
 
-    def __init__(self, column_names: list[str], parent : QtWidgets.QWidget | None = None):
+    def __init__(
+        self,
+        column_names: list[str],
+        parent : QtWidgets.QWidget | None = None,
+        column_model: QtCore.QAbstractItemModel | None = None,
+        operator_model: QtCore.QAbstractItemModel | None = None,
+    ):
         super().__init__(parent)
         layout = QtWidgets.QHBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
 
         self.column_dropdown = QtWidgets.QComboBox()
-        self.column_dropdown.addItems(column_names)
+        if column_model is None:
+            self.column_dropdown.addItems(column_names)
+        else:
+            self.column_dropdown.setModel(column_model)
+        # lay out long column lists in batches, with every item the same size
+        column_view = self.column_dropdown.view()
+        column_view.setUniformItemSizes(True)
+        column_view.setLayoutMode(QtWidgets.QListView.Batched)
+        column_view.setBatchSize(50)
+        # show long column lists in a scrollable popup, styling only this
+        # dropdown so combo boxes elsewhere keep their native popup
+        self.column_dropdown.setStyleSheet("QComboBox { combobox-popup: 0; }")
 
         self.operator_dropdown = QtWidgets.QComboBox()
-        self.operator_dropdown.addItems(["=", "!=", "<", "<=", ">", ">="])
+        if operator_model is None:
+            self.operator_dropdown.addItems(self.OPERATORS)
+        else:
+            self.operator_dropdown.setModel(operator_model)
 
         # The value the user types to compare against
         self.input_value = QtWidgets.QLineEdit()
@@ -71,6 +98,9 @@ class FilterBar(QtWidgets.QWidget):
     def __init__(self, column_names: list[str], parent : QtWidgets.QWidget | None = None):
         super().__init__(parent)
         self.column_names = column_names
+        # every row shows the same choices, so they share one model each
+        self._column_model = QtCore.QStringListModel(column_names, self)
+        self._operator_model = QtCore.QStringListModel(FilterRow.OPERATORS, self)
 
         self.main_layout = QtWidgets.QVBoxLayout(self)
         self.row_container = QtWidgets.QVBoxLayout()
@@ -88,26 +118,58 @@ class FilterBar(QtWidgets.QWidget):
 
         self.main_layout.addLayout(add_button_layout)
 
+        # edits to a row restart this timer, so a burst of typing emits
+        # filters_updated once
+        self._emit_timer = QtCore.QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(120)
+        self._emit_timer.timeout.connect(self.filters_updated)
+
         self.filter_rows = []
+        # rows with a non-empty input value, kept up to date as the user types
+        self._non_empty_rows: set[FilterRow] = set()
+        # result of get_filters, dropped whenever a row changes or is removed
+        self._filters_cache: list[dict] | None = None
         self.add_filter_row()  # Always start with one empty row
 
     def add_filter_row(self) -> None:
         """Add a new row for filtering a column to this widget"""
-        row = FilterRow(self.column_names, self)
+        row = FilterRow(
+            self.column_names,
+            self,
+            column_model=self._column_model,
+            operator_model=self._operator_model,
+        )
         self.filter_rows.append(row)
         self.row_container.addWidget(row)
 
-        row.filter_changed.connect(self.filters_updated.emit)
+        row.filter_changed.connect(lambda row=row: self._on_row_changed(row))
         row.filter_removed.connect(self.remove_filter_row)
         self.filters_updated.emit()
 
     def remove_filter_row(self, row: FilterRow) -> None:
         """Remove an existing row from this widget"""
         self.filter_rows.remove(row)
+        self._non_empty_rows.discard(row)
+        self._filters_cache = None
         self.row_container.removeWidget(row)
         row.deleteLater()
         self.filters_updated.emit()
 
     def get_filters(self) -> list[dict]:
         """Return all active filters"""
-        return [row.get_filter() for row in self.filter_rows if row.input_value.text()]
+        if self._filters_cache is None:
+            self._filters_cache = [
+                row.get_filter() for row in self.filter_rows if row in self._non_empty_rows
+            ]
+        # callers hold on to the result, so hand out a copy of the cached list
+        return list(self._filters_cache)
+
+    def _on_row_changed(self, row: FilterRow) -> None:
+        """Record whether the changed row has a value, then schedule a notification"""
+        if row.input_value.text():
+            self._non_empty_rows.add(row)
+        else:
+            self._non_empty_rows.discard(row)
+        self._filters_cache = None
+        self._emit_timer.start()
@@ -37,15 +37,19 @@ class SquirrelTableGridDelegate(QtWidgets.QStyledItemDelegate):
     """Styled Item Delegate for showing the horizontal grid lines in a
     table view. To be used by the SquirrelTableView class.
     """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Built once and reused for every painted cell
+        self._grid_pen = QtGui.QPen(QtGui.QColor(squirrel.color.TABLE_GRID))
+
     def paint(self, painter, option, index):
         # Draw the default item
         super().paint(painter, option, index)
 
-        # Construct the QPen for the grid lines
-        grid_color = QtGui.QColor(squirrel.color.TABLE_GRID)
-        border_pen = QtGui.QPen(grid_color)
-        painter.setPen(border_pen)
+        painter.setPen(self._grid_pen)
 
         # Draw the top & bottom borders
-        painter.drawLine(option.rect.topLeft(), option.rect.topRight())
-        painter.drawLine(option.rect.bottomLeft(), option.rect.bottomRight())
+        rect = option.rect
+        left, right = rect.left(), rect.right()
+        painter.drawLine(left, rect.top(), right, rect.top())
+        painter.drawLine(left, rect.bottom(), right, rect.bottom())
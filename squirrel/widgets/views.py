@@ -5,10 +5,13 @@ Qt tree model and item classes for visualizing Entry dataclasses
 from __future__ import annotations
 
 import logging
+import queue
 import time
+from datetime import datetime
 from enum import Enum, IntEnum, auto
-from functools import partial
-from typing import Any, Callable, ClassVar, Dict, List, Optional, Union
+from functools import lru_cache, partial
+from typing import (Any, Callable, ClassVar, Dict, List, Optional, Sequence,
+                    Union)
 from uuid import UUID
 
 import numpy as np
@@ -21,6 +24,37 @@ from squirrel.widgets import QtSingleton, get_window
 logger = logging.getLogger(__name__)
 
 Entry = Union[PV, Snapshot]
+# for isinstance checks, Union only supports them on newer Pythons
+_ENTRY_TYPES = (PV, Snapshot)
+
+_SENTINEL = object()
+# queued to a _HydrationThread to drop its fetched entries
+_CLEAR_CACHE = object()
+_NUMERIC_TYPES = (int, float)
+
+
+def _compute_mismatch(
+    stored: np.ndarray,
+    live: np.ndarray,
+    rtol: float = 1e-05,
+    atol: float = 1e-08,
+) -> np.ndarray:
+    """
+    Return a mask of where ``live`` and ``stored`` differ.  Equivalent to
+    ``~np.isclose(live, stored, rtol, atol)`` for real-valued arrays, but works
+    in a single scratch buffer instead of allocating a temporary per step.
+    """
+    diff = np.subtract(live, stored)
+    np.abs(diff, out=diff)
+    tol = np.abs(stored)
+    tol *= rtol
+    tol += atol
+    close = diff <= tol
+    # an infinite tolerance says nothing, infinities are only close if equal
+    close &= np.isfinite(stored)
+    close |= live == stored
+    np.logical_not(close, out=close)
+    return close
 
 
 def add_open_page_to_menu(
@@ -50,7 +84,7 @@ class DiffDispatcher(QtCore.QObject, metaclass=QtSingleton):
 
     def select_for_compare(self, entry: Entry) -> None:
         """Adds ``entry`` for comparison"""
-        if not isinstance(entry, Entry):
+        if not isinstance(entry, _ENTRY_TYPES):
             return
 
         self.l_entry = entry
@@ -76,8 +110,8 @@ def add_comparison_actions_to_menu(menu: QtWidgets.QMenu, entry: Entry) -> None:
     """
     ddisp = DiffDispatcher()
     # add select item (to L if both are none, to R otherwise)
-    selected_uuids = [e.uuid for e in (ddisp.l_entry, ddisp.r_entry)
-                      if isinstance(e, Entry)]
+    selected_uuids = {e.uuid for e in (ddisp.l_entry, ddisp.r_entry)
+                      if isinstance(e, _ENTRY_TYPES)}
     if entry.uuid in selected_uuids:
         # add a dummy action
         menu.addAction("(Entry already selected for comparison)")
@@ -172,12 +206,12 @@ class BaseTableEntryModel(QtCore.QAbstractTableModel):
     def set_entries(self, entries: List[Entry]):
         """
         Set the entries for this table.  Subclasses will need to override
-        in order to encapsulate all logic between `layoutAboutToBeChanged` and
-        `layoutChanged` signals.  (super().set_entries should not be called)
+        in order to encapsulate all logic between `beginResetModel` and
+        `endResetModel`.  (super().set_entries should not be called)
         """
-        self.layoutAboutToBeChanged.emit()
+        self.beginResetModel()
         self.entries = entries
-        self.layoutChanged.emit()
+        self.endResetModel()
 
     def headerData(
         self,
@@ -214,7 +248,6 @@ class BaseTableEntryModel(QtCore.QAbstractTableModel):
             # only set values on entries with the field
             return True
 
-        self.layoutAboutToBeChanged.emit()
         try:
             setattr(entry, header_field, value)
             success = True
@@ -223,8 +256,7 @@ class BaseTableEntryModel(QtCore.QAbstractTableModel):
                          f"({index.row()}, {index.column()}): {exc}")
             success = False
 
-        self.layoutChanged.emit()
-        self.dataChanged.emit(index, index)
+        self.dataChanged.emit(index, index, [role])
         return success
 
     def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlag:
@@ -251,24 +283,28 @@ class BaseTableEntryModel(QtCore.QAbstractTableModel):
             return QtCore.Qt.ItemIsEnabled
 
     def add_entry(self, entry: Entry) -> None:
-        if entry in self.entries or not isinstance(entry, Entry):
+        if entry in self.entries or not isinstance(entry, _ENTRY_TYPES):
             return
 
-        self.layoutAboutToBeChanged.emit()
-        self.entries.append[entry]
-        self.layoutChanged.emit()
+        row = len(self.entries)
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self.entries.append(entry)
+        self.endInsertRows()
 
     def remove_row(self, row_index: int) -> None:
         self.remove_entry(self.entries[row_index])
 
     def remove_entry(self, entry: Entry) -> None:
-        self.layoutAboutToBeChanged.emit()
         try:
-            self.entries.remove(entry)
+            row = self.entries.index(entry)
         except ValueError:
             logger.debug(f"Entry of type ({type(entry).__name__})"
                          "not found in table, could not remove.")
-        self.layoutChanged.emit()
+            return
+
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        del self.entries[row]
+        self.endRemoveRows()
 
 
 class DisplayType(Enum):
@@ -292,12 +328,39 @@ class LivePVHeader(HeaderEnum):
     REMOVE = auto()
 
 
+# Plain int columns for the hot paths of LivePVTableModel, avoiding IntEnum
+# comparisons on every data() call
+_COL_PV_NAME = LivePVHeader.PV_NAME.value
+_COL_STORED_VALUE = LivePVHeader.STORED_VALUE.value
+_COL_LIVE_SEVERITY = LivePVHeader.LIVE_SEVERITY.value
+# Columns whose DisplayRole text is derived from the stored entry alone, and is
+# worth caching between repaints
+_RENDER_CACHE_COLUMNS = frozenset((
+    LivePVHeader.STORED_VALUE.value, LivePVHeader.TIMESTAMP.value,
+    LivePVHeader.STORED_STATUS.value, LivePVHeader.STORED_SEVERITY.value,
+))
+
+
+@lru_cache(maxsize=1024)
+def _format_timestamp(timestamp: datetime) -> str:
+    """Format an entry creation time for display, reused across repaints"""
+    return timestamp.strftime('%Y/%m/%d %H:%M')
+
+
+# Roles answered by columns other than the PV name
+_DATA_ROLES = frozenset((
+    QtCore.Qt.DisplayRole, QtCore.Qt.EditRole, QtCore.Qt.BackgroundRole,
+    CustRoles.DisplayTypeRole, CustRoles.EpicsDataRole,
+))
+
+
 class LivePVTableModel(BaseTableEntryModel):
     # Takes PV-entries
     # shows live details (current PV status, severity)
     # shows setpoints (can be blank)
     headers: List[str]
     _data_cache: Dict[str, EpicsData]
+    _addr_to_row: Dict[str, List[int]]
     _poll_thread: Optional[_PVPollThread]
     _button_cols: List[LivePVHeader] = [LivePVHeader.OPEN, LivePVHeader.REMOVE]
     _header_to_field: Dict[LivePVHeader, str] = {
@@ -306,6 +369,15 @@ class LivePVTableModel(BaseTableEntryModel):
         LivePVHeader.STORED_STATUS: 'status',
         LivePVHeader.STORED_SEVERITY: 'severity',
     }
+    # shared return values for data(), built once rather than per call
+    _RED: ClassVar[QtGui.QColor] = QtGui.QColor(255, 0, 0)
+    # PySide6 has no QVariant, None is converted to an invalid QVariant
+    _INVALID: ClassVar[None] = None
+    # roles that can change when live data arrives.  The stored value column
+    # also depends on live data, for enum strings and the edit delegate
+    _LIVE_ROLES: ClassVar[List[int]] = [
+        QtCore.Qt.DisplayRole, QtCore.Qt.BackgroundRole, CustRoles.EpicsDataRole,
+    ]
 
     def __init__(
         self,
@@ -323,10 +395,43 @@ class LivePVTableModel(BaseTableEntryModel):
         self._editable_cols[LivePVHeader.OPEN] = True
         self._editable_cols[LivePVHeader.REMOVE] = True
 
+        # data() handlers, indexed by LivePVHeader column
+        self._column_dispatch = (
+            self._data_pv_name,
+            self._data_stored_value,
+            self._data_live_value,
+            self._data_timestamp,
+            self._data_stored_status,
+            self._data_live_status,
+            self._data_stored_severity,
+            self._data_live_severity,
+            self._data_open,
+            self._data_remove,
+        )
+
         self.client = client
         self.poll_period = poll_period
-        self._data_cache = {e.setpoint: None for e in entries if e.setpoint} | {e.readback: None for e in entries if e.readback}
         self._poll_thread = None
+        # rows with new live data, signaled together once control returns to
+        # the event loop
+        self._dirty_rows: set[int] = set()
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(0)
+        self._flush_timer.timeout.connect(self._flush_dirty)
+        self._reset_address_caches()
+        self._hydration_thread = None
+        self._hydrating: set[UUID] = set()
+
+        # row -> (entry, {column: display text}) for _RENDER_CACHE_COLUMNS.
+        # Holds at most one item per row, and is dropped for a row whenever it
+        # changes or holds a different entry
+        self._render_cache: Dict[int, tuple[PV, Dict[int, Any]]] = {}
+        self.dataChanged.connect(self._invalidate_render_rows)
+        self.layoutChanged.connect(self._clear_render_cache)
+        self.modelReset.connect(self._clear_render_cache)
+        self.rowsInserted.connect(self._clear_render_cache)
+        self.rowsRemoved.connect(self._clear_render_cache)
 
         self.start_polling()
 
@@ -385,42 +490,169 @@ class LivePVTableModel(BaseTableEntryModel):
         if self._poll_thread is not None:
             self._poll_thread.data_changed.connect(self._data_changed)
 
-    @QtCore.Slot(str)
-    def _data_changed(self, address: str) -> None:
+    @QtCore.Slot(list)
+    def _data_changed(self, addresses: list[str]) -> None:
         """
-        Slot: data changed for the given attribute in the thread.
-        Signals the entire row to update (a single PV worth of data)
+        Slot: data changed for the given addresses during one poll cycle.
+        Marks every row holding one of the PVs as dirty, to be signaled on the
+        next pass of the event loop
         """
-        try:
-            row = list(self._data_cache).index(address)
-        except IndexError:
-            ...
-        else:
+        rows = {row for addr in addresses for row in self._addr_to_row.get(addr, ())}
+        if not rows:
+            return
+        self._update_mismatch(list(rows))
+        self._dirty_rows.update(rows)
+        self._flush_timer.start()
+
+    @QtCore.Slot()
+    def _flush_dirty(self) -> None:
+        """
+        Slot: signal all rows marked dirty since the last flush, with one
+        update per run of consecutive rows, limited to the columns and roles
+        that depend on live data.
+        """
+        rows = sorted(row for row in self._dirty_rows if row < len(self.entries))
+        self._dirty_rows.clear()
+        start = 0
+        for i in range(1, len(rows) + 1):
+            if i < len(rows) and rows[i] == rows[i - 1] + 1:
+                continue
             self.dataChanged.emit(
-                self.createIndex(row, 0),
-                self.createIndex(row, self.columnCount()),
+                self.createIndex(rows[start], _COL_STORED_VALUE),
+                self.createIndex(rows[i - 1], _COL_LIVE_SEVERITY),
+                self._LIVE_ROLES,
             )
+            start = i
+
+    @QtCore.Slot()
+    def _clear_render_cache(self) -> None:
+        """Slot: drop all cached cell data"""
+        self._render_cache.clear()
+
+    def _invalidate_render_rows(
+        self,
+        top_left: QtCore.QModelIndex,
+        bottom_right: QtCore.QModelIndex,
+        roles: Optional[List[int]] = None,
+    ) -> None:
+        """Slot: drop cached cell data for the rows covered by a dataChanged"""
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            self._render_cache.pop(row, None)
+
+    def _reset_address_caches(self) -> None:
+        """
+        Rebuild the data cache and address map from the current entries.
+        Entries still held as UUIDs are added as they are hydrated.
+        """
+        self._data_cache = {}
+        self._dirty_rows.clear()
+        for entry in self.entries:
+            if isinstance(entry, UUID):
+                continue
+            if entry.setpoint:
+                self._data_cache[entry.setpoint] = None
+            if entry.readback:
+                self._data_cache[entry.readback] = None
+        if self._poll_thread is not None:
+            self._poll_thread.data = self._data_cache
+        self._build_addr_to_row()
+        self._update_stored_data()
+        self._update_mismatch()
+
+    def _data_cache_keys_changed(self) -> None:
+        """Let the polling thread know addresses were added to the data cache"""
+        if self._poll_thread is not None:
+            self._poll_thread.data_version += 1
+
+    def _build_addr_to_row(self) -> None:
+        """Map the setpoint and readback addresses of each entry to its row"""
+        self._addr_to_row = {}
+        for row, entry in enumerate(self.entries):
+            if isinstance(entry, UUID):
+                continue
+            self._map_addresses(entry, row)
+
+    def _map_addresses(self, entry: PV, row: int) -> None:
+        """
+        Add ``row`` to the address map under the setpoint and readback of
+        ``entry``.  Several entries may share an address, each of their rows is
+        kept.
+        """
+        for address in (entry.setpoint, entry.readback):
+            if not address:
+                continue
+            rows = self._addr_to_row.setdefault(address, [])
+            if row not in rows:
+                rows.append(row)
 
     def set_entries(self, entries: list[PV]) -> None:
         """Set the entries for this table, reset data cache"""
-        self.layoutAboutToBeChanged.emit()
+        self.beginResetModel()
         self.entries = entries
-        self._data_cache = {e.setpoint: None for e in entries if e.setpoint} | {e.readback: None for e in entries if e.readback}
-        # self._poll_thread.data = self._data_cache
-        self.dataChanged.emit(
-            self.createIndex(0, 0),
-            self.createIndex(self.rowCount(), self.columnCount()),
-        )
-        self.layoutChanged.emit()
+        if self._hydration_thread is not None:
+            self._hydration_thread.clear_cache()
+        self._reset_address_caches()
+        self.endResetModel()
+
+    def add_entry(self, entry: PV) -> None:
+        """Add ``entry`` to the table model, fetching its live data"""
+        if entry in self.entries or not isinstance(entry, _ENTRY_TYPES):
+            return
+
+        row = len(self.entries)
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self.entries.append(entry)
+        for address in (entry.setpoint, entry.readback):
+            if address:
+                self._data_cache.setdefault(address, None)
+        self._map_addresses(entry, row)
+        self._data_cache_keys_changed()
+        self._update_stored_data()
+        self._update_mismatch()
+        self.endInsertRows()
 
     def remove_entry(self, entry: PV) -> None:
         """Remove ``entry`` from the table model"""
-        super().remove_entry(entry)
-        self.layoutAboutToBeChanged.emit()
-        self._data_cache.pop(entry.setpoint, None)
-        self._data_cache.pop(entry.readback, None)
-        self._poll_thread.data = self._data_cache
-        self.layoutChanged.emit()
+        try:
+            row = self.entries.index(entry)
+        except ValueError:
+            logger.debug(f"Entry of type ({type(entry).__name__})"
+                         "not found in table, could not remove.")
+            return
+
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        del self.entries[row]
+        # row numbers have shifted, views refresh the remaining rows anyway
+        self._dirty_rows.clear()
+        self._build_addr_to_row()
+        for address in (entry.setpoint, entry.readback):
+            # other entries may still read the same address
+            if address not in self._addr_to_row:
+                self._data_cache.pop(address, None)
+        self._update_stored_data()
+        self._update_mismatch()
+        if self._poll_thread is not None:
+            self._poll_thread.data = self._data_cache
+        self.endRemoveRows()
+
+    def setData(self, index: QtCore.QModelIndex, value: Any, role: int) -> bool:
+        """Set data, keeping the address map and comparison arrays current"""
+        success = super().setData(index, value, role)
+        row = index.row()
+        entry = self.entries[row]
+        if isinstance(entry, UUID):
+            return success
+
+        if index.column() == _COL_PV_NAME:
+            self._build_addr_to_row()
+            if entry.setpoint and entry.setpoint not in self._data_cache:
+                self._data_cache[entry.setpoint] = None
+                self._data_cache_keys_changed()
+        self._update_stored_data([row])
+        self._update_mismatch([row])
+        # drop anything rendered while the arrays were out of date
+        self._render_cache.pop(row, None)
+        return success
 
     def index_from_item(
         self,
@@ -471,72 +703,100 @@ class LivePVTableModel(BaseTableEntryModel):
         Any
             the requested data
         """
+        col = index.column()
+        if role != QtCore.Qt.DisplayRole or col not in _RENDER_CACHE_COLUMNS:
+            return self._uncached_data(index, role)
+
+        row = index.row()
+        entry = self.entries[row]
+        if isinstance(entry, UUID):
+            return self._uncached_data(index, role)
+        cached = self._render_cache.get(row)
+        if cached is None or cached[0] is not entry:
+            cached = self._render_cache[row] = (entry, {})
+        value = cached[1].get(col, _SENTINEL)
+        if value is _SENTINEL:
+            value = cached[1][col] = self._uncached_data(index, role)
+        return value
+
+    def _uncached_data(self, index: QtCore.QModelIndex, role: int) -> Any:
+        """Compute the data for ``index`` and ``role``, see ``data``"""
         entry: PV = self.entries[index.row()]
         if isinstance(entry, UUID):
-            entry = self.client.backend.get_entry(self.entries[index.row()])
-            self.entries[index.row()] = entry
-
-        if index.column() == LivePVHeader.PV_NAME:
-            if role == QtCore.Qt.DecorationRole:
-                return self.icon(entry)
-            elif role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
-                name_text = getattr(entry, 'setpoint')
-                return name_text
-            elif role == CustRoles.DisplayTypeRole:
-                return DisplayType.PV_NAME
-
-        if role not in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole,
-                        QtCore.Qt.BackgroundRole, CustRoles.DisplayTypeRole,
-                        CustRoles.EpicsDataRole):
+            # Fetched off the GUI thread, the row updates once it arrives
+            self._request_hydration(index.row(), entry)
+            if role == QtCore.Qt.DisplayRole:
+                return "loading..."
+            return self._INVALID
+
+        col = index.column()
+        if col != _COL_PV_NAME and role not in _DATA_ROLES:
             # Other parts of the table are read only
-            return QtCore.QVariant()
+            return self._INVALID
+
+        return self._column_dispatch[col](entry, role)
+
+    def _data_pv_name(self, entry: PV, role: int) -> Any:
+        if role == QtCore.Qt.DecorationRole:
+            return self.icon(entry)
+        elif role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
+            name_text = getattr(entry, 'setpoint')
+            return name_text
+        elif role == CustRoles.DisplayTypeRole:
+            return DisplayType.PV_NAME
+        return self._INVALID
+
+    def _data_stored_value(self, entry: PV, role: int) -> Any:
+        if role == CustRoles.DisplayTypeRole:
+            return DisplayType.EPICS_DATA
+        cache_data = self.get_cache_data(entry.setpoint)
+        if role == CustRoles.EpicsDataRole:
+            return cache_data
+
+        stored_data = getattr(entry, 'data', None)
+        if stored_data is None:
+            return '--'
+        # do some enum data handling
+        if isinstance(cache_data, EpicsData):
+            if cache_data.enums and isinstance(stored_data, int):
+                return cache_data.enums[stored_data]
+        return stored_data
+
+    def _data_live_value(self, entry: PV, role: int) -> Any:
+        live_value = self._get_live_data_field(entry, 'data')
+        if role == QtCore.Qt.BackgroundRole:
+            stored_data = getattr(entry, 'data', None)
+            is_close = self.is_close(entry, stored_data)
+            if stored_data is not None and not is_close:
+                return self._RED
+        return str(live_value)
 
-        if index.column() == LivePVHeader.STORED_VALUE:
-            if role == CustRoles.DisplayTypeRole:
-                return DisplayType.EPICS_DATA
-            cache_data = self.get_cache_data(entry.setpoint)
-            if role == CustRoles.EpicsDataRole:
-                return cache_data
+    def _data_timestamp(self, entry: PV, role: int) -> Any:
+        return _format_timestamp(entry.creation_time)
 
-            stored_data = getattr(entry, 'data', None)
-            if stored_data is None:
-                return '--'
-            # do some enum data handling
-            if isinstance(cache_data, EpicsData):
-                if cache_data.enums and isinstance(stored_data, int):
-                    return cache_data.enums[stored_data]
-            return stored_data
-        elif index.column() == LivePVHeader.LIVE_VALUE:
-            live_value = self._get_live_data_field(entry, 'data')
-            if role == QtCore.Qt.BackgroundRole:
-                stored_data = getattr(entry, 'data', None)
-                is_close = self.is_close(entry, stored_data)
-                if stored_data is not None and not is_close:
-                    return QtGui.QColor('red')
-            return str(live_value)
-        elif index.column() == LivePVHeader.TIMESTAMP:
-            return entry.creation_time.strftime('%Y/%m/%d %H:%M')
-        elif index.column() == LivePVHeader.STORED_STATUS:
-            if role == CustRoles.DisplayTypeRole:
-                return DisplayType.STATUS
-            status = getattr(entry, 'status', '--')
-            return getattr(status, 'name', status)
-        elif index.column() == LivePVHeader.LIVE_STATUS:
-            return self._get_live_data_field(entry, 'status')
-        elif index.column() == LivePVHeader.STORED_SEVERITY:
-            if role == CustRoles.DisplayTypeRole:
-                return DisplayType.SEVERITY
-            severity = getattr(entry, 'severity', '--')
-            return getattr(severity, 'name', severity)
-        elif index.column() == LivePVHeader.LIVE_SEVERITY:
-            return self._get_live_data_field(entry, 'severity')
-        elif index.column() == LivePVHeader.OPEN:
-            return "Open"
-        elif index.column() == LivePVHeader.REMOVE:
-            return "Remove"
-
-        # if nothing is found, return invalid QVariant
-        return QtCore.QVariant()
+    def _data_stored_status(self, entry: PV, role: int) -> Any:
+        if role == CustRoles.DisplayTypeRole:
+            return DisplayType.STATUS
+        status = getattr(entry, 'status', '--')
+        return getattr(status, 'name', status)
+
+    def _data_live_status(self, entry: PV, role: int) -> Any:
+        return self._get_live_data_field(entry, 'status')
+
+    def _data_stored_severity(self, entry: PV, role: int) -> Any:
+        if role == CustRoles.DisplayTypeRole:
+            return DisplayType.SEVERITY
+        severity = getattr(entry, 'severity', '--')
+        return getattr(severity, 'name', severity)
+
+    def _data_live_severity(self, entry: PV, role: int) -> Any:
+        return self._get_live_data_field(entry, 'severity')
+
+    def _data_open(self, entry: PV, role: int) -> Any:
+        return "Open"
+
+    def _data_remove(self, entry: PV, role: int) -> Any:
+        return "Remove"
 
     def _get_live_data_field(self, entry: PV, field: str) -> Any:
         """
@@ -567,11 +827,74 @@ class LivePVTableModel(BaseTableEntryModel):
         else:
             return data_field
 
+    def _update_stored_data(self, rows: Optional[List[int]] = None) -> None:
+        """
+        Refresh the stored value column arrays for ``rows``.  If ``rows`` is not
+        provided, every per-row array is reallocated to match the current entries.
+        Stored values that are not plain numbers are held as NaN and flagged as
+        non-numeric.
+        """
+        if rows is None:
+            n_rows = len(self.entries)
+            stored = [getattr(entry, 'data', None) for entry in self.entries]
+            self._stored_numeric = np.fromiter(
+                (type(data) in _NUMERIC_TYPES for data in stored), dtype=bool, count=n_rows
+            )
+            self._stored_data = np.fromiter(
+                (data if numeric else np.nan for data, numeric in zip(stored, self._stored_numeric)),
+                dtype=float, count=n_rows,
+            )
+            self._live_data = np.full(n_rows, np.nan)
+            self._live_numeric = np.zeros(n_rows, dtype=bool)
+            self._mismatch = np.zeros(n_rows, dtype=bool)
+            self._comparable = np.zeros(n_rows, dtype=bool)
+            return
+
+        for row in rows:
+            data = getattr(self.entries[row], 'data', None)
+            numeric = type(data) in _NUMERIC_TYPES
+            self._stored_numeric[row] = numeric
+            self._stored_data[row] = data if numeric else np.nan
+
+    def _update_mismatch(self, rows: Optional[List[int]] = None) -> None:
+        """
+        Copy live values for ``rows``, or for every row if not provided, into the
+        live column arrays and recompute whether stored and live data differ with
+        a single vectorized comparison.  Only rows where both values are plain
+        numbers are marked comparable; the rest are left to the scalar path in
+        ``is_close``.
+        """
+        for row in range(len(self.entries)) if rows is None else rows:
+            entry = self.entries[row]
+            live_data = None if isinstance(entry, UUID) else self._data_cache.get(entry.setpoint)
+            numeric = (
+                isinstance(live_data, EpicsData)
+                and not live_data.enums
+                and type(live_data.data) in _NUMERIC_TYPES
+            )
+            self._live_numeric[row] = numeric
+            self._live_data[row] = live_data.data if numeric else np.nan
+
+        rows = slice(None) if rows is None else rows
+        self._comparable[rows] = self._stored_numeric[rows] & self._live_numeric[rows]
+        self._mismatch[rows] = _compute_mismatch(self._stored_data[rows], self._live_data[rows])
+
     def is_close(self, entry: PV, data: Any) -> bool:
         """
-        Determines if ``data`` is close to the value in the controls system at
-        ``entry``.  Returns True if the values are close, False otherwise.
+        Determines if ``data``, the stored data of ``entry``, is close to the value
+        in the controls system at ``entry``.  Returns True if the values are
+        close, False otherwise.  The comparison made when live data arrived is
+        reused only if ``data`` is the value stored for ``entry``'s row.
         """
+        for row in self._addr_to_row.get(entry.setpoint, ()):
+            if (
+                self.entries[row] is entry
+                and self._comparable[row]
+                and type(data) in _NUMERIC_TYPES
+                and data == self._stored_data[row]
+            ):
+                return not self._mismatch[row]
+
         e_data = self.get_cache_data(entry.setpoint)
         if not isinstance(e_data, EpicsData):
             # data still fetching, don't compare
@@ -595,27 +918,77 @@ class LivePVTableModel(BaseTableEntryModel):
         Get data from cache if possible.  If missing from cache, add address for
         the polling thread to update.
         """
-        data = self._data_cache.get(address, None)
+        n_addresses = len(self._data_cache)
+        data = self._data_cache.setdefault(address, None)
 
         if data is None:
-            if address not in self._data_cache:
-                self._data_cache[address] = None
+            if len(self._data_cache) != n_addresses:
+                self._data_cache_keys_changed()
 
             # TODO: A neat spinny icon maybe?
             return "fetching..."
-        else:
-            return data
+        return data
+
+    def _request_hydration(self, row: int, uuid: UUID) -> None:
+        """Queue ``uuid`` at ``row`` to be fetched by the hydration thread"""
+        if uuid in self._hydrating:
+            return
+        self._hydrating.add(uuid)
+
+        if self._hydration_thread is None:
+            self._hydration_thread = _HydrationThread(client=self.client, parent=self)
+            self._hydration_thread.hydrated.connect(self._entry_hydrated)
+            self._hydration_thread.start()
+        self._hydration_thread.request(row, uuid)
+
+    @QtCore.Slot(int, object, object)
+    def _entry_hydrated(self, row: int, uuid: UUID, entry: PV) -> None:
+        """Slot: the hydration thread fetched ``entry``, last seen at ``row``"""
+        self._hydrating.discard(uuid)
+        if row >= len(self.entries) or self.entries[row] != uuid:
+            # entries changed while fetching
+            try:
+                row = self.entries.index(uuid)
+            except ValueError:
+                return
+
+        self.entries[row] = entry
+        for address in (entry.setpoint, entry.readback):
+            if address:
+                self._data_cache.setdefault(address, None)
+        self._map_addresses(entry, row)
+        self._data_cache_keys_changed()
+        self._update_stored_data([row])
+        self._update_mismatch([row])
+        self.dataChanged.emit(
+            self.createIndex(row, 0),
+            self.createIndex(row, self.columnCount() - 1),
+        )
+
+    def stop_threads(self) -> None:
+        """
+        Ask the polling and hydration threads to stop without waiting for them.
+        Lets several models be stopped together before each is closed.
+        """
+        self.stop_polling()
+        if self._hydration_thread is not None:
+            self._hydration_thread.stop()
 
     def close(self) -> None:
         logger.debug("Stopping pv_model polling")
-        self.stop_polling(wait_time=5000)
+        self.stop_threads()
+        if self._poll_thread is not None:
+            self._poll_thread.wait(5000)
+        if self._hydration_thread is not None:
+            self._hydration_thread.wait(5000)
 
 
 class _PVPollThread(QtCore.QThread):
     """
     Polling thread for LivePVTableModel
 
-    Emits ``data_changed(pv: str)`` when a pv has new data
+    Emits ``data_changed(pvs: list[str])`` once per poll cycle, listing the pvs
+    that received new data during that cycle
     Parameters
     ----------
     client : squirrel.client.Client
@@ -633,11 +1006,12 @@ class _PVPollThread(QtCore.QThread):
         The parent widget.
     """
     data_ready: ClassVar[QtCore.Signal] = QtCore.Signal()
-    data_changed: ClassVar[QtCore.Signal] = QtCore.Signal(str)
+    data_changed: ClassVar[QtCore.Signal] = QtCore.Signal(list)
     running: bool
 
-    data: Dict[str, EpicsData]
     poll_period: float
+    # addresses fetched per request, the running flag is checked between them
+    batch_size: ClassVar[int] = 256
 
     def __init__(
         self,
@@ -648,31 +1022,64 @@ class _PVPollThread(QtCore.QThread):
         parent: Optional[QtWidgets.QWidget] = None
     ):
         super().__init__(parent=parent)
+        # Incremented whenever the addresses in self.data change
+        self.data_version = 0
+        self._addrs = ()
+        self._addrs_version = -1
         self.data = data
         self.poll_period = poll_period
         self.client = client
         self.running = False
         self._attrs = set()
+        self._dirty: list[str] = []
+        # wakes the thread from its wait between polls when stopped
+        self._mutex = QtCore.QMutex()
+        self._wait = QtCore.QWaitCondition()
+
+    @property
+    def data(self) -> Dict[str, EpicsData]:
+        """Per-PV EpicsData, keyed by the addresses being polled"""
+        return self._data
+
+    @data.setter
+    def data(self, data: Dict[str, EpicsData]) -> None:
+        self._data = data
+        self.data_version += 1
 
     def stop(self) -> None:
-        """Stop the polling thread."""
+        """Stop the polling thread, interrupting any wait between polls."""
+        self._mutex.lock()
         self.running = False
+        self._wait.wakeAll()
+        self._mutex.unlock()
 
-    def _update_data(self, address):
+    def _addresses(self) -> tuple[str, ...]:
         """
-        Update the internal data cache with new data from EPICS.
-        Emit self.data_changed signal if data has changed
+        Return the addresses to poll, only re-reading the keys of self.data
+        when they have changed since the last cycle
+        """
+        if self._addrs_version != self.data_version:
+            self._addrs_version = self.data_version
+            self._addrs = tuple(self.data)
+        return self._addrs
+
+    def _update_data(self, addresses: Sequence[str]) -> None:
+        """
+        Update the internal data cache with new data from EPICS, fetching all
+        ``addresses`` in a single request.
+        Mark each address as changed for this poll cycle if its data has changed
         """
         try:
-            val = self.client.cl.get(address)
+            values = self.client.cl.get(addresses)
         except Exception as e:
-            logger.warning(f'Unable to get data from {address}: {e}')
+            logger.warning(f'Unable to get data from {len(addresses)} PVs: {e}')
             return
 
-        # ControlLayer.get may return CommunicationError instead of raising
-        if not isinstance(val, Exception) and self.data[address] != val:
-            self.data_changed.emit(address)
-            self.data[address] = val
+        for address, val in zip(addresses, values):
+            # ControlLayer.get may return CommunicationError instead of raising
+            if not isinstance(val, Exception) and self.data.get(address) != val:
+                self.data[address] = val
+                self._dirty.append(address)
 
     def run(self):
         """The thread polling loop."""
@@ -680,20 +1087,96 @@ class _PVPollThread(QtCore.QThread):
 
         self.data_ready.emit()
 
+        update = self._update_data
+        batch_size = self.batch_size
         while self.running:
             t0 = time.monotonic()
-            for address in self.data:
-                self._update_data(address)
+            addresses = self._addresses()
+            for start in range(0, len(addresses), batch_size):
+                update(addresses[start:start + batch_size])
                 if not self.running:
                     break
-                time.sleep(0)
+
+            if self._dirty:
+                self.data_changed.emit(self._dirty)
+                self._dirty = []
 
             if self.poll_period <= 0.0:
                 # A zero or below means "single shot" updates.
                 break
 
             elapsed = time.monotonic() - t0
-            time.sleep(max((0, self.poll_period - elapsed)))
+            remaining_ms = int(max(0, self.poll_period - elapsed) * 1000)
+            self._mutex.lock()
+            if self.running:
+                self._wait.wait(self._mutex, remaining_ms)
+            self._mutex.unlock()
+
+
+class _HydrationThread(QtCore.QThread):
+    """
+    Thread fetching full entries from the backend for LivePVTableModel rows
+    that only hold a UUID
+
+    Emits ``hydrated(row: int, uuid: UUID, entry: PV)`` for each requested uuid
+    once it has been fetched.  Fetched entries are kept in an LRU cache until
+    the model's entries are replaced, so a uuid requested again while the same
+    entries are shown does not go back to the backend.  Duplicate requests for
+    a uuid that is still being fetched are dropped by the model before reaching
+    this thread.
+
+    Parameters
+    ----------
+    client : squirrel.client.Client
+        The client to fetch entries through
+
+    parent : QWidget, optional, keyword-only
+        The parent widget.
+    """
+    hydrated: ClassVar[QtCore.Signal] = QtCore.Signal(int, object, object)
+
+    def __init__(
+        self,
+        client: Client,
+        *,
+        parent: Optional[QtWidgets.QWidget] = None
+    ):
+        super().__init__(parent=parent)
+        self.client = client
+        self._requests: queue.Queue = queue.Queue()
+        # only called from this thread, so the cache needs no extra locking.
+        # Failed fetches raise and are not cached
+        self._get_entry = lru_cache(maxsize=4096)(client.backend.get_entry)
+
+    def request(self, row: int, uuid: UUID) -> None:
+        """Queue ``uuid``, displayed at ``row``, to be fetched"""
+        self._requests.put((row, uuid))
+
+    def clear_cache(self) -> None:
+        """Drop fetched entries once the pending requests are handled"""
+        self._requests.put(_CLEAR_CACHE)
+
+    def stop(self) -> None:
+        """Stop the thread once the pending requests are handled."""
+        self._requests.put(None)
+
+    def run(self):
+        """The thread request loop."""
+        while True:
+            request = self._requests.get()
+            if request is None:
+                break
+            if request is _CLEAR_CACHE:
+                self._get_entry.cache_clear()
+                continue
+
+            row, uuid = request
+            try:
+                entry = self._get_entry(uuid)
+            except Exception as e:
+                logger.warning(f'Unable to fetch entry {uuid}: {e}')
+                continue
+            self.hydrated.emit(row, uuid, entry)
 
 
 class ButtonDelegate(QtWidgets.QStyledItemDelegate):
@@ -725,8 +1208,40 @@ class ButtonDelegate(QtWidgets.QStyledItemDelegate):
 
 
 class ValueDelegate(QtWidgets.QStyledItemDelegate):
+    """
+    Edit delegate choosing an editor based on the DisplayTypeRole of a cell.
+
+    Editors that do not depend on the cell's live data (PV names, severities
+    and statuses) are kept in a pool when closed and handed out again, rather
+    than being rebuilt each time a cell is edited.  Their value is reset from
+    the cell in ``setEditorData``.
+    """
+    _pooled_types: ClassVar[tuple[DisplayType, ...]] = (
+        DisplayType.PV_NAME, DisplayType.SEVERITY, DisplayType.STATUS,
+    )
+    _severity_names: ClassVar[List[str]] = [sev.name for sev in Severity]
+    _status_names: ClassVar[List[str]] = [sta.name for sta in Status]
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self._editor_pool: Dict[DisplayType, List[QtWidgets.QWidget]] = {
+            dtype: [] for dtype in self._pooled_types
+        }
+        self._editor_types: Dict[QtWidgets.QWidget, DisplayType] = {}
+
+    def _pooled_editor(
+        self,
+        dtype: DisplayType,
+        parent: QtWidgets.QWidget,
+    ) -> Optional[QtWidgets.QWidget]:
+        """Take an editor of type ``dtype`` from the pool, if one is available"""
+        pool = self._editor_pool[dtype]
+        if not pool:
+            return None
+        widget = pool.pop()
+        if widget.parent() != parent:
+            widget.setParent(parent)
+        return widget
 
     def createEditor(
         self,
@@ -738,14 +1253,19 @@ class ValueDelegate(QtWidgets.QStyledItemDelegate):
             index, role=CustRoles.DisplayTypeRole
         )
         data_val = index.model().data(index, role=QtCore.Qt.DisplayRole)
+        if dtype in self._editor_pool:
+            widget = self._pooled_editor(dtype, parent)
+            if widget is not None:
+                return widget
+
         if dtype == DisplayType.PV_NAME:
-            widget = QtWidgets.QLineEdit(data_val, parent)
+            widget = QtWidgets.QLineEdit(parent)
         elif dtype == DisplayType.SEVERITY:
             widget = QtWidgets.QComboBox(parent)
-            widget.addItems([sev.name for sev in Severity])
+            widget.addItems(self._severity_names)
         elif dtype == DisplayType.STATUS:
             widget = QtWidgets.QComboBox(parent)
-            widget.addItems([sta.name for sta in Status])
+            widget.addItems(self._status_names)
         elif dtype == DisplayType.EPICS_DATA:
             # need to fetch data for this PV, not stored data
             data_val: EpicsData = index.model().data(
@@ -759,8 +1279,52 @@ class ValueDelegate(QtWidgets.QStyledItemDelegate):
             logger.debug(f"datatype ({dtype}) incompatible with supported edit "
                          f"widgets: ({data_val})")
             return
+
+        if dtype in self._editor_pool:
+            self._editor_types[widget] = dtype
+            # pooled editors are deleted along with their parent
+            widget.destroyed.connect(lambda *_, widget=widget: self._forget_editor(widget))
         return widget
 
+    def _forget_editor(self, editor: QtWidgets.QWidget) -> None:
+        """Drop every reference to a pooled editor that has been deleted"""
+        dtype = self._editor_types.pop(editor, None)
+        if dtype is None:
+            return
+        try:
+            self._editor_pool[dtype].remove(editor)
+        except ValueError:
+            pass
+
+    def setEditorData(
+        self,
+        editor: QtWidgets.QWidget,
+        index: QtCore.QModelIndex
+    ) -> None:
+        """Fill pooled editors from the cell, they may hold a previous value"""
+        dtype = self._editor_types.get(editor)
+        if dtype is None:
+            return super().setEditorData(editor, index)
+
+        data_val = index.data(QtCore.Qt.DisplayRole)
+        if dtype == DisplayType.PV_NAME:
+            editor.setText(data_val or "")
+        else:
+            # stored values without a status or severity start at the first item
+            editor.setCurrentIndex(max(editor.findText(str(data_val)), 0))
+
+    def destroyEditor(
+        self,
+        editor: QtWidgets.QWidget,
+        index: QtCore.QModelIndex
+    ) -> None:
+        """Return pooled editors to the pool, destroy the rest"""
+        dtype = self._editor_types.get(editor)
+        if dtype is None:
+            return super().destroyEditor(editor, index)
+        editor.hide()
+        self._editor_pool[dtype].append(editor)
+
     def setModelData(
         self,
         editor: QtWidgets.QWidget,
@@ -8,7 +8,6 @@ import logging
 from functools import partial
 from typing import Optional
 
-import qtawesome as qta
 from epicscorelibs.ca.cadef import CAException
 from qtpy import QtCore, QtGui, QtWidgets
 from qtpy.QtGui import QCloseEvent
@@ -18,6 +17,7 @@ from squirrel.model import PV, EpicsData, Snapshot
 from squirrel.pages import (Page, PVBrowserPage, SnapshotComparisonPage,
                             SnapshotDetailsPage, TagPage)
 from squirrel.permission_manager import PermissionManager
+from squirrel.qt_helpers import cached_icon
 from squirrel.tables import (PVTableModel, SnapshotFilterModel,
                              SnapshotTableModel)
 from squirrel.widgets import NameDescTagsWidget, QtSingleton, SquirrelTableView
@@ -38,15 +38,14 @@ class Window(QtWidgets.QMainWindow, metaclass=QtSingleton):
 
     def __init__(self, *args, client: Optional[Client] = None, **kwargs):
         super().__init__(*args, **kwargs)
+        self.pages: set[Page] = set()
+        self.permission_manager = PermissionManager.get_instance()
         if client:
             self.client = client
         else:
             self.client = Client.from_config()
-        self.pages: set[Page] = set()
         self.setup_ui()
 
-        self.permission_manager = PermissionManager.get_instance()
-
     def setup_ui(self) -> None:
         self.navigation_panel = self.init_nav_panel()
 
@@ -54,13 +53,13 @@ class Window(QtWidgets.QMainWindow, metaclass=QtSingleton):
         self.view_snapshot_page = self.init_view_snapshot_page()
         self.snapshot_details_page = self.init_snapshot_details_page()
         self.comparison_page = self.init_comparison_page()
-        self.pv_browser_page = self.init_pv_browser_page()
+        # built on first use, see the pv_browser_page property
+        self._pv_browser_page: Optional[PVBrowserPage] = None
         self.configure_page = self.init_configure_page()
 
         self.pages.add(self.view_snapshot_page)
         self.pages.add(self.snapshot_details_page)
         self.pages.add(self.comparison_page)
-        self.pages.add(self.pv_browser_page)
         self.pages.add(self.configure_page)
 
         self.main_content_stack = QtWidgets.QStackedLayout()
@@ -110,13 +109,13 @@ class Window(QtWidgets.QMainWindow, metaclass=QtSingleton):
         search_bar = QtWidgets.QLineEdit()
         search_bar.setClearButtonEnabled(True)
         search_bar.addAction(
-            qta.icon("fa5s.search"),
+            cached_icon("fa5s.search"),
             QtWidgets.QLineEdit.TrailingPosition,
         )
         search_bar.setPlaceholderText("Search title...")
         filters_layout.addWidget(search_bar)
 
-        filter_toggle_button = QtWidgets.QPushButton(qta.icon("fa5s.filter"), "Filter  ")
+        filter_toggle_button = QtWidgets.QPushButton(cached_icon("fa5s.filter"), "Filter  ")
         filter_toggle_button.setLayoutDirection(QtCore.Qt.RightToLeft)  # Put the filter icon after the button text
         filter_toggle_button.setToolTip("Show/hide meta pv filters")
         filter_toggle_button.clicked.connect(self.toggle_filter_popup)
@@ -142,13 +141,25 @@ class Window(QtWidgets.QMainWindow, metaclass=QtSingleton):
         )
         self.snapshot_table.setSelectionBehavior(self.snapshot_table.SelectionBehavior.SelectRows)
         self.snapshot_table.verticalHeader().hide()
+        # every row has the same height, so rows are never measured
+        self.snapshot_table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
         header_view = self.snapshot_table.horizontalHeader()
         header_view.setSectionResizeMode(header_view.ResizeMode.Fixed)
         header_view.setSectionResizeMode(1, header_view.ResizeMode.Stretch)
+        # size columns from a sample of rows rather than measuring every
+        # snapshot.  Column width sampling is bounded by the vertical header
+        self.snapshot_table.verticalHeader().setResizeContentsPrecision(100)
         self.snapshot_table.resizeColumnsToContents()
         view_snapshot_layout.addWidget(self.snapshot_table)
 
-        search_bar.textEdited.connect(proxy_model.setFilterFixedString)
+        # filter once typing pauses rather than for every keystroke
+        self._snapshot_search_timer = QtCore.QTimer(self)
+        self._snapshot_search_timer.setSingleShot(True)
+        self._snapshot_search_timer.setInterval(200)
+        self._snapshot_search_timer.timeout.connect(
+            lambda: proxy_model.setFilterFixedString(search_bar.text())
+        )
+        search_bar.textEdited.connect(lambda _: self._snapshot_search_timer.start())
         date_range.rangeChanged.connect(proxy_model.setDateRange)
 
         # Set up the filters for the meta pv columns
@@ -197,6 +208,18 @@ class Window(QtWidgets.QMainWindow, metaclass=QtSingleton):
         pv_browser_page.sigAddPV.connect(self.open_new_pv_dialog)
         return pv_browser_page
 
+    @property
+    def pv_browser_page(self) -> PVBrowserPage:
+        """
+        The PV browser page, built and added to the content stack on first
+        access so sessions that never browse PVs do not pay for it
+        """
+        if self._pv_browser_page is None:
+            self._pv_browser_page = self.init_pv_browser_page()
+            self.pages.add(self._pv_browser_page)
+            self.main_content_stack.addWidget(self._pv_browser_page)
+        return self._pv_browser_page
+
     def init_configure_page(self) -> QtWidgets.QWidget:
         """Initialize the configure page with the tag groups window."""
         configure_page = QtWidgets.QWidget()
@@ -471,7 +494,7 @@ class NavigationPanel(QtWidgets.QWidget):
         self.expanded = True
 
         self.view_snapshots_button = QtWidgets.QPushButton()
-        self.view_snapshots_button.setIcon(qta.icon("ph.stack"))
+        self.view_snapshots_button.setIcon(cached_icon("ph.stack"))
         self.view_snapshots_button.setIconSize(QtCore.QSize(24, 24))
         self.view_snapshots_button.setText("View Snapshots")
         self.view_snapshots_button.setFlat(True)
@@ -482,7 +505,7 @@ class NavigationPanel(QtWidgets.QWidget):
         self.layout().addWidget(self.view_snapshots_button)
 
         self.browse_pvs_button = QtWidgets.QPushButton()
-        self.browse_pvs_button.setIcon(qta.icon("ph.database"))
+        self.browse_pvs_button.setIcon(cached_icon("ph.database"))
         self.browse_pvs_button.setIconSize(QtCore.QSize(24, 24))
         self.browse_pvs_button.setText("Browse PVs")
         self.browse_pvs_button.setFlat(True)
@@ -493,7 +516,7 @@ class NavigationPanel(QtWidgets.QWidget):
         self.layout().addWidget(self.browse_pvs_button)
 
         self.configure_tags_button = QtWidgets.QPushButton()
-        self.configure_tags_button.setIcon(qta.icon("ph.tag"))
+        self.configure_tags_button.setIcon(cached_icon("ph.tag"))
         self.configure_tags_button.setIconSize(QtCore.QSize(24, 24))
         self.configure_tags_button.setText("Configure Tags")
         self.configure_tags_button.setFlat(True)
@@ -509,7 +532,7 @@ class NavigationPanel(QtWidgets.QWidget):
 
         self.toggle_and_bug_layout = QtWidgets.QHBoxLayout()
         self.toggle_expand_button = QtWidgets.QPushButton()
-        self.toggle_expand_button.setIcon(qta.icon("ph.arrow-line-left"))
+        self.toggle_expand_button.setIcon(cached_icon("ph.arrow-line-left"))
         self.toggle_expand_button.setIconSize(QtCore.QSize(24, 24))
         self.toggle_expand_button.setFlat(True)
         self.toggle_expand_button.setProperty("icon-only", False)
@@ -521,7 +544,7 @@ class NavigationPanel(QtWidgets.QWidget):
         self.layout().addLayout(self.toggle_and_bug_layout)
 
         self.bug_report_button = QtWidgets.QPushButton()
-        self.bug_report_button.setIcon(qta.icon("ph.bug"))
+        self.bug_report_button.setIcon(cached_icon("ph.bug"))
         self.bug_report_button.setIconSize(QtCore.QSize(20, 20))
         self.bug_report_button.setFlat(True)
         self.bug_report_button.setProperty("icon-only", False)
@@ -530,7 +553,7 @@ class NavigationPanel(QtWidgets.QWidget):
         self.toggle_and_bug_layout.addWidget(self.bug_report_button)
 
         self.save_button = QtWidgets.QPushButton()
-        self.save_button.setIcon(qta.icon("ph.instagram-logo"))
+        self.save_button.setIcon(cached_icon("ph.instagram-logo"))
         self.save_button.setIconSize(QtCore.QSize(24, 24))
         self.save_button.setText("Save Snapshot")
         self.save_button.setProperty("icon-only", False)
@@ -559,7 +582,7 @@ class NavigationPanel(QtWidgets.QWidget):
             if self.expanded:
                 self.toggle_and_bug_layout.setDirection(QtWidgets.QBoxLayout.LeftToRight)
                 self.toggle_and_bug_layout.addWidget(self.bug_report_button)
-                self.toggle_expand_button.setIcon(qta.icon("ph.arrow-line-left"))
+                self.toggle_expand_button.setIcon(cached_icon("ph.arrow-line-left"))
                 self.view_snapshots_button.setText("View Snapshots")
                 self.browse_pvs_button.setText("Browse PVs")
                 self.configure_tags_button.setText("Configure Tags")
@@ -570,7 +593,7 @@ class NavigationPanel(QtWidgets.QWidget):
             else:
                 self.toggle_and_bug_layout.setDirection(QtWidgets.QBoxLayout.BottomToTop)
                 self.toggle_and_bug_layout.insertWidget(1, self.bug_report_button, alignment=QtCore.Qt.AlignCenter)
-                self.toggle_expand_button.setIcon(qta.icon("ph.arrow-line-right"))
+                self.toggle_expand_button.setIcon(cached_icon("ph.arrow-line-right"))
                 for button in self.nav_buttons:
                     button.setText("")
                     button.setProperty("icon-only", True)